@@ -0,0 +1,117 @@
+"""
+This module contains the benchmark corpus - deterministic set of sample strings, that imitates the datetime columns of
+heterogeneous CSV files and log lines.
+
+"""
+import datetime
+import random
+from typing import List
+
+COLUMN_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%y %I:%M %p",
+    "%d.%m.%Y",
+    "%b %d, %Y",
+    "%A, %B %d %Y",
+    "%H:%M:%S.%f",
+    "%d-%b-%Y %H:%M UTC",
+    "%a, %d %b %Y %H:%M:%S GMT",
+    "[%d/%b/%Y:%H:%M:%S +0000] GET /index.html HTTP/1.1",
+    "%Y-%m-%d %H:%M:%S,%f INFO worker started",
+]
+
+# Representative inputs of the single encoding, grouped by their kind.
+SAMPLES = {
+    "short_time": ["7:20 PM", "17:20", "19:19:19.100000", "9AM"],
+    "full_date": [
+        "2023-11-21 07:20:50",
+        "Day: Sunday, 2022-Nov-30, 9:30 PM",
+        "March 11th 2023 9:30 PM",
+        "21.11.2023",
+    ],
+    "free_text": [
+        "(22:13), today is tuesday, 18 Mar 2021, and the report was generated by the nightly job",
+        "[24/Dec/2019:00:10:04 +0000] GET /index.html HTTP/1.1 200 512 referrer unknown agent curl",
+        "worker 17 started at 2023-11-21 07:20:50,123456 INFO after 3 retries on node 42",
+    ],
+    "timezone": [
+        "Mon, 10 Dec 2018 09:42:09 GMT",
+        "09-Jun-2020 13:58 UTC",
+        "7:20 PM PST",
+        "2023-11-21 07:20 CEST",
+    ],
+}
+
+# Inputs with long runs of the same signs, which the regular expressions may backtrack over.
+LONG_RUNS = ["1" * 2000, "a" * 2000 + " pm", "12:" * 600, "1" * 1000 + "-1-1"]
+
+# Lines of the logs, most of them without any timestamp.
+LOG_LINES = [
+    "Nov 21 07:20:11 host sshd[1234]: Accepted password for root from 10.0.0.1 port 22",
+    '127.0.0.1 - - [21/Nov/2023:07:20:11 +0000] "GET /index.html HTTP/1.1" 200 612',
+    "2023-11-21 07:20:11,123 INFO root: started 3 workers",
+    'GET /index.html HTTP/1.1 200 612 "Mozilla/5.0 (X11; Linux x86_64)" 0.005',
+    "user admin logged out of session abcdef",
+    "worker 12 finished job 3456 in 0.25s",
+    "  at org.example.Worker.run(Worker.java:128)",
+    "Traceback (most recent call last):",
+]
+
+
+def keystrokes(text: str) -> List[str]:
+    """
+    Function responsible for imitating the user, who types the text, and then corrects each of its digits in place.
+
+    Parameters
+    ----------
+    text: `str`
+        Typed text.
+
+    Returns
+    -------
+    `List`[`str`]
+        Versions of the text after each keystroke.
+
+    """
+    versions = [text[:end] for end in range(1, len(text) + 1)]
+    for idx, sign in enumerate(text):
+        if sign.isdigit():
+            text = text[:idx] + str((int(sign) + 1) % 10) + text[idx + 1 :]
+            versions.append(text)
+    return versions
+
+
+def generate_corpus(size: int = 20000, seed: int = 0) -> List[str]:
+    """
+    Function responsible for generating the benchmark corpus. Samples are grouped in columns of a single format, with
+    timestamps increasing by a random step, as in a real data set.
+
+    Parameters
+    ----------
+    size: `int`, default 20000
+        Number of samples in the corpus.
+
+    seed: `int`, default 0
+        Seed of the random generator.
+
+    Returns
+    -------
+    `List`[`str`]
+        List of the sample strings.
+
+    """
+    rnd = random.Random(seed)
+    corpus = []
+    column_size = max(size // len(COLUMN_FORMATS), 1)
+    while len(corpus) < size:
+        fmt = COLUMN_FORMATS[len(corpus) // column_size % len(COLUMN_FORMATS)]
+        timestamp = datetime.datetime(rnd.randint(2000, 2030), 1, 1)
+        for _ in range(min(column_size, size - len(corpus))):
+            timestamp += datetime.timedelta(
+                seconds=rnd.choice([1, 60, 3600, 86400]) * rnd.randint(1, 10)
+            )
+            corpus.append(timestamp.strftime(fmt))
+
+    return corpus
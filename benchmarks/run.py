@@ -0,0 +1,461 @@
+"""
+This module contains the standalone benchmark runner of the hot paths of `Recognizer` and `StrfCodes`. Results are
+saved as JSON, so they can be compared between commits:
+
+    python -m benchmarks.run --output before.json
+    python -m benchmarks.run --output after.json --compare before.json
+
+"""
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import (
+    LOG_LINES,
+    LONG_RUNS,
+    SAMPLES,
+    generate_corpus,
+    keystrokes,
+)
+from strf_hint.parser import DatetimeParser
+from strf_hint.recognizer import EncodingContext, Recognizer
+from strf_hint.scanner import TimestampScanner
+from strf_hint.session import EncodingSession
+from strf_hint.stats import RecognizerStats
+from strf_hint.strf_codes import StrfCodes
+
+# Registered benchmarks. Each one prepares its data, and returns the measured function and the number of operations
+# performed by a single call of it.
+BENCHMARKS: Dict[str, Callable[[], Tuple[Callable[[], None], int]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """
+    Decorator registering the benchmark under the given name.
+
+    Parameters
+    ----------
+    name: `str`
+        Name of the benchmark.
+
+    Returns
+    -------
+    `Callable`
+        Decorator of the benchmark setup function.
+
+    """
+
+    def register(setup: Callable[[], Tuple[Callable[[], None], int]]) -> Callable:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _encode_samples(kind: str) -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer()
+    samples = SAMPLES[kind]
+    recognizer.encode_formats(samples)
+
+    def run() -> None:
+        for sample in samples:
+            recognizer.encode_format(sample)
+
+    return run, len(samples)
+
+
+for _kind in SAMPLES:
+    benchmark(f"encode_format.{_kind}")(lambda kind=_kind: _encode_samples(kind))
+
+
+@benchmark("encode_format.long_runs")
+def _encode_long_runs() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer()
+    recognizer.encode_formats(LONG_RUNS)
+
+    def run() -> None:
+        for sample in LONG_RUNS:
+            recognizer.encode_format(sample)
+
+    return run, len(LONG_RUNS)
+
+
+@benchmark("encode_format.instrumented")
+def _encode_instrumented() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer(stats=RecognizerStats())
+    samples = [sample for samples in SAMPLES.values() for sample in samples]
+    recognizer.encode_formats(samples)
+
+    def run() -> None:
+        for sample in samples:
+            recognizer.encode_format(sample)
+
+    return run, len(samples)
+
+
+@benchmark("match_patterns")
+def _match_patterns() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer()
+    samples = [sample for samples in SAMPLES.values() for sample in samples]
+    recognizer.encode_formats(samples)
+
+    def run() -> None:
+        for sample in samples:
+            recognizer._match_patterns(
+                sample, EncodingContext(bytearray(b"0" * len(sample)))
+            )
+
+    return run, len(samples)
+
+
+@benchmark("recognize_single_codes")
+def _recognize_single_codes() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer()
+    samples = [sample for samples in SAMPLES.values() for sample in samples]
+    recognizer.encode_formats(samples)
+
+    def run() -> None:
+        for sample in samples:
+            recognizer._recognize_single_codes(
+                sample, EncodingContext(bytearray(b"0" * len(sample)))
+            )
+
+    return run, len(samples)
+
+
+@benchmark("generate_format_regex.cold")
+def _generate_format_regex_cold() -> Tuple[Callable[[], None], int]:
+    formats = StrfCodes.DATE_COMMON_FORMATS + StrfCodes.TIME_COMMON_FORMATS
+
+    def run() -> None:
+        codes = StrfCodes()
+        for group in formats:
+            codes.generate_format_regex(group)
+
+    return run, len(formats)
+
+
+@benchmark("generate_format_regex.warm")
+def _generate_format_regex_warm() -> Tuple[Callable[[], None], int]:
+    formats = StrfCodes.DATE_COMMON_FORMATS + StrfCodes.TIME_COMMON_FORMATS
+    codes = StrfCodes()
+
+    def run() -> None:
+        for group in formats:
+            codes.generate_format_regex(group)
+
+    run()
+    return run, len(formats)
+
+
+@benchmark("common_formats.build")
+def _common_formats_build() -> Tuple[Callable[[], None], int]:
+    def run() -> None:
+        StrfCodes().common_formats
+
+    return run, 1
+
+
+@benchmark("encode_formats.batch")
+def _encode_formats_batch() -> Tuple[Callable[[], None], int]:
+    corpus = generate_corpus(5000)
+    recognizer = Recognizer()
+    recognizer.encode_format(corpus[0])
+
+    def run() -> None:
+        recognizer.encode_formats(corpus)
+
+    return run, len(corpus)
+
+
+@benchmark("encode_formats.loop")
+def _encode_formats_loop() -> Tuple[Callable[[], None], int]:
+    corpus = generate_corpus(5000)
+    recognizer = Recognizer()
+    recognizer.encode_format(corpus[0])
+
+    def run() -> None:
+        for sample in corpus:
+            recognizer.encode_format(sample)
+
+    return run, len(corpus)
+
+
+@benchmark("encode_formats.batch_shape_cache")
+def _encode_formats_batch_shape_cache() -> Tuple[Callable[[], None], int]:
+    corpus = generate_corpus(5000)
+
+    def run() -> None:
+        Recognizer(shape_cache_size=4096).encode_formats(corpus)
+
+    run()
+    return run, len(corpus)
+
+
+def _startup(code: str) -> Tuple[Callable[[], None], int]:
+    command = [sys.executable, "-c", code]
+
+    def run() -> None:
+        subprocess.run(command, check=True)
+
+    return run, 1
+
+
+@benchmark("startup.interpreter")
+def _startup_interpreter() -> Tuple[Callable[[], None], int]:
+    return _startup("pass")
+
+
+@benchmark("startup.import")
+def _startup_import() -> Tuple[Callable[[], None], int]:
+    return _startup("import strf_hint")
+
+
+@benchmark("startup.first_encode")
+def _startup_first_encode() -> Tuple[Callable[[], None], int]:
+    return _startup(
+        "from strf_hint import Recognizer; "
+        "Recognizer().encode_format('Mon, 10 Dec 2018 09:42:09 GMT')"
+    )
+
+
+PARSED_FORMAT = "%Y-%m-%d %H:%M:%S"
+PARSED = [f"2023-11-{day:02} 07:{day:02}:50" for day in range(1, 29)]
+
+
+@benchmark("parse.datetime_parser")
+def _parse_datetime_parser() -> Tuple[Callable[[], None], int]:
+    parse = DatetimeParser(PARSED_FORMAT).parse
+
+    def run() -> None:
+        for text in PARSED:
+            parse(text)
+
+    return run, len(PARSED)
+
+
+@benchmark("parse.strptime")
+def _parse_strptime() -> Tuple[Callable[[], None], int]:
+    def run() -> None:
+        for text in PARSED:
+            datetime.datetime.strptime(text, PARSED_FORMAT)
+
+    return run, len(PARSED)
+
+
+@benchmark("scan.timestamp_scanner")
+def _scan_timestamp_scanner() -> Tuple[Callable[[], None], int]:
+    scan = TimestampScanner().scan
+
+    def run() -> None:
+        for line in LOG_LINES:
+            scan(line)
+
+    return run, len(LOG_LINES)
+
+
+@benchmark("scan.encode_format")
+def _scan_encode_format() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer(shape_cache_size=4096)
+
+    def run() -> None:
+        for line in LOG_LINES:
+            recognizer.encode_format(line)
+
+    return run, len(LOG_LINES)
+
+
+# Inputs typed by the user, one list of versions per input.
+TYPED = [keystrokes(sample) for sample in SAMPLES["full_date"] + SAMPLES["timezone"]]
+
+
+@benchmark("session.update")
+def _session_update() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer()
+
+    def run() -> None:
+        for versions in TYPED:
+            session = EncodingSession(recognizer)
+            for text in versions:
+                session.update(text)
+
+    return run, sum(len(versions) for versions in TYPED)
+
+
+@benchmark("session.encode_format")
+def _session_encode_format() -> Tuple[Callable[[], None], int]:
+    recognizer = Recognizer()
+
+    def run() -> None:
+        for versions in TYPED:
+            for text in versions:
+                recognizer.encode_format(text)
+
+    return run, sum(len(versions) for versions in TYPED)
+
+
+def run_benchmarks(names: List[str], repeat: int, min_time: float) -> Dict[str, dict]:
+    """
+    Function responsible for running the benchmarks. Each measured function is called repeatedly for at least
+    `min_time` seconds, `repeat` times, and the time of a single operation is reported.
+
+    Parameters
+    ----------
+    names: `List`[`str`]
+        Names of the benchmarks to be run.
+
+    repeat: `int`
+        Number of measurements of each benchmark.
+
+    min_time: `float`
+        Minimal duration of a single measurement, in seconds.
+
+    Returns
+    -------
+    `Dict`[`str`, `dict`]
+        Results of the benchmarks: minimal, median and maximal time of a single operation, in microseconds.
+
+    """
+    results = {}
+    for name in names:
+        run, operations = BENCHMARKS[name]()
+        timings = []
+        for _ in range(repeat):
+            calls = 0
+            start = time.perf_counter()
+            while True:
+                run()
+                calls += 1
+                elapsed = time.perf_counter() - start
+                if elapsed >= min_time:
+                    break
+            timings.append(elapsed / (calls * operations) * 1e6)
+        results[name] = {
+            "min_us": min(timings),
+            "median_us": statistics.median(timings),
+            "max_us": max(timings),
+            "operations": operations,
+        }
+
+    return results
+
+
+def compare(old: Dict[str, dict], new: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    Function responsible for comparing two sets of results, by the minimal time of a single operation.
+
+    Parameters
+    ----------
+    old: `Dict`[`str`, `dict`]
+        Baseline results.
+
+    new: `Dict`[`str`, `dict`]
+        Compared results.
+
+    threshold: `float`
+        Relative slowdown, above which the benchmark is reported as a regression.
+
+    Returns
+    -------
+    `List`[`str`]
+        Names of the regressed benchmarks.
+
+    """
+    regressions = []
+    for name, result in new.items():
+        if name not in old:
+            continue
+        ratio = result["min_us"] / old[name]["min_us"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:40} {old[name]['min_us']:12.2f} us {result['min_us']:12.2f} us "
+            f"{ratio:8.2f}x{flag}"
+        )
+
+    return regressions
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the benchmark runner.
+
+    Parameters
+    ----------
+    argv: Optional[`List`[`str`]]
+        Command-line arguments. If not given, `sys.argv` is used.
+
+    Returns
+    -------
+    `int`
+        Exit code, 1 if any regression was found.
+
+    """
+    parser = argparse.ArgumentParser(description="Run the strf_hint benchmarks.")
+    parser.add_argument("names", nargs="*", help="benchmarks to run, all by default")
+    parser.add_argument(
+        "--output", help="path of the JSON file, the results are saved to"
+    )
+    parser.add_argument("--compare", help="path of the JSON file with baseline results")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimal duration of a measurement"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative slowdown of a regression"
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    results = run_benchmarks(args.names or list(BENCHMARKS), args.repeat, args.min_time)
+    for name, result in results.items():
+        print(
+            f"{name:40} {result['min_us']:12.2f} us (median {result['median_us']:.2f} us)"
+        )
+
+    report = {
+        "revision": _git_revision(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print(f"\nComparison with {baseline.get('revision')}:")
+        if compare(baseline["results"], results, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,12 @@ setup(
     name='strf_hint',
     version='0.10',
     description="Encrypt your own datetime format using strf codes",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/marataj/strf_hint",
     author="marataj",
-    license="MIT"
+    license="MIT",
+    extras_require={"columns": ["numpy", "pandas"]},
+    entry_points={"console_scripts": ["strf-hint=strf_hint.cli:main"]},
 )
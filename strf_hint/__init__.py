@@ -1 +1,22 @@
-from strf_hint.recognizer import Recognizer
+import importlib
+
+# public classes of the package, with the modules they come from; modules are imported on the first access
+_EXPORTS = {
+    "FormatInferrer": "strf_hint.inference",
+    "DatetimeParser": "strf_hint.parser",
+    "Recognizer": "strf_hint.recognizer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,5 @@
+import sys
+
+from strf_hint.cli import main
+
+sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+This module contains the tables derived from `StrfCodes`. Generated by `python -m strf_hint.build_tables`, do not edit.
+
+"""
+DIGEST = 'fc06b255a26293af21aeaf8d4835860aed7f88d2d5aecbf835cc95faf3cb927d'
+
+COMMON_FORMATS = [
+    ('%Y-%m-%d', '(\\d{3,4})-(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y\\.%m\\.%d', '(\\d{3,4})\\.(0[1-9]|1[0-2])\\.(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y/%m/%d', '(\\d{3,4})/(0[1-9]|1[0-2])/(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y,%m,%d', '(\\d{3,4}),(0[1-9]|1[0-2]),(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d-%m-%Y', '(0[1-9]|[1-2][0-9]|3[0-1])-(0[1-9]|1[0-2])-(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d\\.%m\\.%Y', '(0[1-9]|[1-2][0-9]|3[0-1])\\.(0[1-9]|1[0-2])\\.(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d/%m/%Y', '(0[1-9]|[1-2][0-9]|3[0-1])/(0[1-9]|1[0-2])/(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d,%m,%Y', '(0[1-9]|[1-2][0-9]|3[0-1]),(0[1-9]|1[0-2]),(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m-%d-%Y', '(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1])-(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m\\.%d\\.%Y', '(0[1-9]|1[0-2])\\.(0[1-9]|[1-2][0-9]|3[0-1])\\.(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m/%d/%Y', '(0[1-9]|1[0-2])/(0[1-9]|[1-2][0-9]|3[0-1])/(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m,%d,%Y', '(0[1-9]|1[0-2]),(0[1-9]|[1-2][0-9]|3[0-1]),(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y-%m-%-d', '(\\d{3,4})-(0[1-9]|1[0-2])-([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y\\.%m\\.%-d', '(\\d{3,4})\\.(0[1-9]|1[0-2])\\.([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y/%m/%-d', '(\\d{3,4})/(0[1-9]|1[0-2])/([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%Y,%m,%-d', '(\\d{3,4}),(0[1-9]|1[0-2]),([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d-%m-%Y', '([1-9]|[1-2][0-9]|[0-1])-(0[1-9]|1[0-2])-(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d\\.%m\\.%Y', '([1-9]|[1-2][0-9]|[0-1])\\.(0[1-9]|1[0-2])\\.(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d/%m/%Y', '([1-9]|[1-2][0-9]|[0-1])/(0[1-9]|1[0-2])/(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d,%m,%Y', '([1-9]|[1-2][0-9]|[0-1]),(0[1-9]|1[0-2]),(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m-%-d-%Y', '(0[1-9]|1[0-2])-([1-9]|[1-2][0-9]|[0-1])-(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m\\.%-d\\.%Y', '(0[1-9]|1[0-2])\\.([1-9]|[1-2][0-9]|[0-1])\\.(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m/%-d/%Y', '(0[1-9]|1[0-2])/([1-9]|[1-2][0-9]|[0-1])/(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m,%-d,%Y', '(0[1-9]|1[0-2]),([1-9]|[1-2][0-9]|[0-1]),(\\d{3,4})', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y-%m-%d', '(0\\d|\\d\\d)-(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y\\.%m\\.%d', '(0\\d|\\d\\d)\\.(0[1-9]|1[0-2])\\.(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y/%m/%d', '(0\\d|\\d\\d)/(0[1-9]|1[0-2])/(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y,%m,%d', '(0\\d|\\d\\d),(0[1-9]|1[0-2]),(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d-%m-%y', '(0[1-9]|[1-2][0-9]|3[0-1])-(0[1-9]|1[0-2])-(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d\\.%m\\.%y', '(0[1-9]|[1-2][0-9]|3[0-1])\\.(0[1-9]|1[0-2])\\.(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d/%m/%y', '(0[1-9]|[1-2][0-9]|3[0-1])/(0[1-9]|1[0-2])/(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%d,%m,%y', '(0[1-9]|[1-2][0-9]|3[0-1]),(0[1-9]|1[0-2]),(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m-%d-%y', '(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1])-(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m\\.%d\\.%y', '(0[1-9]|1[0-2])\\.(0[1-9]|[1-2][0-9]|3[0-1])\\.(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m/%d/%y', '(0[1-9]|1[0-2])/(0[1-9]|[1-2][0-9]|3[0-1])/(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m,%d,%y', '(0[1-9]|1[0-2]),(0[1-9]|[1-2][0-9]|3[0-1]),(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y-%m-%-d', '(0\\d|\\d\\d)-(0[1-9]|1[0-2])-([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y\\.%m\\.%-d', '(0\\d|\\d\\d)\\.(0[1-9]|1[0-2])\\.([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y/%m/%-d', '(0\\d|\\d\\d)/(0[1-9]|1[0-2])/([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%y,%m,%-d', '(0\\d|\\d\\d),(0[1-9]|1[0-2]),([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NUM', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d-%m-%y', '([1-9]|[1-2][0-9]|[0-1])-(0[1-9]|1[0-2])-(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d\\.%m\\.%y', '([1-9]|[1-2][0-9]|[0-1])\\.(0[1-9]|1[0-2])\\.(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d/%m/%y', '([1-9]|[1-2][0-9]|[0-1])/(0[1-9]|1[0-2])/(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-d,%m,%y', '([1-9]|[1-2][0-9]|[0-1]),(0[1-9]|1[0-2]),(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m-%-d-%y', '(0[1-9]|1[0-2])-([1-9]|[1-2][0-9]|[0-1])-(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m\\.%-d\\.%y', '(0[1-9]|1[0-2])\\.([1-9]|[1-2][0-9]|[0-1])\\.(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m/%-d/%y', '(0[1-9]|1[0-2])/([1-9]|[1-2][0-9]|[0-1])/(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%m,%-d,%y', '(0[1-9]|1[0-2]),([1-9]|[1-2][0-9]|[0-1]),(0\\d|\\d\\d)', ['MONTH_NUM', 'MONTHDAY_NUM', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%B %d, %Y', '(january|february|march|april|may|jun|july|august|september|october|november|december) (0[1-9]|[1-2][0-9]|3[0-1]), (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ,', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+[-./,]\\ \\d+'),
+    ('%B %-d, %Y', '(january|february|march|april|may|jun|july|august|september|october|november|december) ([1-9]|[1-2][0-9]|[0-1]), (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ,', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+[-./,]\\ \\d+'),
+    ('%B %d %Y', '(january|february|march|april|may|jun|july|august|september|october|november|december) (0[1-9]|[1-2][0-9]|3[0-1]) (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+\\ \\d+'),
+    ('%B %-d %Y', '(january|february|march|april|may|jun|july|august|september|october|november|december) ([1-9]|[1-2][0-9]|[0-1]) (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+\\ \\d+'),
+    ('%B-%d-%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december)-(0[1-9]|[1-2][0-9]|3[0-1])-(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B\\.%d\\.%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(0[1-9]|[1-2][0-9]|3[0-1])\\.(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B/%d/%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december)/(0[1-9]|[1-2][0-9]|3[0-1])/(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B,%d,%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december),(0[1-9]|[1-2][0-9]|3[0-1]),(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%d-%B-%Y', '(0[1-9]|[1-2][0-9]|3[0-1])-(january|february|march|april|may|jun|july|august|september|october|november|december)-(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d\\.%B\\.%Y', '(0[1-9]|[1-2][0-9]|3[0-1])\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d/%B/%Y', '(0[1-9]|[1-2][0-9]|3[0-1])/(january|february|march|april|may|jun|july|august|september|october|november|december)/(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d,%B,%Y', '(0[1-9]|[1-2][0-9]|3[0-1]),(january|february|march|april|may|jun|july|august|september|october|november|december),(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y-%B-%d', '(\\d{3,4})-(january|february|march|april|may|jun|july|august|september|october|november|december)-(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y\\.%B\\.%d', '(\\d{3,4})\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y/%B/%d', '(\\d{3,4})/(january|february|march|april|may|jun|july|august|september|october|november|december)/(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y,%B,%d', '(\\d{3,4}),(january|february|march|april|may|jun|july|august|september|october|november|december),(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%B-%-d-%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december)-([1-9]|[1-2][0-9]|[0-1])-(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B\\.%-d\\.%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december)\\.([1-9]|[1-2][0-9]|[0-1])\\.(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B/%-d/%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december)/([1-9]|[1-2][0-9]|[0-1])/(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B,%-d,%Y', '(january|february|march|april|may|jun|july|august|september|october|november|december),([1-9]|[1-2][0-9]|[0-1]),(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%-d-%B-%Y', '([1-9]|[1-2][0-9]|[0-1])-(january|february|march|april|may|jun|july|august|september|october|november|december)-(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d\\.%B\\.%Y', '([1-9]|[1-2][0-9]|[0-1])\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d/%B/%Y', '([1-9]|[1-2][0-9]|[0-1])/(january|february|march|april|may|jun|july|august|september|october|november|december)/(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d,%B,%Y', '([1-9]|[1-2][0-9]|[0-1]),(january|february|march|april|may|jun|july|august|september|october|november|december),(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y-%B-%-d', '(\\d{3,4})-(january|february|march|april|may|jun|july|august|september|october|november|december)-([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y\\.%B\\.%-d', '(\\d{3,4})\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y/%B/%-d', '(\\d{3,4})/(january|february|march|april|may|jun|july|august|september|october|november|december)/([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y,%B,%-d', '(\\d{3,4}),(january|february|march|april|may|jun|july|august|september|october|november|december),([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%B-%d-%y', '(january|february|march|april|may|jun|july|august|september|october|november|december)-(0[1-9]|[1-2][0-9]|3[0-1])-(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B\\.%d\\.%y', '(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(0[1-9]|[1-2][0-9]|3[0-1])\\.(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B/%d/%y', '(january|february|march|april|may|jun|july|august|september|october|november|december)/(0[1-9]|[1-2][0-9]|3[0-1])/(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B,%d,%y', '(january|february|march|april|may|jun|july|august|september|october|november|december),(0[1-9]|[1-2][0-9]|3[0-1]),(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%d-%B-%y', '(0[1-9]|[1-2][0-9]|3[0-1])-(january|february|march|april|may|jun|july|august|september|october|november|december)-(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d\\.%B\\.%y', '(0[1-9]|[1-2][0-9]|3[0-1])\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d/%B/%y', '(0[1-9]|[1-2][0-9]|3[0-1])/(january|february|march|april|may|jun|july|august|september|october|november|december)/(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d,%B,%y', '(0[1-9]|[1-2][0-9]|3[0-1]),(january|february|march|april|may|jun|july|august|september|october|november|december),(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y-%B-%d', '(0\\d|\\d\\d)-(january|february|march|april|may|jun|july|august|september|october|november|december)-(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y\\.%B\\.%d', '(0\\d|\\d\\d)\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y/%B/%d', '(0\\d|\\d\\d)/(january|february|march|april|may|jun|july|august|september|october|november|december)/(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y,%B,%d', '(0\\d|\\d\\d),(january|february|march|april|may|jun|july|august|september|october|november|december),(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%B-%-d-%y', '(january|february|march|april|may|jun|july|august|september|october|november|december)-([1-9]|[1-2][0-9]|[0-1])-(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B\\.%-d\\.%y', '(january|february|march|april|may|jun|july|august|september|october|november|december)\\.([1-9]|[1-2][0-9]|[0-1])\\.(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B/%-d/%y', '(january|february|march|april|may|jun|july|august|september|october|november|december)/([1-9]|[1-2][0-9]|[0-1])/(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%B,%-d,%y', '(january|february|march|april|may|jun|july|august|september|october|november|december),([1-9]|[1-2][0-9]|[0-1]),(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%-d-%B-%y', '([1-9]|[1-2][0-9]|[0-1])-(january|february|march|april|may|jun|july|august|september|october|november|december)-(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d\\.%B\\.%y', '([1-9]|[1-2][0-9]|[0-1])\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d/%B/%y', '([1-9]|[1-2][0-9]|[0-1])/(january|february|march|april|may|jun|july|august|september|october|november|december)/(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d,%B,%y', '([1-9]|[1-2][0-9]|[0-1]),(january|february|march|april|may|jun|july|august|september|october|november|december),(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y-%B-%-d', '(0\\d|\\d\\d)-(january|february|march|april|may|jun|july|august|september|october|november|december)-([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y\\.%B\\.%-d', '(0\\d|\\d\\d)\\.(january|february|march|april|may|jun|july|august|september|october|november|december)\\.([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y/%B/%-d', '(0\\d|\\d\\d)/(january|february|march|april|may|jun|july|august|september|october|november|december)/([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y,%B,%-d', '(0\\d|\\d\\d),(january|february|march|april|may|jun|july|august|september|october|november|december),([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%b %d, %Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec) (0[1-9]|[1-2][0-9]|3[0-1]), (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ,', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+[-./,]\\ \\d+'),
+    ('%b %-d, %Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec) ([1-9]|[1-2][0-9]|[0-1]), (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ,', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+[-./,]\\ \\d+'),
+    ('%b %d %Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec) (0[1-9]|[1-2][0-9]|3[0-1]) (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+\\ \\d+'),
+    ('%b %-d %Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec) ([1-9]|[1-2][0-9]|[0-1]) (\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ' ', '[a-z](?<![a-z][a-z])[a-z]*\\ \\d+\\ \\d+'),
+    ('%b-%d-%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(0[1-9]|[1-2][0-9]|3[0-1])-(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b\\.%d\\.%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(0[1-9]|[1-2][0-9]|3[0-1])\\.(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b/%d/%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(0[1-9]|[1-2][0-9]|3[0-1])/(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b,%d,%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(0[1-9]|[1-2][0-9]|3[0-1]),(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%d-%b-%Y', '(0[1-9]|[1-2][0-9]|3[0-1])-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d\\.%b\\.%Y', '(0[1-9]|[1-2][0-9]|3[0-1])\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d/%b/%Y', '(0[1-9]|[1-2][0-9]|3[0-1])/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d,%b,%Y', '(0[1-9]|[1-2][0-9]|3[0-1]),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y-%b-%d', '(\\d{3,4})-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y\\.%b\\.%d', '(\\d{3,4})\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y/%b/%d', '(\\d{3,4})/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y,%b,%d', '(\\d{3,4}),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%b-%-d-%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-([1-9]|[1-2][0-9]|[0-1])-(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b\\.%-d\\.%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.([1-9]|[1-2][0-9]|[0-1])\\.(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b/%-d/%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/([1-9]|[1-2][0-9]|[0-1])/(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b,%-d,%Y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),([1-9]|[1-2][0-9]|[0-1]),(\\d{3,4})', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%-d-%b-%Y', '([1-9]|[1-2][0-9]|[0-1])-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d\\.%b\\.%Y', '([1-9]|[1-2][0-9]|[0-1])\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d/%b/%Y', '([1-9]|[1-2][0-9]|[0-1])/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d,%b,%Y', '([1-9]|[1-2][0-9]|[0-1]),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(\\d{3,4})', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y-%b-%-d', '(\\d{3,4})-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y\\.%b\\.%-d', '(\\d{3,4})\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y/%b/%-d', '(\\d{3,4})/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%Y,%b,%-d', '(\\d{3,4}),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%b-%d-%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(0[1-9]|[1-2][0-9]|3[0-1])-(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b\\.%d\\.%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(0[1-9]|[1-2][0-9]|3[0-1])\\.(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b/%d/%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(0[1-9]|[1-2][0-9]|3[0-1])/(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b,%d,%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(0[1-9]|[1-2][0-9]|3[0-1]),(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%d-%b-%y', '(0[1-9]|[1-2][0-9]|3[0-1])-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d\\.%b\\.%y', '(0[1-9]|[1-2][0-9]|3[0-1])\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d/%b/%y', '(0[1-9]|[1-2][0-9]|3[0-1])/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%d,%b,%y', '(0[1-9]|[1-2][0-9]|3[0-1]),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y-%b-%d', '(0\\d|\\d\\d)-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y\\.%b\\.%d', '(0\\d|\\d\\d)\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y/%b/%d', '(0\\d|\\d\\d)/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y,%b,%d', '(0\\d|\\d\\d),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(0[1-9]|[1-2][0-9]|3[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%b-%-d-%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-([1-9]|[1-2][0-9]|[0-1])-(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '-', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b\\.%-d\\.%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.([1-9]|[1-2][0-9]|[0-1])\\.(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '.', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b/%-d/%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/([1-9]|[1-2][0-9]|[0-1])/(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], '/', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%b,%-d,%y', '(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),([1-9]|[1-2][0-9]|[0-1]),(0\\d|\\d\\d)', ['MONTH_NAME', 'MONTHDAY_NUM', 'YEAR'], ',', '[a-z](?<![a-z][a-z])[a-z]*[-./,]\\d+[-./,]\\d+'),
+    ('%-d-%b-%y', '([1-9]|[1-2][0-9]|[0-1])-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d\\.%b\\.%y', '([1-9]|[1-2][0-9]|[0-1])\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d/%b/%y', '([1-9]|[1-2][0-9]|[0-1])/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%-d,%b,%y', '([1-9]|[1-2][0-9]|[0-1]),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),(0\\d|\\d\\d)', ['MONTHDAY_NUM', 'MONTH_NAME', 'YEAR'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y-%b-%-d', '(0\\d|\\d\\d)-(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '-', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y\\.%b\\.%-d', '(0\\d|\\d\\d)\\.(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\.([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '.', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y/%b/%-d', '(0\\d|\\d\\d)/(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], '/', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%y,%b,%-d', '(0\\d|\\d\\d),(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),([1-9]|[1-2][0-9]|[0-1])', ['YEAR', 'MONTH_NAME', 'MONTHDAY_NUM'], ',', '\\d(?<!\\d\\d)\\d*[-./,][a-z]+[-./,]\\d+'),
+    ('%I:%M:%S %p', '(0[0-9]|1[0-2]):(0[0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+\\ [a-z]+'),
+    ('%I\\.%M\\.%S %p', '(0[0-9]|1[0-2])\\.(0[0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+\\ [a-z]+'),
+    ('%-I:%M:%S %p', '([0-9]|1[0-2]):(0[0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+\\ [a-z]+'),
+    ('%-I\\.%M\\.%S %p', '([0-9]|1[0-2])\\.(0[0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+\\ [a-z]+'),
+    ('%I:%-M:%S %p', '(0[0-9]|1[0-2]):([0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+\\ [a-z]+'),
+    ('%I\\.%-M\\.%S %p', '(0[0-9]|1[0-2])\\.([0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+\\ [a-z]+'),
+    ('%-I:%-M:%S %p', '([0-9]|1[0-2]):([0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+\\ [a-z]+'),
+    ('%-I\\.%-M\\.%S %p', '([0-9]|1[0-2])\\.([0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+\\ [a-z]+'),
+    ('%I:%M:%S%p', '(0[0-9]|1[0-2]):(0[0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+[a-z]+'),
+    ('%I\\.%M\\.%S%p', '(0[0-9]|1[0-2])\\.(0[0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+[a-z]+'),
+    ('%-I:%M:%S%p', '([0-9]|1[0-2]):(0[0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+[a-z]+'),
+    ('%-I\\.%M\\.%S%p', '([0-9]|1[0-2])\\.(0[0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+[a-z]+'),
+    ('%I:%-M:%S%p', '(0[0-9]|1[0-2]):([0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+[a-z]+'),
+    ('%I\\.%-M\\.%S%p', '(0[0-9]|1[0-2])\\.([0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+[a-z]+'),
+    ('%-I:%-M:%S%p', '([0-9]|1[0-2]):([0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+[a-z]+'),
+    ('%-I\\.%-M\\.%S%p', '([0-9]|1[0-2])\\.([0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])(am|pm)', ['HOURS', 'MINUTES', 'SECONDS', 'AM_PM'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+[a-z]+'),
+    ('%H:%M:%S', '(0[0-9]|1[0-9]|2[0-4]):(0[0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+'),
+    ('%H\\.%M\\.%S', '(0[0-9]|1[0-9]|2[0-4])\\.(0[0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-H:%M:%S', '([0-9]|1[0-9]|2[0-4]):(0[0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+'),
+    ('%-H\\.%M\\.%S', '([0-9]|1[0-9]|2[0-4])\\.(0[0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%H:%-M:%S', '(0[0-9]|1[0-9]|2[0-4]):([0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+'),
+    ('%H\\.%-M\\.%S', '(0[0-9]|1[0-9]|2[0-4])\\.([0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-H:%-M:%S', '([0-9]|1[0-9]|2[0-4]):([0-9]|[1-5][0-9]):(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], ':', '\\d(?<!\\d\\d)\\d*:\\d+:\\d+'),
+    ('%-H\\.%-M\\.%S', '([0-9]|1[0-9]|2[0-4])\\.([0-9]|[1-5][0-9])\\.(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES', 'SECONDS'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+[-./,]\\d+'),
+    ('%-I:%M %p', '([0-9]|1[0-2]):(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+\\ [a-z]+'),
+    ('%-I\\.%M %p', '([0-9]|1[0-2])\\.(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+\\ [a-z]+'),
+    ('%I:%M %p', '(0[0-9]|1[0-2]):(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+\\ [a-z]+'),
+    ('%I\\.%M %p', '(0[0-9]|1[0-2])\\.(0[0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+\\ [a-z]+'),
+    ('%-I:%-M %p', '([0-9]|1[0-2]):([0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+\\ [a-z]+'),
+    ('%-I\\.%-M %p', '([0-9]|1[0-2])\\.([0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+\\ [a-z]+'),
+    ('%I:%-M %p', '(0[0-9]|1[0-2]):([0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' :', '\\d(?<!\\d\\d)\\d*:\\d+\\ [a-z]+'),
+    ('%I\\.%-M %p', '(0[0-9]|1[0-2])\\.([0-9]|[1-5][0-9]) (am|pm)', ['HOURS', 'MINUTES', 'AM_PM'], ' .', '\\d(?<!\\d\\d)\\d*[-./,]\\d+\\ [a-z]+'),
+    ('%H:%M', '(0[0-9]|1[0-9]|2[0-4]):(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], ':', '\\d(?<!\\d\\d)\\d*:\\d+'),
+    ('%H\\.%M', '(0[0-9]|1[0-9]|2[0-4])\\.(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+'),
+    ('%-H:%M', '([0-9]|1[0-9]|2[0-4]):(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], ':', '\\d(?<!\\d\\d)\\d*:\\d+'),
+    ('%-H\\.%M', '([0-9]|1[0-9]|2[0-4])\\.(0[0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+'),
+    ('%H:%-M', '(0[0-9]|1[0-9]|2[0-4]):([0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], ':', '\\d(?<!\\d\\d)\\d*:\\d+'),
+    ('%H\\.%-M', '(0[0-9]|1[0-9]|2[0-4])\\.([0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+'),
+    ('%-H:%-M', '([0-9]|1[0-9]|2[0-4]):([0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], ':', '\\d(?<!\\d\\d)\\d*:\\d+'),
+    ('%-H\\.%-M', '([0-9]|1[0-9]|2[0-4])\\.([0-9]|[1-5][0-9])', ['HOURS', 'MINUTES'], '.', '\\d(?<!\\d\\d)\\d*[-./,]\\d+'),
+    ('%-I%p', '([0-9]|1[0-2])(am|pm)', ['HOURS', 'AM_PM'], '', '\\d(?<!\\d\\d)\\d*[a-z]+'),
+    ('%I%p', '(0[0-9]|1[0-2])(am|pm)', ['HOURS', 'AM_PM'], '', '\\d(?<!\\d\\d)\\d*[a-z]+'),
+    ('%-I %p', '([0-9]|1[0-2]) (am|pm)', ['HOURS', 'AM_PM'], ' ', '\\d(?<!\\d\\d)\\d*\\ [a-z]+'),
+    ('%I %p', '(0[0-9]|1[0-2]) (am|pm)', ['HOURS', 'AM_PM'], ' ', '\\d(?<!\\d\\d)\\d*\\ [a-z]+'),
+]
@@ -0,0 +1,269 @@
+"""
+This module contains the async encoder class, responsible for encoding the strings from asyncio code, without blocking
+the event loop.
+
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+from strf_hint.recognizer import Recognizer, _encode_chunk, _init_worker
+
+Source = Union[AsyncIterable[str], Iterable[str]]
+
+_END = object()  # marks the end of the source in the queue of the read values
+
+
+class AsyncEncoder:
+    """
+    Class responsible for encoding the strings from asyncio code. The CPU work is done by the `Recognizer` in a bounded
+    executor: a single thread by default, or a pool of processes. Threads share the GIL with the event loop, so it
+    may be delayed by up to the switch interval of the interpreter (5 ms by default). Processes keep the latency of the
+    event loop flat, at the cost of sending the batches between the processes.
+
+    Encoder should be closed after use, to shut down its executor, e.g. with the `async with` statement.
+
+    """
+
+    def __init__(
+        self,
+        recognizer: Optional[Recognizer] = None,
+        workers: int = 1,
+        batch_size: int = 256,
+        batch_timeout: float = 0.01,
+        max_pending: Optional[int] = None,
+    ):
+        """
+        Initialization of the `AsyncEncoder` class.
+
+        Parameters
+        ----------
+        recognizer: Optional[`Recognizer`], default None
+            Recognizer used to encode the values. By default, recognizer with the shape cache enabled.
+
+        workers: `int`, default 1
+            Number of worker processes. 1 encodes the values in a single thread of the current process.
+
+        batch_size: `int`, default 256
+            Maximal number of values encoded in a single call of the executor.
+
+        batch_timeout: `float`, default 0.01
+            Maximal time in seconds, a batch waits for the values of a slow source before it is encoded.
+
+        max_pending: Optional[`int`], default None
+            Maximal number of batches submitted to the executor, but not yet consumed. Once reached, the source is not
+            read until the results are consumed. By default, twice the number of workers.
+
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+        self._recognizer = recognizer or Recognizer(shape_cache_size=4096)
+        self._workers = workers
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout
+        self._max_pending = max_pending or 2 * max(workers, 1)
+        self._executor: Optional[Executor] = None
+
+    async def __aenter__(self) -> "AsyncEncoder":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Method responsible for shutting down the executor of the encoder. It is started again on the next use.
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        """
+        Method responsible for retrieving the executor of the encoder, created on the first use. Worker processes
+        build their recognizer once, with a copy of the codes and the same shape cache size.
+
+        Returns
+        -------
+        `Executor`
+            Executor of the encoder.
+
+        """
+        if self._executor is None:
+            if self._workers > 1:
+                # imported here, as the process pool machinery noticeably slows down the import of the package
+                from concurrent.futures import ProcessPoolExecutor
+
+                shape_cache = self._recognizer.shape_cache_info()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    initializer=_init_worker,
+                    initargs=(
+                        self._recognizer._codes,
+                        shape_cache.maxsize if shape_cache else 0,
+                    ),
+                )
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="strf_hint"
+                )
+        return self._executor
+
+    def _submit(self, batch: List[str]) -> asyncio.Future:
+        """
+        Method responsible for submitting the batch of values to the executor.
+
+        Parameters
+        ----------
+        batch: `List`[`str`]
+            Values to be encoded.
+
+        Returns
+        -------
+        `asyncio.Future`
+            Future of the encoded values, in the batch order.
+
+        """
+        encode = _encode_chunk if self._workers > 1 else self._recognizer.encode_formats
+        return asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), encode, batch
+        )
+
+    async def encode_format(self, s: str) -> str:
+        """
+        Method responsible for encoding a single string in the executor.
+
+        Parameters
+        ----------
+        s: `str`
+            Input text to be encoded using specific strf-codes.
+
+        Returns
+        -------
+        `str`
+            Input string encoded with the proper strf-codes.
+
+        """
+        return (await self._submit([s]))[0]
+
+    async def encode_formats_stream(
+        self, source: Source
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Method responsible for encoding the stream of strings. Values are read into batches, encoded in the executor,
+        and yielded as soon as their batch is encoded, in the input order. At most `max_pending` batches are in
+        flight, so a slow consumer stops the reading of the source.
+
+        Parameters
+        ----------
+        source: `Union`[`AsyncIterable`[`str`], `Iterable`[`str`]]
+            Values to be encoded.
+
+        Returns
+        -------
+        `AsyncIterator`[`Tuple`[`str`, `str`]]
+            Tuples containing the original value and its encoded format, in the input order.
+
+        """
+        submitted: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Semaphore(self._max_pending)
+        producer = asyncio.ensure_future(self._produce(source, submitted, slots))
+        try:
+            while True:
+                batch = await submitted.get()
+                if batch is _END:
+                    break
+                values, future = batch
+                encoded = await future
+                slots.release()
+                for pair in zip(values, encoded):
+                    yield pair
+            # raises the errors of the source
+            await producer
+        finally:
+            producer.cancel()
+            while not submitted.empty():
+                batch = submitted.get_nowait()
+                if batch is not _END:
+                    batch[1].cancel()
+
+    async def _produce(
+        self, source: Source, submitted: asyncio.Queue, slots: asyncio.Semaphore
+    ) -> None:
+        """
+        Method responsible for reading the source into batches, and submitting them to the executor. Each batch takes
+        one of the slots, released once it is consumed.
+
+        Parameters
+        ----------
+        source: `Union`[`AsyncIterable`[`str`], `Iterable`[`str`]]
+            Values to be encoded.
+
+        submitted: `asyncio.Queue`
+            Queue of the submitted batches, together with the futures of their results, ended with `_END`.
+
+        slots: `asyncio.Semaphore`
+            Slots of the batches in flight.
+
+        """
+        values: asyncio.Queue = asyncio.Queue(maxsize=self._batch_size)
+        reader = asyncio.ensure_future(self._read(source, values))
+        loop = asyncio.get_running_loop()
+        try:
+            ended = False
+            while not ended:
+                value = await values.get()
+                if value is _END:
+                    break
+                batch = [value]
+                deadline = loop.time() + self._batch_timeout
+                while len(batch) < self._batch_size:
+                    try:
+                        value = values.get_nowait()
+                    except asyncio.QueueEmpty:
+                        try:
+                            value = await asyncio.wait_for(
+                                values.get(), deadline - loop.time()
+                            )
+                        except asyncio.TimeoutError:
+                            break
+                    if value is _END:
+                        ended = True
+                        break
+                    batch.append(value)
+                await slots.acquire()
+                submitted.put_nowait((batch, self._submit(batch)))
+            await reader
+        finally:
+            reader.cancel()
+            submitted.put_nowait(_END)
+
+    @staticmethod
+    async def _read(source: Source, values: asyncio.Queue) -> None:
+        """
+        Method responsible for reading the values of the source into the bounded queue, ended with `_END`.
+
+        Parameters
+        ----------
+        source: `Union`[`AsyncIterable`[`str`], `Iterable`[`str`]]
+            Values to be encoded.
+
+        values: `asyncio.Queue`
+            Queue of the read values.
+
+        """
+        try:
+            if hasattr(source, "__aiter__"):
+                async for value in source:
+                    await values.put(value)
+            else:
+                for value in source:
+                    await values.put(value)
+        except Exception:
+            # batches read so far are still encoded, the error is raised by the producer afterwards
+            await values.put(_END)
+            raise
+        await values.put(_END)
@@ -0,0 +1,77 @@
+"""
+This module contains the ahead-of-time build step of the tables derived from `StrfCodes`. The tables are written into
+the `strf_hint/_tables.py` module, shipped with the package:
+
+    python -m strf_hint.build_tables
+
+"""
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from strf_hint.strf_codes import StrfCodes
+
+TABLES_PATH = os.path.join(os.path.dirname(__file__), "_tables.py")
+
+
+def render_tables(codes: Optional[StrfCodes] = None) -> str:
+    """
+    Function responsible for rendering the source of the tables module.
+
+    Parameters
+    ----------
+    codes: Optional[`StrfCodes`], default None
+        Instance of the codes container class. New instance is created, if not given.
+
+    Returns
+    -------
+    `str`
+        Source of the tables module.
+
+    """
+    codes = codes if codes is not None else StrfCodes()
+    rows = "".join(f"    {row!r},\n" for row in codes.build_tables())
+    return (
+        '"""\n'
+        "This module contains the tables derived from `StrfCodes`. Generated by "
+        "`python -m strf_hint.build_tables`, do not edit.\n\n"
+        '"""\n'
+        f"DIGEST = {codes.tables_digest()!r}\n\n"
+        f"COMMON_FORMATS = [\n{rows}]\n"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the build step.
+
+    Parameters
+    ----------
+    argv: Optional[`List`[`str`]]
+        Command-line arguments. If not given, `sys.argv` is used.
+
+    Returns
+    -------
+    `int`
+        Exit code.
+
+    """
+    parser = argparse.ArgumentParser(
+        description="Build the tables derived from the strf codes."
+    )
+    parser.add_argument(
+        "--output",
+        default=TABLES_PATH,
+        help="path of the tables module, strf_hint/_tables.py by default",
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        file.write(render_tables())
+    print(f"Tables written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+This module contains the cache classes, used to memoize the results of the encoding.
+
+"""
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of the cache.
+
+    """
+
+    hits: int  # number of lookups, that found the key
+    misses: int  # number of lookups, that didn't find the key
+    evictions: int  # number of entries removed, due to the size limit
+    maxsize: int  # maximal number of entries
+    currsize: int  # current number of entries
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe cache, discarding the least recently used entries.
+
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialization of the `LRUCache` class.
+
+        Parameters
+        ----------
+        maxsize: `int`, default 128
+            Maximal number of entries stored in the cache.
+
+        """
+        if maxsize < 1:
+            raise ValueError("Maxsize must be a positive integer.")
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Method responsible for retrieving the value stored under the key, and marking it as recently used.
+
+        Parameters
+        ----------
+        key: `Hashable`
+            Key of the entry.
+
+        default: `Optional`[`Any`], default None
+            Value returned, if the key is not present in the cache.
+
+        Returns
+        -------
+        `Any`
+            Value stored under the key, or `default`.
+
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Method responsible for storing the value under the key. If the cache is full, the least recently used entry is
+        discarded.
+
+        Parameters
+        ----------
+        key: `Hashable`
+            Key of the entry.
+
+        value: `Any`
+            Value to be stored.
+
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Method responsible for removing all the entries and resetting the statistics.
+
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Method responsible for retrieving the statistics of the cache.
+
+        Returns
+        -------
+        `CacheInfo`
+            Statistics of the cache.
+
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+
+class MemoizedMethod:
+    """
+    Descriptor memoizing the method separately for each instance. The memo is a bounded `functools.lru_cache`, created
+    on the first call and stored in the instance, so it is released together with the instance, unlike the class-level
+    `functools.lru_cache` of a method, which keeps all the instances alive. Bound of the memo is read from the instance
+    attribute of the given name, so it may be configured per class or per instance.
+
+    Parameters
+    ----------
+    func: `Callable`
+        Memoized method.
+
+    maxsize: `str`
+        Name of the instance attribute, holding the maximal number of memoized results.
+
+    """
+
+    def __init__(self, func: Callable, maxsize: str):
+        self.func = func
+        self.maxsize = maxsize
+        self.name = func.__name__
+        functools.update_wrapper(self, func)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        memo = functools.lru_cache(maxsize=getattr(instance, self.maxsize))(
+            self.func.__get__(instance, owner)
+        )
+        # the memo shadows the descriptor, so next calls go straight to the lru_cache
+        instance.__dict__[self.name] = memo
+        return memo
+
+    def __call__(self, instance: Any, *args, **kwargs) -> Any:
+        # called through the class, the memo of the instance is looked up the regular way
+        return getattr(instance, self.name)(*args, **kwargs)
+
+    @staticmethod
+    def info(memo: Callable) -> CacheInfo:
+        """
+        Method responsible for retrieving the statistics of the memo. Each miss stores a result, and results are only
+        removed by the evictions (clearing resets the statistics), so the evictions are the misses not in the memo.
+
+        Parameters
+        ----------
+        memo: `Callable`
+            Memo of the method, created by `MemoizedMethod`.
+
+        Returns
+        -------
+        `CacheInfo`
+            Statistics of the memo.
+
+        """
+        info = memo.cache_info()
+        return CacheInfo(
+            info.hits,
+            info.misses,
+            info.misses - info.currsize,
+            info.maxsize,
+            info.currsize,
+        )
+
+
+def memoized_method(maxsize: str) -> Callable[[Callable], MemoizedMethod]:
+    """
+    Decorator memoizing the method separately for each instance, see `MemoizedMethod`.
+
+    Parameters
+    ----------
+    maxsize: `str`
+        Name of the instance attribute, holding the maximal number of memoized results.
+
+    Returns
+    -------
+    `Callable`[[`Callable`], `MemoizedMethod`]
+        Decorator of the method.
+
+    """
+
+    def decorator(func: Callable) -> MemoizedMethod:
+        return MemoizedMethod(func, maxsize)
+
+    return decorator
@@ -0,0 +1,222 @@
+"""
+This module contains the command-line interface of the package, responsible for encoding strings given as arguments,
+or read from files or the standard input.
+
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from strf_hint.recognizer import Recognizer
+from strf_hint.stream import StreamEncoder
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """
+    Function responsible for parsing the command-line arguments.
+
+    Parameters
+    ----------
+    argv: Optional[`List`[`str`]]
+        Command-line arguments. If not given, `sys.argv` is used.
+
+    Returns
+    -------
+    `argparse.Namespace`
+        Parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="strf-hint",
+        description="Encode datetime strings using strf codes. Strings are taken from the arguments, the files or "
+        "the standard input.",
+    )
+    parser.add_argument("strings", nargs="*", help="strings to be encoded")
+    parser.add_argument(
+        "-f",
+        "--file",
+        action="append",
+        default=[],
+        dest="files",
+        help="file to be encoded line by line, '-' for the standard input (may be repeated)",
+    )
+    parser.add_argument("-c", "--column", help="name of the CSV column to be encoded")
+    parser.add_argument(
+        "-d", "--delimiter", default=",", help="delimiter of the CSV file"
+    )
+    parser.add_argument(
+        "-o",
+        "--output-format",
+        choices=["tsv", "json"],
+        default="tsv",
+        help="format of the output: tab-separated values or JSON lines",
+    )
+    parser.add_argument(
+        "-H",
+        "--with-filename",
+        action="store_true",
+        help="prefix the results with the file name",
+    )
+    parser.add_argument(
+        "-s",
+        "--summary",
+        action="store_true",
+        help="print only the distinct formats with their counts",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="number of strings sent to a worker at once",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=4096,
+        help="size of the shape cache, 0 disables it",
+    )
+    return parser.parse_args(argv)
+
+
+def _encode(
+    args: argparse.Namespace, recognizer: Recognizer
+) -> Iterator[Tuple[str, int, str, str]]:
+    """
+    Function responsible for encoding the strings selected by the arguments.
+
+    Parameters
+    ----------
+    args: `argparse.Namespace`
+        Parsed arguments.
+
+    recognizer: `Recognizer`
+        Recognizer used to encode the strings.
+
+    Returns
+    -------
+    `Iterator`[`Tuple`[`str`, `int`, `str`, `str`]]
+        Tuples containing the source name, the line number, the original string and its encoded format.
+
+    """
+    if args.strings:
+        encoded = recognizer.encode_formats(args.strings, args.workers, args.chunk_size)
+        for line_no, (original, encoded_format) in enumerate(
+            zip(args.strings, encoded), 1
+        ):
+            yield "-", line_no, original, encoded_format
+
+    encoder = StreamEncoder(
+        recognizer,
+        column=args.column,
+        delimiter=args.delimiter,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    files = args.files or ([] if args.strings else ["-"])
+    for file in files:
+        for line_no, original, encoded_format in encoder.encode(
+            sys.stdin if file == "-" else file
+        ):
+            yield file, line_no, original, encoded_format
+
+
+def _write_results(
+    results: Iterator[Tuple[str, int, str, str]],
+    args: argparse.Namespace,
+    output: TextIO,
+) -> None:
+    """
+    Function responsible for writing the results, one at a time.
+
+    Parameters
+    ----------
+    results: `Iterator`[`Tuple`[`str`, `int`, `str`, `str`]]
+        Tuples containing the source name, the line number, the original string and its encoded format.
+
+    args: `argparse.Namespace`
+        Parsed arguments.
+
+    output: `TextIO`
+        Opened text file, the results are written to.
+
+    """
+    writer = csv.writer(output, delimiter="\t", lineterminator="\n")
+    for source, line_no, original, encoded_format in results:
+        if args.output_format == "json":
+            record = {"line": line_no, "value": original, "format": encoded_format}
+            if args.with_filename:
+                record = {"file": source, **record}
+            output.write(json.dumps(record) + "\n")
+        else:
+            row = [line_no, original, encoded_format]
+            writer.writerow([source] + row if args.with_filename else row)
+
+
+def _write_summary(
+    results: Iterator[Tuple[str, int, str, str]],
+    args: argparse.Namespace,
+    output: TextIO,
+) -> None:
+    """
+    Function responsible for writing the distinct formats with their counts, the most common first.
+
+    Parameters
+    ----------
+    results: `Iterator`[`Tuple`[`str`, `int`, `str`, `str`]]
+        Tuples containing the source name, the line number, the original string and its encoded format.
+
+    args: `argparse.Namespace`
+        Parsed arguments.
+
+    output: `TextIO`
+        Opened text file, the summary is written to.
+
+    """
+    counts = Counter(encoded_format for *_, encoded_format in results)
+    writer = csv.writer(output, delimiter="\t", lineterminator="\n")
+    for encoded_format, count in counts.most_common():
+        if args.output_format == "json":
+            output.write(json.dumps({"format": encoded_format, "count": count}) + "\n")
+        else:
+            writer.writerow([count, encoded_format])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the `strf-hint` command.
+
+    Parameters
+    ----------
+    argv: Optional[`List`[`str`]]
+        Command-line arguments. If not given, `sys.argv` is used.
+
+    Returns
+    -------
+    `int`
+        Exit code.
+
+    """
+    args = _parse_args(argv)
+    recognizer = Recognizer(shape_cache_size=args.cache_size)
+    results = _encode(args, recognizer)
+    try:
+        if args.summary:
+            _write_summary(results, args, sys.stdout)
+        else:
+            _write_results(results, args, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output closed by the next command of the pipeline, e.g. `head`.
+        sys.stderr.close()
+        return 1
+    except (OSError, ValueError) as error:
+        print(f"strf-hint: {error}", file=sys.stderr)
+        return 2
+
+    return 0
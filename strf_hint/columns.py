@@ -0,0 +1,163 @@
+"""
+This module contains the column encoder class, responsible for encoding the NumPy arrays and pandas series. NumPy and
+pandas are optional dependencies, installed with the `columns` extra.
+
+"""
+from typing import Any, Optional
+
+from strf_hint.inference import FormatInferrer, InferenceResult
+from strf_hint.recognizer import Recognizer
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+
+class ColumnEncoder:
+    """
+    Class responsible for encoding the columns of values, stored as NumPy arrays or pandas series. Distinct values of
+    the column are found with the vectorized factorization, so the `Recognizer` is called once per distinct value, and
+    the results are broadcast back to the rows.
+
+    """
+
+    def __init__(
+        self,
+        recognizer: Optional[Recognizer] = None,
+        workers: int = 1,
+        chunk_size: int = 10000,
+    ):
+        """
+        Initialization of the `ColumnEncoder` class.
+
+        Parameters
+        ----------
+        recognizer: Optional[`Recognizer`], default None
+            Recognizer used to encode the values. By default, recognizer with the shape cache enabled.
+
+        workers: `int`, default 1
+            Number of worker processes, used to encode the distinct values. 1 encodes them in the current process.
+
+        chunk_size: `int`, default 10000
+            Number of values sent to a worker process at once.
+
+        """
+        if np is None:
+            raise ImportError(
+                "ColumnEncoder requires NumPy, install it with: pip install strf_hint[columns]"
+            )
+        self._recognizer = recognizer or Recognizer(shape_cache_size=4096)
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+    def encode(self, values: Any) -> Any:
+        """
+        Method responsible for encoding each row of the column.
+
+        Parameters
+        ----------
+        values: `pandas.Series` or `numpy.ndarray`
+            Column of strings. Array-like values are converted into the NumPy array.
+
+        Returns
+        -------
+        `pandas.Series` or `numpy.ndarray`
+            Encoded formats of the rows, of the same index (or shape) as the input. Missing values (None or NaN) are
+            encoded as None.
+
+        """
+        if pd is not None and isinstance(values, pd.Series):
+            # factorize marks the missing values with -1, which takes the trailing None of the encoded values
+            codes, uniques = pd.factorize(values)
+            encoded = self._encode_unique(uniques.astype(str).tolist())
+            return pd.Series(
+                encoded[codes], index=values.index, name=values.name, dtype=object
+            )
+
+        array = np.asarray(values)
+        present = ~self._missing(array)
+        uniques, inverse = np.unique(array[present].astype(str), return_inverse=True)
+        encoded = np.full(array.shape, None, dtype=object)
+        encoded[present] = self._encode_unique(uniques.tolist())[inverse]
+        return encoded
+
+    def infer(
+        self, values: Any, inferrer: Optional[FormatInferrer] = None
+    ) -> InferenceResult:
+        """
+        Method responsible for inferring a single format of the whole column. Missing values (None or NaN) are
+        skipped.
+
+        Parameters
+        ----------
+        values: `pandas.Series` or `numpy.ndarray`
+            Column of strings. Array-like values are converted into the NumPy array.
+
+        inferrer: Optional[`FormatInferrer`], default None
+            Inferrer of the format. By default, inferrer using the recognizer of the column encoder.
+
+        Returns
+        -------
+        `InferenceResult`
+            Result of the inference.
+
+        """
+        if pd is not None and isinstance(values, pd.Series):
+            samples = values.dropna().astype(str).to_numpy()
+        else:
+            array = np.asarray(values)
+            samples = array[~self._missing(array)].astype(str)
+        inferrer = inferrer or FormatInferrer(recognizer=self._recognizer)
+        return inferrer.infer(samples)
+
+    @staticmethod
+    def _missing(array: Any) -> Any:
+        """
+        Method responsible for finding the missing values (None or NaN) of the array.
+
+        Parameters
+        ----------
+        array: `numpy.ndarray`
+            Column of values.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            Boolean mask of the missing values, of the same shape as the array.
+
+        """
+        if pd is not None:
+            return pd.isna(array)
+        if array.dtype.kind == "f":
+            return np.isnan(array)
+        if array.dtype.kind == "O":
+            # None equals only None, and NaN is the only value not equal to itself
+            return (array == None) | (array != array)  # noqa: E711
+        return np.zeros(array.shape, dtype=bool)
+
+    def _encode_unique(self, uniques: list) -> Any:
+        """
+        Method responsible for encoding the distinct values of the column.
+
+        Parameters
+        ----------
+        uniques: `list`
+            Distinct values of the column.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            Object array of the encoded values, followed by None.
+
+        """
+        encoded = np.empty(len(uniques) + 1, dtype=object)
+        encoded[:-1] = self._recognizer.encode_formats(
+            uniques, workers=self._workers, chunk_size=self._chunk_size
+        )
+        return encoded
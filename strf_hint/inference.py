@@ -0,0 +1,265 @@
+"""
+This module contains the inference class, responsible for finding a single strf format for a whole column of strings.
+
+"""
+import itertools
+import random
+import re
+from collections import Counter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from strf_hint.recognizer import Recognizer
+
+
+class InferenceResult(NamedTuple):
+    """
+    Result of the format inference.
+
+    """
+
+    format: Optional[str]  # winning format, None if no samples were available
+    confidence: float  # share of the samples encoded to the same structure as the winning format
+    coverage: float  # share of the samples matched by the winning format
+    samples: int  # number of analyzed samples
+
+
+class FormatInferrer:
+    """
+    Class responsible for inferring a single strf format from many samples of the same column.
+
+    """
+
+    # Codes, that may be swapped with each other, when the samples are ambiguous.
+    SWAPPABLE_CODES = {"%d": "%m", "%m": "%d", "%-d": "%-m", "%-m": "%-d"}
+    # Zero-padded codes and their not padded equivalents.
+    PADDED_CODES = {
+        "%d": "%-d",
+        "%m": "%-m",
+        "%H": "%-H",
+        "%I": "%-I",
+        "%M": "%-M",
+        "%S": "%-S",
+        "%j": "%-j",
+        "%U": "%-U",
+        "%W": "%-W",
+    }
+
+    def __init__(
+        self,
+        recognizer: Optional[Recognizer] = None,
+        max_samples: int = 1000,
+        min_coverage: float = 0.99,
+        initial_samples: int = 32,
+        seed: int = 0,
+    ):
+        """
+        Initialization of the `FormatInferrer` class.
+
+        Parameters
+        ----------
+        recognizer: Optional[`Recognizer`], default None
+            Recognizer used to encode the samples. By default, recognizer with the shape cache enabled.
+
+        max_samples: `int`, default 1000
+            Maximal number of samples analyzed.
+
+        min_coverage: `float`, default 0.99
+            Share of the samples, that the winning format must match, to stop the sampling early.
+
+        initial_samples: `int`, default 32
+            Number of samples analyzed in the first round. Each next round doubles the number of samples.
+
+        seed: `int`, default 0
+            Seed of the random generator, used to select the samples.
+
+        """
+        self._recognizer = recognizer or Recognizer(shape_cache_size=4096)
+        self._codes = self._recognizer._codes
+        self._max_samples = max_samples
+        self._min_coverage = min_coverage
+        self._initial_samples = initial_samples
+        self._seed = seed
+        self._codes_regex = re.compile(f"({'|'.join(self._codes.BASIC_CODES.keys())})")
+        self._padded = {value: key for key, value in self.PADDED_CODES.items()}
+
+    def infer(self, values: Sequence[str]) -> InferenceResult:
+        """
+        Method responsible for inferring the format of the column. Samples are drawn in rounds of growing size, until
+        the same format wins two consecutive rounds, matching at least `min_coverage` of the samples, or until
+        `max_samples` samples were analyzed. Empty values are skipped.
+
+        Parameters
+        ----------
+        values: `Sequence`[`str`]
+            Values of the column.
+
+        Returns
+        -------
+        `InferenceResult`
+            Winning format with its confidence and coverage.
+
+        """
+        order = self._sample_order(len(values))
+        samples: List[str] = []
+        votes: Counter = Counter()
+        result = InferenceResult(None, 0.0, 0.0, 0)
+        round_size = self._initial_samples
+        exhausted = False
+        while not exhausted and len(samples) < self._max_samples:
+            batch = []
+            while (
+                len(batch) < round_size
+                and len(samples) + len(batch) < self._max_samples
+            ):
+                position = next(order, None)
+                if position is None:
+                    exhausted = True
+                    break
+                value = values[position]
+                if value and value.strip():
+                    batch.append(value)
+            samples += batch
+            votes.update(self._recognizer.encode_formats(batch))
+            previous, result = result, self._rank(samples, votes)
+            if (
+                result.format is not None
+                and result.format == previous.format
+                and result.coverage >= self._min_coverage
+            ):
+                break
+            round_size *= 2
+
+        return result
+
+    def _sample_order(self, size: int) -> Iterator[int]:
+        """
+        Method responsible for drawing the positions of the samples in random order, without repetitions. Positions
+        are drawn lazily, with the Fisher-Yates shuffle of only the drawn positions, so the time and the memory depend
+        on the number of the drawn samples, not on the size of the column.
+
+        Parameters
+        ----------
+        size: `int`
+            Number of values of the column.
+
+        Returns
+        -------
+        `Iterator`[`int`]
+            Positions of the samples.
+
+        """
+        rng = random.Random(self._seed)
+        # positions swapped by the shuffle, all the other positions hold themselves
+        swapped: Dict[int, int] = {}
+        for drawn in range(size):
+            picked = rng.randrange(drawn, size)
+            yield swapped.get(picked, picked)
+            swapped[picked] = swapped.pop(drawn, drawn)
+
+    def _rank(self, samples: List[str], votes: Counter) -> InferenceResult:
+        """
+        Method responsible for selecting the best format for the samples. Candidates are the formats encoded from the
+        samples, together with their variants differing in the order of day and month, or in the padding of the
+        numeric codes. Candidate matching the most samples wins; ties are resolved by the number of votes, i.e.
+        samples encoded directly to the candidate.
+
+        Parameters
+        ----------
+        samples: `List`[`str`]
+            Analyzed samples.
+
+        votes: `Counter`
+            Number of samples encoded to each format.
+
+        Returns
+        -------
+        `InferenceResult`
+            Winning format with its confidence and coverage.
+
+        """
+        if not samples:
+            return InferenceResult(None, 0.0, 0.0, 0)
+
+        candidates: Dict[str, None] = {}
+        for encoded_format, _ in votes.most_common():
+            candidates.update(dict.fromkeys(self._variants(encoded_format)))
+        scores = []
+        for candidate in candidates:
+            pattern = self._codes.compile_format(candidate)
+            matched = sum(1 for sample in samples if pattern.fullmatch(sample))
+            scores.append((matched, votes[candidate], candidate))
+        matched, _, winner = max(scores, key=lambda score: score[:2])
+
+        structure = self._structure(winner)
+        agreeing = sum(
+            count
+            for encoded_format, count in votes.items()
+            if self._structure(encoded_format) == structure
+        )
+        return InferenceResult(
+            winner, agreeing / len(samples), matched / len(samples), len(samples)
+        )
+
+    def _variants(self, encoded_format: str) -> List[str]:
+        """
+        Method responsible for generating the variants of the format, differing in the order of day and month, or in
+        the padding of the numeric codes.
+
+        Parameters
+        ----------
+        encoded_format: `str`
+            Format encoded with the strf-codes.
+
+        Returns
+        -------
+        `List`[`str`]
+            Variants of the format, starting with the format itself.
+
+        """
+        parts = self._codes_regex.split(encoded_format)
+        options = []
+        for idx, part in enumerate(parts):
+            if idx % 2 == 0:
+                options.append([part])
+                continue
+            padded = self._padded.get(part, part)
+            options.append(
+                list(
+                    dict.fromkeys([part, padded, self.PADDED_CODES.get(padded, padded)])
+                )
+            )
+        variants = ["".join(option) for option in itertools.product(*options)]
+        if sum(part in self.SWAPPABLE_CODES for part in parts[1::2]) == 2:
+            variants += [
+                self._codes_regex.sub(
+                    lambda match: self.SWAPPABLE_CODES.get(
+                        match.group(), match.group()
+                    ),
+                    variant,
+                )
+                for variant in variants
+            ]
+
+        return list(dict.fromkeys(variants))
+
+    def _structure(self, encoded_format: str) -> str:
+        """
+        Method responsible for reducing the format to its structure, that is common for all of its variants.
+
+        Parameters
+        ----------
+        encoded_format: `str`
+            Format encoded with the strf-codes.
+
+        Returns
+        -------
+        `str`
+            Structure of the format.
+
+        """
+
+        def reduce(match: re.Match) -> str:
+            code = self._padded.get(match.group(), match.group())
+            return "%D" if code in self.SWAPPABLE_CODES else code
+
+        return self._codes_regex.sub(reduce, encoded_format)
@@ -0,0 +1,258 @@
+"""
+This module contains the names of the days, months and AM/PM in other languages than English, recognized by the
+`StrfCodes` created with the `locales` parameter.
+
+"""
+import calendar
+import functools
+import re
+from typing import Dict, Iterable, Tuple
+
+# Names of the bundled locales, by the language code. Words are lowercase, without the trailing dots of the
+# abbreviations. Polish months are given also in the genitive form, used in the dates (e.g. "21 listopada 2023").
+LOCALE_NAMES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "de": {
+        "%a": ("mo", "di", "mi", "do", "fr", "sa", "so"),
+        "%A": (
+            "montag",
+            "dienstag",
+            "mittwoch",
+            "donnerstag",
+            "freitag",
+            "samstag",
+            "sonnabend",
+            "sonntag",
+        ),
+        "%b": (
+            "jan",
+            "jän",
+            "feb",
+            "mär",
+            "mrz",
+            "apr",
+            "mai",
+            "jun",
+            "jul",
+            "aug",
+            "sep",
+            "sept",
+            "okt",
+            "nov",
+            "dez",
+        ),
+        "%B": (
+            "januar",
+            "jänner",
+            "februar",
+            "märz",
+            "april",
+            "mai",
+            "juni",
+            "juli",
+            "august",
+            "september",
+            "oktober",
+            "november",
+            "dezember",
+        ),
+        "%p": (),
+    },
+    "fr": {
+        "%a": ("lun", "mar", "mer", "jeu", "ven", "sam", "dim"),
+        "%A": ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"),
+        "%b": (
+            "janv",
+            "févr",
+            "fév",
+            "mars",
+            "avr",
+            "mai",
+            "juin",
+            "juil",
+            "août",
+            "sept",
+            "oct",
+            "nov",
+            "déc",
+        ),
+        "%B": (
+            "janvier",
+            "février",
+            "mars",
+            "avril",
+            "mai",
+            "juin",
+            "juillet",
+            "août",
+            "septembre",
+            "octobre",
+            "novembre",
+            "décembre",
+        ),
+        "%p": (),
+    },
+    "pl": {
+        "%a": ("pon", "wt", "śr", "czw", "pt", "sob", "niedz", "nd"),
+        "%A": (
+            "poniedziałek",
+            "wtorek",
+            "środa",
+            "czwartek",
+            "piątek",
+            "sobota",
+            "niedziela",
+        ),
+        "%b": (
+            "sty",
+            "lut",
+            "mar",
+            "kwi",
+            "maj",
+            "cze",
+            "lip",
+            "sie",
+            "wrz",
+            "paź",
+            "lis",
+            "gru",
+        ),
+        "%B": (
+            "styczeń",
+            "luty",
+            "marzec",
+            "kwiecień",
+            "maj",
+            "czerwiec",
+            "lipiec",
+            "sierpień",
+            "wrzesień",
+            "październik",
+            "listopad",
+            "grudzień",
+            "stycznia",
+            "lutego",
+            "marca",
+            "kwietnia",
+            "maja",
+            "czerwca",
+            "lipca",
+            "sierpnia",
+            "września",
+            "października",
+            "listopada",
+            "grudnia",
+        ),
+        "%p": (),
+    },
+}
+
+# codes of the names, given by the locales
+NAME_CODES = ("%a", "%A", "%b", "%B", "%p")
+
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+@functools.lru_cache(maxsize=None)
+def get_locale_names(name: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Function responsible for retrieving the names of the locale. Bundled locales are found by the language code (e.g.
+    "de" for "de_DE.UTF-8"). Names of other locales are generated with the `calendar` module, which requires the
+    locale to be installed in the system. Names of each locale are loaded once, on the first request.
+
+    Parameters
+    ----------
+    name: `str`
+        Name of the locale, e.g. "de", "fr_FR" or "pl_PL.UTF-8".
+
+    Returns
+    -------
+    `Dict`[`str`, `Tuple`[`str`, ...]]
+        Dictionary mapping the name-like strf-codes to their lowercase words.
+
+    """
+    language = re.split(r"[-_.@]", name)[0].lower()
+    if language in LOCALE_NAMES:
+        return LOCALE_NAMES[language]
+    return _calendar_names(name)
+
+
+def _calendar_names(name: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Function responsible for generating the names of the locale with the `calendar` module. Locale is switched for the
+    whole process while the names are generated, so it should not be done concurrently with other locale-dependent
+    code.
+
+    Parameters
+    ----------
+    name: `str`
+        Name of the locale installed in the system.
+
+    Returns
+    -------
+    `Dict`[`str`, `Tuple`[`str`, ...]]
+        Dictionary mapping the name-like strf-codes to their lowercase words.
+
+    """
+    try:
+        with calendar.different_locale(name):
+            names = {
+                "%a": _words(calendar.day_abbr),
+                "%A": _words(calendar.day_name),
+                "%b": _words(calendar.month_abbr),
+                "%B": _words(calendar.month_name),
+            }
+    except Exception as error:
+        # the `locale` module reports the missing locales with its own error type
+        raise ValueError(f"Locale {name!r} is not supported.") from error
+    names["%p"] = ()
+    return names
+
+
+def _words(names: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Function responsible for normalizing the names generated by the `calendar` module: names are lowercased, trailing
+    dots of the abbreviations are removed, and the empty or not single-word names are skipped.
+
+    Parameters
+    ----------
+    names: `Iterable`[`str`]
+        Names of the days or months.
+
+    Returns
+    -------
+    `Tuple`[`str`, ...]
+        Unique normalized names.
+
+    """
+    words = (name.lower().rstrip(".") for name in names)
+    return tuple(dict.fromkeys(word for word in words if _WORD.fullmatch(word)))
+
+
+def localize_codes(basic_codes: dict, locales: Iterable[str]) -> dict:
+    """
+    Function responsible for extending the regular expressions of the name-like strf-codes with the names of the
+    locales. Words of each code are sorted from the longest one, so an alternation never stops at the shorter word
+    being a prefix of the longer one (e.g. "jun" of "juni").
+
+    Parameters
+    ----------
+    basic_codes: `dict`
+        Basic strf-codes, as `StrfCodes.BASIC_CODES`.
+
+    locales: `Iterable`[`str`]
+        Names of the locales.
+
+    Returns
+    -------
+    `dict`
+        Copy of the basic strf-codes, with the names of the locales added.
+
+    """
+    localized = dict(basic_codes)
+    for code in NAME_CODES:
+        words = basic_codes[code]["regex"].split("|")
+        for locale_name in locales:
+            words += get_locale_names(locale_name)[code]
+        words = sorted(dict.fromkeys(words), key=len, reverse=True)
+        localized[code] = {**basic_codes[code], "regex": "|".join(words)}
+    return localized
@@ -0,0 +1,326 @@
+"""
+This module contains the parser class, responsible for parsing strings of an encoded format into datetime objects.
+
+"""
+import datetime
+import re
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from strf_hint.strf_codes import FieldTypes, StrfCodes
+
+
+def _short_year(value: str) -> int:
+    """
+    Function responsible for converting the two-digit year into the full year, with the same rule as
+    `datetime.strptime` (69-99 are 1969-1999, 00-68 are 2000-2068).
+
+    """
+    year = int(value)
+    return year + (2000 if year < 69 else 1900)
+
+
+def _microseconds(value: str) -> int:
+    """
+    Function responsible for converting the fraction of the second into microseconds.
+
+    """
+    return int(value.ljust(6, "0"))
+
+
+class DatetimeParser:
+    """
+    Class responsible for parsing the strings of a single encoded format into `datetime.datetime` objects. The format
+    is compiled once into a regular expression with a group for each strf-code, and the groups are converted directly
+    into the datetime fields. Platform specific codes (e.g. %-d, %-I), emitted by the `Recognizer`, are supported.
+
+    Fields missing in the format take the same defaults as in `datetime.strptime` (1900-01-01 00:00:00). If a field is
+    given by more than one strf-code, the last one wins. Timezone names are matched, but ignored, so the parsed
+    datetimes are naive.
+
+    Parameters
+    ----------
+    encoded_format: `str`
+        Format encoded with the strf-codes, e.g. returned by the `Recognizer`.
+
+    codes: Optional[`StrfCodes`], default None
+        Instance of the codes container class. New instance is created, if not given.
+
+    """
+
+    # Regular expressions of the numeric codes, used for parsing. Values are validated by `datetime.datetime`.
+    NUMERIC_REGEX = {
+        "%Y": r"\d{4}",
+        "%y": r"\d{2}",
+        "%m": r"\d{2}",
+        "%-m": r"\d{1,2}",
+        "%d": r"\d{2}",
+        "%-d": r"\d{1,2}",
+        "%H": r"\d{2}",
+        "%-H": r"\d{1,2}",
+        "%I": r"\d{2}",
+        "%-I": r"\d{1,2}",
+        "%M": r"\d{2}",
+        "%-M": r"\d{1,2}",
+        "%S": r"\d{2}",
+        "%-S": r"\d{1,2}",
+        "%f": r"\d{1,6}",
+        "%j": r"\d{3}",
+        "%-j": r"\d{1,3}",
+        "%U": r"\d{2}",
+        "%-U": r"\d{1,2}",
+        "%W": r"\d{2}",
+        "%-W": r"\d{1,2}",
+        "%w": r"[0-6]",
+    }
+    # Indexes of the `datetime.datetime` arguments, set directly by the strf-codes of the given type.
+    FIELD_INDEXES = {
+        FieldTypes.YEAR: 0,
+        FieldTypes.MONTH_NUM: 1,
+        FieldTypes.MONTH_NAME: 1,
+        FieldTypes.MONTHDAY_NUM: 2,
+        FieldTypes.HOURS: 3,
+        FieldTypes.MINUTES: 4,
+        FieldTypes.SECONDS: 5,
+        FieldTypes.MICROSECONDS: 6,
+    }
+    DEFAULTS = (1900, 1, 1, 0, 0, 0, 0)
+    TWELVE_HOUR_CODES = ["%I", "%-I"]
+    SUNDAY_WEEK_CODES = ["%U", "%-U"]
+    DAY_NAMES = [
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+    ]
+    MONTH_NAMES = [
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+    ]
+    # Regular expressions of the name codes, used for parsing.
+    NAME_REGEX = {
+        "%a": "|".join(name[:3] for name in DAY_NAMES),
+        "%A": "|".join(DAY_NAMES),
+        "%b": "|".join(name[:3] for name in MONTH_NAMES),
+        "%B": "|".join(MONTH_NAMES),
+    }
+    # Numbers of the months and weekdays (Monday is 0), by the first three letters of their names.
+    MONTH_NUMBERS = {name[:3]: number for number, name in enumerate(MONTH_NAMES, 1)}
+    WEEKDAY_NUMBERS = {name[:3]: number for number, name in enumerate(DAY_NAMES)}
+
+    def __init__(self, encoded_format: str, codes: Optional[StrfCodes] = None):
+        self.format = encoded_format
+        codes = codes if codes is not None else StrfCodes()
+        codes_regex = re.compile(f"({'|'.join(codes.BASIC_CODES.keys())})")
+
+        # groups converted directly into the datetime fields: (group, field index, converter)
+        self._fields: List[Tuple[int, int, Callable[[str], int]]] = []
+        # groups resolved after matching, together with the other fields
+        self._twelve_hour = False
+        self._meridiem: Optional[int] = None
+        self._year_day: Optional[int] = None
+        self._week: Optional[Tuple[int, bool]] = None
+        self._weekday: Optional[Tuple[int, bool]] = None
+
+        parts = codes_regex.split(encoded_format)
+        regex = [re.escape(parts[0])]
+        for group, (code, literal) in enumerate(zip(parts[1::2], parts[2::2])):
+            regex.append(f"({self._code_regex(code, codes)})")
+            regex.append(re.escape(literal))
+            self._add_group(code, codes.get_type(code), group)
+        self._pattern = re.compile("".join(regex), re.IGNORECASE)
+        self._resolved = (
+            self._twelve_hour or self._year_day is not None or self._week is not None
+        )
+        # formats of the integer fields in order of the datetime arguments (e.g. ISO) are converted at once
+        self._direct = (
+            not self._resolved
+            and len(self._fields) >= 3
+            and len(self._fields) == self._pattern.groups
+            and all(field == (idx, idx, int) for idx, field in enumerate(self._fields))
+        )
+
+    def _code_regex(self, code: str, codes: StrfCodes) -> str:
+        """
+        Method responsible for retrieving the regular expression, used for parsing the single strf-code.
+
+        Parameters
+        ----------
+        code: `str`
+            Strf-code.
+
+        codes: `StrfCodes`
+            Instance of the codes container class.
+
+        Returns
+        -------
+        `str`
+            Regular expression of the strf-code, without capturing groups.
+
+        """
+        if code in self.NUMERIC_REGEX:
+            return self.NUMERIC_REGEX[code]
+        if code in self.NAME_REGEX:
+            return self.NAME_REGEX[code]
+        if code == "%%":
+            return "%"
+        return re.sub(r"\(", "(?:", codes.BASIC_CODES[code]["regex"])
+
+    def _add_group(self, code: str, code_type: FieldTypes, group: int) -> None:
+        """
+        Method responsible for registering the regex group, matched by the strf-code. Codes of the datetime fields
+        are converted directly, codes determining the fields together with the other codes (%I, %p, %j, %U, %w and
+        day names) are resolved after matching.
+
+        Parameters
+        ----------
+        code: `str`
+            Strf-code.
+
+        code_type: `FieldTypes`
+            Type of the strf-code.
+
+        group: `int`
+            Index of the regex group, matched by the strf-code.
+
+        """
+        if code_type in self.FIELD_INDEXES:
+            if code == "%y":
+                converter = _short_year
+            elif code_type == FieldTypes.MONTH_NAME:
+                converter = self._month_number
+            elif code_type == FieldTypes.MICROSECONDS:
+                converter = _microseconds
+            else:
+                converter = int
+            self._fields.append((group, self.FIELD_INDEXES[code_type], converter))
+            if code_type == FieldTypes.HOURS:
+                self._twelve_hour = code in self.TWELVE_HOUR_CODES
+        elif code_type == FieldTypes.AM_PM:
+            self._meridiem = group
+        elif code_type == FieldTypes.YEARDAY_NUM:
+            self._year_day = group
+        elif code_type == FieldTypes.WEEK_NUM:
+            self._week = (group, code in self.SUNDAY_WEEK_CODES)
+        elif code_type == FieldTypes.WEEKDAY_NUM:
+            self._weekday = (group, False)
+        elif code_type == FieldTypes.DAY_NAME:
+            self._weekday = (group, True)
+
+    def _month_number(self, name: str) -> int:
+        return self.MONTH_NUMBERS[name[:3].lower()]
+
+    def parse(self, s: str) -> datetime.datetime:
+        """
+        Method responsible for parsing the string into the datetime object.
+
+        Parameters
+        ----------
+        s: `str`
+            String of the parser's format.
+
+        Returns
+        -------
+        `datetime.datetime`
+            Parsed datetime.
+
+        Raises
+        ------
+        ValueError
+            If the string does not match the format, or its fields are out of range.
+
+        """
+        match = self._pattern.fullmatch(s)
+        if match is None:
+            raise ValueError(f"time data {s!r} does not match format {self.format!r}")
+
+        if self._direct:
+            return datetime.datetime(*map(int, match.groups()))
+
+        groups = match.groups()
+        values = list(self.DEFAULTS)
+        for group, index, converter in self._fields:
+            values[index] = converter(groups[group])
+        if self._resolved:
+            self._resolve(values, groups)
+
+        return datetime.datetime(*values)
+
+    __call__ = parse
+
+    def _resolve(self, values: List[int], groups: Sequence[str]) -> None:
+        """
+        Method responsible for resolving the fields determined by more than one strf-code, the same way as
+        `datetime.strptime` does: 12-hour clock with %p, day of the year, and week number with the weekday.
+
+        Parameters
+        ----------
+        values: `List`[`int`]
+            Arguments of the `datetime.datetime`, updated in place.
+
+        groups: `Sequence`[`str`]
+            Matched regex groups.
+
+        """
+        if self._twelve_hour:
+            if not 1 <= values[3] <= 12:
+                raise ValueError(f"hour {values[3]} is out of the 12-hour clock range")
+            pm = self._meridiem is not None and groups[self._meridiem].lower() == "pm"
+            values[3] = values[3] % 12 + (12 if pm else 0)
+
+        year_day = None
+        if self._year_day is not None:
+            year_day = int(groups[self._year_day])
+        elif self._week is not None and self._weekday is not None:
+            year_day = self._week_year_day(values[0], groups)
+        if year_day is not None:
+            date = datetime.date.fromordinal(
+                datetime.date(values[0], 1, 1).toordinal() + year_day - 1
+            )
+            values[:3] = [date.year, date.month, date.day]
+
+    def _week_year_day(self, year: int, groups: Sequence[str]) -> int:
+        """
+        Method responsible for computing the day of the year, from the week number and the weekday.
+
+        Parameters
+        ----------
+        year: `int`
+            Parsed year.
+
+        groups: `Sequence`[`str`]
+            Matched regex groups.
+
+        Returns
+        -------
+        `int`
+            Day of the year, may be out of range of the year.
+
+        """
+        group, sunday_first = self._week
+        week = int(groups[group])
+        weekday_group, is_name = self._weekday
+        if is_name:
+            weekday = self.WEEKDAY_NUMBERS[groups[weekday_group][:3].lower()]
+        else:
+            weekday = (int(groups[weekday_group]) - 1) % 7
+
+        first_weekday = datetime.date(year, 1, 1).weekday()
+        if sunday_first:
+            first_weekday = (first_weekday + 1) % 7
+            weekday = (weekday + 1) % 7
+        if week == 0:
+            return 1 + weekday - first_weekday
+        return (7 - first_weekday) % 7 + 7 * (week - 1) + 1 + weekday
@@ -2,34 +2,133 @@
 This module contains the recognizer class, responsible for encoding the string input with specific strf-codes.
 
 """
-import functools
+import heapq
+import itertools
 import re
-import string
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-from strf_hint.strf_codes import FieldTypes, StrfCodes
+from strf_hint.cache import CacheInfo, LRUCache
+from strf_hint.stats import EncodingTrace, RecognizerStats
+from strf_hint.strf_codes import CodeCandidate, FieldTypes, StrfCodes
+
+
+class FormatCandidate(NamedTuple):
+    """
+    Candidate format of the input, yielded by `Recognizer.encode_format_candidates`.
+
+    """
+
+    format: str  # input encoded with the strf-codes
+    score: float  # 1.0 for the recognizer's answer, lower for the alternatives ranked below it
+
+
+class EncodedFormat(NamedTuple):
+    """
+    Result of a single encoding, together with the mask and the types of the recognized strf-codes.
+
+    """
+
+    format: str  # input encoded with the strf-codes
+    matched_mask: bytes  # mask of the result, b"1" for the signs of the strf-codes
+    matched_types: Tuple[FieldTypes, ...]  # types of the recognized strf-codes
+
+
+class EncodingChoice(NamedTuple):
+    """
+    Decision made by the recognizer, recorded together with its alternatives.
+
+    """
+
+    options: tuple  # common formats (as strings), or single `CodeCandidate`s; the recognizer's option is the first one
+    types: Optional[tuple]  # types of the common formats, None for single codes
+
+
+class EncodingContext:
+    """
+    Working state of a single encoding. Each encoding creates its own context, so a single `Recognizer` may be shared
+    between threads.
+
+    """
+
+    __slots__ = (
+        "matched_mask",  # mask of the matched signs, updated in place.
+        "matched_types",  # types of the strf codes, that were matched.
+        "whole_runs_matched",  # indicates if common formats matched only entire runs of digits.
+        "trace",  # measurements of the encoding, if the instrumentation is enabled.
+        "choices",  # decisions of the encoding, if they are recorded.
+        "owners",  # index of the choice, that produced each sign of the string; None for literals.
+    )
+
+    def __init__(
+        self,
+        matched_mask: Optional[bytearray] = None,
+        matched_types: Optional[List[FieldTypes]] = None,
+        whole_runs_matched: bool = True,
+        trace: Optional[EncodingTrace] = None,
+        choices: Optional[List[EncodingChoice]] = None,
+        owners: Optional[list] = None,
+    ):
+        """
+        Initialization of the `EncodingContext` class. Mask and types default to the new, empty containers.
+
+        """
+        self.matched_mask = bytearray() if matched_mask is None else matched_mask
+        self.matched_types = [] if matched_types is None else matched_types
+        self.whole_runs_matched = whole_runs_matched
+        self.trace = trace
+        self.choices = choices
+        self.owners = owners
 
 
 class Recognizer:
     """
-    Class responsible for recognizing the strf-codes and decoding the patterns.
+    Class responsible for recognizing the strf-codes and decoding the patterns. Recognizer keeps no state of the
+    encoding, so a single instance may be used by many threads at once.
 
     """
 
-    def __init__(self, codes: Optional[StrfCodes] = StrfCodes()):
+    # groups of signs, the input is split into before recognizing the single codes
+    SIGN_GROUPS = {
+        "digits": re.compile(r"\d"),
+        "letters": re.compile(r"[^\W\d_]"),
+        "punctuation": re.compile(r"[^\w\s]|_"),
+        "whitespace": re.compile(r"\s"),
+    }
+    _SIGN_RUNS = re.compile(
+        "|".join(f"(?:{group.pattern})+" for group in SIGN_GROUPS.values())
+    )
+    _UNMATCHED = re.compile(b"0+")
+    # maximal number of the distinct inputs and shapes, remembered by a single call of `encode_formats`
+    BATCH_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        codes: Optional[StrfCodes] = None,
+        shape_cache_size: int = 0,
+        stats: Optional[RecognizerStats] = None,
+    ):
         """
         Initialization of the `Recognizer` class.
         Parameters
         ----------
-        codes: Optional[`StrfCodes`], default StrfCodes()
-            Instance of the codes container class.
+        codes: Optional[`StrfCodes`], default None
+            Instance of the codes container class. New instance is created, if not given. Single instance may be
+            shared by many recognizers.
+
+        shape_cache_size: `int`, default 0
+            Maximal number of shapes memoized by the shape cache. 0 disables the cache.
+
+        stats: Optional[`RecognizerStats`], default None
+            Collector of the encoding traces. If given, each encoding is measured and recorded. None disables the
+            instrumentation. Encodings of the worker processes of the parallel encoding are not recorded.
 
         """
-        self._matched_types: List[FieldTypes] = []  # types of the strf codes, that were matched in the single encoding.
-        self._matched_mask: str = ""  # mask of the matched signs, that corresponds to the input string.
-        self._codes = codes
+        self._codes = codes if codes is not None else StrfCodes()
+        self._shape_cache = LRUCache(shape_cache_size) if shape_cache_size else None
+        self.stats = stats
 
-    def _match_patterns(self, s: str) -> str:
+    def _match_patterns(self, s: str, context: EncodingContext) -> str:
         """
         Method responsible for recognizing predefined common patterns of strf-codes.
 
@@ -38,6 +137,9 @@ class Recognizer:
         s: `str`
             Input text to be encoded using strf-codes.
 
+        context: `EncodingContext`
+            Working state of the encoding.
+
         Returns
         -------
         str`
@@ -45,54 +147,132 @@ class Recognizer:
 
         """
         temp_s = s
-        for group in self._codes.DATE_COMMON_FORMATS + self._codes.TIME_COMMON_FORMATS:
-            group_regex = self._codes.generate_format_regex(group)
-            match = re.search(group_regex, temp_s.lower())
+        lowered = temp_s.lower()
+        candidates = self._codes.common_format_candidates(lowered)
+        while candidates:
+            idx = candidates.pop(0)
+            if context.trace is not None:
+                context.trace.pattern_searches += 1
+            group, _, types = self._codes.common_formats[idx][:3]
+            match = self._codes.common_format_pattern(idx).search(lowered)
             if match:
+                if (
+                    lowered[match.start() - 1 : match.start()].isdigit()
+                    or lowered[match.end() : match.end() + 1].isdigit()
+                ):
+                    context.whole_runs_matched = False
+                if context.choices is not None:
+                    self._record_pattern(lowered, match, idx, candidates, context)
                 temp_s = temp_s[: match.span()[0]] + group + temp_s[match.span()[1] :]
-                self._matched_mask = (
-                    self._matched_mask[: match.span()[0]]
-                    + "1" * len(group)
-                    + self._matched_mask[match.span()[1] :]
-                )
-                self._matched_types += self._codes.get_format_types(group)
-
+                context.matched_mask[match.start() : match.end()] = b"1" * len(group)
+                context.matched_types += types
+                lowered = temp_s.lower()
+                candidates = self._codes.common_format_candidates(lowered, idx + 1)
+
+        if context.owners is not None:
+            context.owners = [
+                owner for sign, owner in zip(temp_s, context.owners) if sign != "\\"
+            ]
         return temp_s.replace("\\", "")
 
-    def _recognize_single_codes(self, s: str) -> str:
+    def _record_pattern(
+        self,
+        lowered: str,
+        match: re.Match,
+        idx: int,
+        candidates: List[int],
+        context: EncodingContext,
+    ) -> None:
         """
-        Method responsible for recognizing single strf-codes from unmatched parts of input string.
+        Method responsible for recording the choice of the common format. Alternatives are the remaining candidates,
+        that match exactly the same span, and contain the same types of the strf-codes, so the rest of the encoding
+        stays valid for each of them.
+
+        Parameters
+        ----------
+        lowered: `str`
+            Lowercase input text, the format was matched in.
+
+        match: `re.Match`
+            Match of the chosen common format.
+
+        idx: `int`
+            Index of the chosen common format in the `common_formats` table.
+
+        candidates: `List`[`int`]
+            Remaining candidate formats, following the chosen one.
+
+        context: `EncodingContext`
+            Working state of the encoding.
+
+        """
+        chosen = self._codes.common_formats[idx]
+        types = sorted(chosen.types, key=lambda code_type: code_type.value)
+        options = [chosen.format.replace("\\", "")]
+        for candidate in candidates:
+            entry = self._codes.common_formats[candidate]
+            alternative = entry.format.replace("\\", "")
+            if (
+                alternative not in options
+                and sorted(entry.types, key=lambda code_type: code_type.value) == types
+                and self._codes.common_format_pattern(candidate).fullmatch(
+                    lowered, match.start(), match.end()
+                )
+            ):
+                options.append(alternative)
+        owner = len(context.choices)
+        context.owners[match.start() : match.end()] = [owner] * len(chosen.format)
+        context.choices.append(EncodingChoice(tuple(options), tuple(chosen.types)))
+
+    def _recognize_single_codes(self, s: str, context: EncodingContext) -> str:
+        """
+        Method responsible for recognizing single strf-codes from unmatched parts of input string. Unmatched spans
+        are processed from left to right, each of them once. Only if a span got some of its parts recognized, its
+        remaining unmatched parts are revisited, as their sign groups lost the neighbours. Spans without any match
+        are never revisited, because recognized codes only consume the field types, so they can not gain candidates.
 
         Parameters
         ----------
         s: `str`
             Input text to be encoded with the strf-codes.
 
+        context: `EncodingContext`
+            Working state of the encoding.
+
         Returns
         -------
         `str`
             Input text with recognized part replaced with the proper strf-codes.
 
         """
-        loop = True
-        while loop:
-            loop = False
-            for unmatched, span in self._retrieve_unmatched(s):
-                mask_before = self._matched_mask
-                matched = self._match_single_code(
-                    self._split_format_components(unmatched), span
+        # worklist of spans, together with the shift of the mask at the time they were retrieved
+        pending = deque((span, 0) for _, span in self._retrieve_unmatched(s, context))
+        shift = 0
+        while pending:
+            (start, end), retrieved_at = pending.popleft()
+            span = (start + shift - retrieved_at, end + shift - retrieved_at)
+            # each recognized code adds its type, and marks a part of the unmatched span
+            types_before = len(context.matched_types)
+            matched = self._match_single_code(
+                self._split_format_components(s[span[0] : span[1]]), context, span
+            )
+            s = s[: span[0]] + matched + s[span[1] :]
+            if types_before != len(context.matched_types):
+                shift += len(matched) - (span[1] - span[0])
+                remaining = self._UNMATCHED.finditer(
+                    context.matched_mask, span[0], span[0] + len(matched)
                 )
-                s = s[: span[0]] + matched + s[span[1] :]
-                if mask_before != self._matched_mask:
-                    loop = True
-                    break
+                revisited = [(r.span(), shift) for r in remaining]
+                pending.extendleft(reversed(revisited))
+                if context.trace is not None:
+                    context.trace.revisits += len(revisited)
 
         return s
 
     def _split_format_components(self, s: str) -> List[str]:
         """
         Methode responsible for splitting the string in the sign-typed groups (digits, letters, punctuation,
-        whitespaces.
+        whitespaces), defined by `SIGN_GROUPS`. Runs of the groups are found by a single regular expression.
 
         Parameters
         ----------
@@ -104,17 +284,13 @@ class Recognizer:
             List of strings, as a result of splitting into sign-typed groups.
 
         """
-        index = []
-        for idx, elem in enumerate(s[1:], 1):
-            if self._check_string_group(elem) != self._check_string_group(s[idx - 1]):
-                index.append(idx)
-        index.insert(0, 0)
-        index.append(len(s))
-
-        return [s[index[i - 1] : index[i]] for i, _ in enumerate(index[1:], 1)]
+        return self._SIGN_RUNS.findall(s)
 
     def _match_single_code(
-        self, split_str: List[str], str_span: Tuple[int, int] = None
+        self,
+        split_str: List[str],
+        context: EncodingContext,
+        str_span: Tuple[int, int] = None,
     ) -> str:
         """
         Method recognizes the single strf-codes in elements of the list containing split input text. Then replaces
@@ -125,6 +301,9 @@ class Recognizer:
         split_str: `List`[`str`]
             List containing input text split into sign-groups.
 
+        context: `EncodingContext`
+            Working state of the encoding.
+
         str_span: `Tuple` [`int`, `int`], optional
             Optional parameter, indicates currently analyzed part of entire input string.
 
@@ -136,51 +315,101 @@ class Recognizer:
         """
         codes = []
         mask = []
+        # choices producing the signs of the result, if the choices are recorded
+        owners = [] if context.owners is not None else None
+        # month given by its name rules out the month number, also when the number comes first (e.g. "5 Jan")
+        excluded = None
+        if FieldTypes.MONTH_NAME in context.matched_types or not (
+            self._codes.month_names.isdisjoint(map(str.lower, split_str))
+        ):
+            excluded = FieldTypes.MONTH_NUM
         for idx, elem in enumerate(split_str):
             elem_codes = []
             if re.search(r"\W", elem) or elem.lower() in self._codes.IGNORABLE:
                 codes.append(elem)
-                mask.append("0" * len(elem))
+                mask.append(b"0" * len(elem))
+                if owners is not None:
+                    owners += [None] * len(elem)
                 continue
             prev = split_str[idx - 1].lower() if idx != 0 else ""
             nxt = split_str[idx + 1].lower() if idx < len(split_str) - 1 else ""
-            exp = prev + elem.lower() + nxt
-            for code in self._codes.BASIC_CODES.keys():
-                if self._codes.get_type(code) in self._matched_types:
-                    continue
-                match = re.search(self._codes.get_regex(code, "True"), exp)
-                if not match:
-                    match = re.search(self._codes.get_regex(code, "True"), elem.lower())
-                if match:
-                    elem_codes.append(
-                        (
-                            code,
-                            match.span()[1] - match.span()[0],
-                            self._codes.get_type(code),
-                        )
-                    )
+            if context.trace is None:
+                scanned = self._codes.scan_token(elem, prev, nxt)
+            else:
+                scanned = self._traced_scan(elem, prev, nxt, context.trace)
+            for candidate in scanned:
+                if (
+                    candidate.type not in context.matched_types
+                    and candidate.type is not excluded
+                ):
+                    elem_codes.append(candidate)
             if len(set([i[1] for i in elem_codes])) != 1:
                 elem_codes = sorted(elem_codes, key=lambda el: el[1], reverse=True)
             if not any(elem_codes):
                 codes.append(elem)
-                mask.append("0" * len(elem))
+                mask.append(b"0" * len(elem))
+                if owners is not None:
+                    owners += [None] * len(elem)
                 continue
             codes.append(elem_codes[0][0])
-            mask.append("1" * len(elem_codes[0][0]))
+            mask.append(b"1" * len(elem_codes[0][0]))
+            if owners is not None:
+                # all the candidates of the token are kept, as the alternatives filter them by the types on their own
+                owners += [len(context.choices)] * len(elem_codes[0][0])
+                options = sorted(
+                    (c for c in scanned if c.type is not excluded),
+                    key=lambda el: el[1],
+                    reverse=True,
+                )
+                context.choices.append(EncodingChoice(tuple(options), None))
 
-            self._matched_types.append(elem_codes[0][2])
+            context.matched_types.append(elem_codes[0][2])
 
-        full_mask = "".join(mask)
         if str_span:
-            self._matched_mask = (
-                self._matched_mask[: str_span[0]]
-                + full_mask
-                + self._matched_mask[str_span[1] :]
-            )
+            context.matched_mask[str_span[0] : str_span[1]] = b"".join(mask)
+            if owners is not None:
+                context.owners[str_span[0] : str_span[1]] = owners
 
         return "".join(codes)
 
-    def _retrieve_unmatched(self, s: str) -> List[Tuple[str, Tuple[int, int]]]:
+    def _traced_scan(
+        self, elem: str, prev: str, nxt: str, trace: EncodingTrace
+    ) -> Tuple[CodeCandidate, ...]:
+        """
+        Method responsible for scanning the token, and recording the scan in the trace of the encoding. Counters of
+        the scanner are shared by the users of the codes container, so with many threads the counts are approximate.
+
+        Parameters
+        ----------
+        elem: `str`
+            Token to be scanned.
+
+        prev: `str`
+            Token preceding the scanned one.
+
+        nxt: `str`
+            Token following the scanned one.
+
+        trace: `EncodingTrace`
+            Measurements of the encoding.
+
+        Returns
+        -------
+        `Tuple`[`CodeCandidate`, ...]
+            All matching codes, in order of `BASIC_CODES`.
+
+        """
+        before = self._codes.scan_counters()
+        scanned = trace.timed("code_scan", self._codes.scan_token, elem, prev, nxt)
+        after = self._codes.scan_counters()
+        trace.token_scans += 1
+        trace.token_scan_hits += after.hits - before.hits
+        trace.regex_evaluations += after.regex_evaluations - before.regex_evaluations
+        return scanned
+
+    def _retrieve_unmatched(
+        self, s: str, context: EncodingContext
+    ) -> List[Tuple[str, Tuple[int, int]]]:
         """
         Method responsible for retrieving unmatched parts of the input string, and returns them as a list of tuples,
         containing unmatched part of string and its span (as a tuple of integers).
@@ -190,6 +419,9 @@ class Recognizer:
         s: `str`
             Input string.
 
+        context: `EncodingContext`
+            Working state of the encoding.
+
         Returns
         -------
         `List`[`Tuple`[`str`, `Tuple`[`int`, `int`]]]
@@ -200,12 +432,17 @@ class Recognizer:
         """
         return [
             (s[r.span()[0]:r.span()[1]], r.span())
-            for r in re.finditer("0+", self._matched_mask)
+            for r in self._UNMATCHED.finditer(context.matched_mask)
         ]
 
     def encode_format(self, encoded_string: str) -> str:
         """
-        Method responsible for encoding the user input string, using strf-codes.
+        Method responsible for encoding the user input string, using strf-codes. If the shape cache is enabled, inputs
+        of already encoded shape are served from the cache. Result is stored in the cache only if the shape decides it:
+        the input is ASCII, common formats matched entire runs of digits, and no digits were left in the result.
+        Otherwise, the full recognition is performed on every call. If the instrumentation is enabled, the encoding is
+        measured and recorded by the stats collector.
+
         Parameters
         ----------
         encoded_string: `str`:
@@ -217,42 +454,421 @@ class Recognizer:
             Input string encoded with the proper strf-codes.
 
         """
-        self._matched_types = []  # reset types container
-        # self._matched_mask indicates which signs of the input text were matched with specific strf-codes
+        return self._encode_format(encoded_string, self._shape_cache).format
+
+    def _encode_format(
+        self, encoded_string: str, shape_cache: Optional[LRUCache]
+    ) -> EncodedFormat:
+        """
+        Method responsible for encoding the user input string, using strf-codes, as described in `encode_format`, with
+        the given shape cache. If the instrumentation is enabled, the encoding is measured and recorded.
+
+        Parameters
+        ----------
+        encoded_string: `str`:
+            Input text to be encoded using specific strf-codes.
+
+        shape_cache: Optional[`LRUCache`]
+            Cache of the results by the shape of the input. None disables the cache.
+
+        Returns
+        -------
+        `EncodedFormat`
+            Input string encoded with the proper strf-codes, with the mask and the types of the encoding.
+
+        """
+        if self.stats is not None:
+            trace = EncodingTrace(encoded_string)
+            encoded = trace.timed(
+                "total", self._encode_string, encoded_string, shape_cache, trace
+            )
+            self.stats.record(trace)
+            return encoded
+        return self._encode_string(encoded_string, shape_cache)
+
+    def _encode_string(
+        self,
+        encoded_string: str,
+        shape_cache: Optional[LRUCache],
+        trace: Optional[EncodingTrace] = None,
+    ) -> EncodedFormat:
+        """
+        Method responsible for encoding the user input string, using strf-codes, as described in `encode_format`.
+
+        Parameters
+        ----------
+        encoded_string: `str`:
+            Input text to be encoded using specific strf-codes.
+
+        shape_cache: Optional[`LRUCache`]
+            Cache of the results by the shape of the input. None disables the cache.
+
+        trace: Optional[`EncodingTrace`], default None
+            Measurements of the encoding, if the instrumentation is enabled.
+
+        Returns
+        -------
+        `EncodedFormat`
+            Input string encoded with the proper strf-codes, with the mask and the types of the encoding.
+
+        """
+        shape = None
+        if shape_cache is not None:
+            shape = self._codes.get_shape(encoded_string)
+            if shape is not None:
+                encoded = shape_cache.get(shape)
+                if encoded is not None:
+                    if trace is not None:
+                        trace.shape_cache_hit = True
+                    return encoded
+
+        # context.matched_mask indicates which signs of the input text were matched with specific strf-codes
         # 0 means unmatched sign; 1 means matched sign
-        self._matched_mask = "0" * len(
-            encoded_string
-        )  # reset mask, set its length to the length of the input string
-        encoded_string = self._match_patterns(encoded_string)
-        encoded_string = self._recognize_single_codes(encoded_string)
-        return encoded_string
+        context = EncodingContext(
+            matched_mask=bytearray(b"0" * len(encoded_string)), trace=trace
+        )
+        if trace is None:
+            encoded_string = self._match_patterns(encoded_string, context)
+        else:
+            encoded_string = trace.timed(
+                "match_patterns", self._match_patterns, encoded_string, context
+            )
+        shape_decisive = context.whole_runs_matched and (
+            len(context.matched_mask) == len(encoded_string)
+            or not re.search("[0-9]", encoded_string)
+        )
+        if trace is None:
+            encoded_string = self._recognize_single_codes(encoded_string, context)
+        else:
+            encoded_string = trace.timed(
+                "single_codes", self._recognize_single_codes, encoded_string, context
+            )
+        encoded = EncodedFormat(
+            encoded_string, bytes(context.matched_mask), tuple(context.matched_types)
+        )
+        # inputs of the same shape have the same length, and are rewritten the same way, so they share the mask too
+        if (
+            shape is not None
+            and shape_decisive
+            and not re.search("[0-9]", encoded_string)
+        ):
+            shape_cache.put(shape, encoded)
+        return encoded
+
+    def shape_cache_info(self) -> Optional[CacheInfo]:
+        """
+        Method responsible for retrieving the statistics of the shape cache.
+
+        Returns
+        -------
+        `Optional`[`CacheInfo`]
+            Statistics of the shape cache, or None if the cache is disabled.
+
+        """
+        return self._shape_cache.info() if self._shape_cache is not None else None
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """
+        Method responsible for retrieving the statistics of all the caches used by the recognizer: memos of the codes
+        container, and the shape cache (under "shape" key), if enabled.
+
+        Returns
+        -------
+        `Dict`[`str`, `CacheInfo`]
+            Dictionary mapping the names of the caches to their statistics.
+
+        """
+        info = self._codes.cache_info()
+        if self._shape_cache is not None:
+            info["shape"] = self._shape_cache.info()
+        return info
+
+    def cache_clear(self) -> None:
+        """
+        Method responsible for clearing all the caches used by the recognizer, and resetting their statistics.
+
+        """
+        self._codes.cache_clear()
+        if self._shape_cache is not None:
+            self._shape_cache.clear()
+
+    def encode_format_candidates(
+        self, encoded_string: str
+    ) -> Iterator[FormatCandidate]:
+        """
+        Method responsible for encoding the user input string, using strf-codes, into the ranked candidate formats.
+        The first candidate is the result of `encode_format`. The following ones are its alternatives, generated
+        lazily, so the caller may stop after any number of them.
+
+        The encoding is performed once, recording each decision with its alternatives: the common formats matching
+        the same part of the input, and the single codes found for the token. Alternatives are combined from those
+        records, without encoding the input again. Single codes of the same type can't repeat, so choosing an
+        alternative for one token may rule out the candidates of the others. Cost of the candidate is the sum of the
+        positions of its options, in the order preferred by the recognizer, and its score is 1 / (1 + cost).
+
+        Parameters
+        ----------
+        encoded_string: `str`:
+            Input text to be encoded using specific strf-codes.
+
+        Returns
+        -------
+        `Iterator`[`FormatCandidate`]
+            Distinct candidate formats, from the best one.
+
+        """
+        context = EncodingContext(
+            matched_mask=bytearray(b"0" * len(encoded_string)),
+            choices=[],
+            owners=[None] * len(encoded_string),
+        )
+        encoded = self._match_patterns(encoded_string, context)
+        encoded = self._recognize_single_codes(encoded, context)
+
+        # spans of the choices in the result; choices without a single span of their option are fixed
+        spans: Dict[int, List[int]] = {}
+        for position, owner in enumerate(context.owners):
+            if owner is not None:
+                spans.setdefault(owner, [position, position])[1] = position + 1
+        # options chosen by the recognizer are the first ones, after the filtering by the taken types
+        chosen = self._select_options(context.choices, (0,) * len(context.choices))
+        choices = []
+        for idx, choice in enumerate(context.choices):
+            start, end = spans.get(idx, (0, 0))
+            owned = context.owners[start:end].count(idx) == end - start
+            if owned and encoded[start:end] == chosen[idx]:
+                choices.append(((start, end), choice))
+                continue
+            # choice, which can't be located in the result, keeps its option, and its types stay taken
+            types = choice.types or (self._codes.get_type(chosen[idx]),)
+            choices.append((None, EncodingChoice((chosen[idx],), types)))
+
+        return self._rank_candidates(encoded, choices)
+
+    def _rank_candidates(
+        self,
+        encoded: str,
+        choices: List[Tuple[Optional[Tuple[int, int]], EncodingChoice]],
+    ) -> Iterator[FormatCandidate]:
+        """
+        Method responsible for enumerating the combinations of the options of the choices, in order of their cost.
+        Combination is a tuple of the positions of the options of each choice.
+
+        Parameters
+        ----------
+        encoded: `str`
+            Result of the encoding.
+
+        choices: `List`[`Tuple`[Optional[`Tuple`[`int`, `int`]], `EncodingChoice`]]
+            Choices of the encoding, in order of the encoding, together with their spans in the result. Choices without
+            the span keep their option.
+
+        Returns
+        -------
+        `Iterator`[`FormatCandidate`]
+            Distinct candidate formats, from the best one.
+
+        """
+        layout = sorted(
+            (span, idx) for idx, (span, _) in enumerate(choices) if span is not None
+        )
+        initial = (0,) * len(choices)
+        heap = [(0, initial)]
+        visited = {initial}
+        yielded = set()
+        while heap:
+            cost, combination = heapq.heappop(heap)
+            selected = self._select_options(
+                [choice for _, choice in choices], combination
+            )
+            if selected is not None:
+                pieces = []
+                position = 0
+                for (start, end), idx in layout:
+                    pieces += [encoded[position:start], selected[idx]]
+                    position = end
+                encoded_format = "".join(pieces) + encoded[position:]
+                if encoded_format not in yielded:
+                    yielded.add(encoded_format)
+                    yield FormatCandidate(encoded_format, 1 / (1 + cost))
+            for idx, (_, choice) in enumerate(choices):
+                if combination[idx] + 1 < len(choice.options):
+                    following = (
+                        combination[:idx]
+                        + (combination[idx] + 1,)
+                        + combination[idx + 1 :]
+                    )
+                    if following not in visited:
+                        visited.add(following)
+                        heapq.heappush(heap, (cost + 1, following))
 
     @staticmethod
-    @functools.lru_cache
-    def _check_string_group(sign: str) -> str:
+    def _select_options(
+        choices: List[EncodingChoice], combination: Tuple[int, ...]
+    ) -> Optional[List[str]]:
         """
-        Method returns name of the group of signs, that tested element bellows to. The input sign is tested against
-        its membership to 4 basic groups of signs: digits, letters, punctuation signs and whitespaces.
+        Method responsible for selecting the options of the choices, given by the combination. Options of the single
+        codes are counted among the candidates of the token, which types are not taken by the preceding choices, the
+        same way as the recognizer filters them.
 
         Parameters
         ----------
-        sign: str
-            Single sign to be tested.
+        choices: `List`[`EncodingChoice`]
+            Choices of the encoding, in order of the encoding.
+
+        combination: `Tuple`[`int`, ...]
+            Positions of the selected options.
 
         Returns
         -------
-        `str`
-            Name of the specific group, that the tested element belongs to.
+        `Optional`[`List`[`str`]]
+            Selected options, in order of the choices, or None if the combination is not valid.
 
         """
-        if len(sign) != 1:
-            raise ValueError("S must be a single sign.")
+        selected = []
+        taken = set()
+        for choice, position in zip(choices, combination):
+            if choice.types is not None:
+                selected.append(choice.options[position])
+                taken.update(choice.types)
+                continue
+            available = [
+                option for option in choice.options if option.type not in taken
+            ]
+            if position >= len(available):
+                return None
+            selected.append(available[position].code)
+            taken.add(available[position].type)
+        return selected
+
+    def encode_formats(
+        self, encoded_strings: Iterable[str], workers: int = 1, chunk_size: int = 10000
+    ) -> List[str]:
+        """
+        Method responsible for encoding multiple input strings, using strf-codes. Compiled tables of the codes are
+        shared by the whole batch. Results of the recent `BATCH_CACHE_SIZE` distinct inputs are remembered, so repeated
+        inputs are encoded only once. If the shape cache of the recognizer is disabled, the batch uses its own one, of
+        the same size, released at the end of the call. With more than one worker, input is split into chunks, encoded
+        in a pool of processes.
+
+        Parameters
+        ----------
+        encoded_strings: `Iterable`[`str`]
+            Input texts to be encoded using specific strf-codes.
+
+        workers: `int`, default 1
+            Number of worker processes. 1 encodes the input in the current process.
+
+        chunk_size: `int`, default 10000
+            Number of input strings sent to a worker process at once.
+
+        Returns
+        -------
+        `List`[`str`]
+            Input strings encoded with the proper strf-codes, in the input order.
+
+        """
+        if workers > 1:
+            results = []
+            for chunk in self._encode_parallel(encoded_strings, workers, chunk_size):
+                results += chunk
+            return results
+
+        encoded = LRUCache(self.BATCH_CACHE_SIZE)
+        shape_cache = self._shape_cache
+        if shape_cache is None:
+            shape_cache = LRUCache(self.BATCH_CACHE_SIZE)
+        results = []
+        for encoded_string in encoded_strings:
+            result = encoded.get(encoded_string)
+            if result is None:
+                result = self._encode_format(encoded_string, shape_cache).format
+                encoded.put(encoded_string, result)
+            results.append(result)
+
+        return results
+
+    def _encode_parallel(
+        self, encoded_strings: Iterable[str], workers: int, chunk_size: int
+    ) -> Iterator[List[str]]:
+        """
+        Method responsible for encoding the input strings in a pool of processes. Each worker builds its own recognizer
+        once, with a copy of the codes and the same shape cache size. Number of chunks in flight is bounded to twice
+        the number of workers, so the input is consumed lazily.
+
+        Parameters
+        ----------
+        encoded_strings: `Iterable`[`str`]
+            Input texts to be encoded using specific strf-codes.
+
+        workers: `int`
+            Number of worker processes.
 
-        for name, group in [
-            ("digits", string.digits),
-            ("letters", string.ascii_lowercase + string.ascii_uppercase),
-            ("punctuation", string.punctuation),
-            ("whitespace", string.whitespace),
-        ]:
-            if sign in group:
-                return name
+        chunk_size: `int`
+            Number of input strings sent to a worker process at once.
+
+        Returns
+        -------
+        `Iterator`[`List`[`str`]]
+            Encoded chunks, in the input order.
+
+        """
+        # imported here, as the process pool machinery noticeably slows down the import of the package
+        from concurrent.futures import ProcessPoolExecutor
+
+        iterator = iter(encoded_strings)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+        shape_cache_size = self._shape_cache.info().maxsize if self._shape_cache else 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._codes, shape_cache_size),
+        ) as executor:
+            pending = deque(
+                executor.submit(_encode_chunk, chunk)
+                for chunk in itertools.islice(chunks, 2 * workers)
+            )
+            while pending:
+                results = pending.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(executor.submit(_encode_chunk, chunk))
+                yield results
+
+
+_worker_recognizer: Optional[Recognizer] = None  # recognizer of the worker process
+
+
+def _init_worker(codes: StrfCodes, shape_cache_size: int) -> None:
+    """
+    Function responsible for initializing the worker process of the parallel encoding. Recognizer and its compiled
+    tables are built once per process.
+
+    Parameters
+    ----------
+    codes: `StrfCodes`
+        Instance of the codes container class.
+
+    shape_cache_size: `int`
+        Maximal number of shapes memoized by the shape cache of the worker.
+
+    """
+    global _worker_recognizer
+    _worker_recognizer = Recognizer(codes, shape_cache_size)
+
+
+def _encode_chunk(chunk: List[str]) -> List[str]:
+    """
+    Function responsible for encoding the chunk of input strings in the worker process.
+
+    Parameters
+    ----------
+    chunk: `List`[`str`]
+        Input texts to be encoded using specific strf-codes.
+
+    Returns
+    -------
+    `List`[`str`]
+        Input strings encoded with the proper strf-codes.
+
+    """
+    return _worker_recognizer.encode_formats(chunk)
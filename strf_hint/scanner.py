@@ -0,0 +1,433 @@
+"""
+This module contains the timestamp scanner class, responsible for finding the datetime substrings in free-form text,
+e.g. in the lines of the logs.
+
+"""
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple
+
+from strf_hint.recognizer import Recognizer
+from strf_hint.strf_codes import FieldTypes
+
+
+class TimestampMatch(NamedTuple):
+    """
+    Datetime substring found by the `TimestampScanner`.
+
+    """
+
+    start: int  # index of the first sign of the substring
+    end: int  # index following the last sign of the substring
+    text: str  # datetime substring
+    format: str  # format of the substring, encoded with the strf-codes
+
+
+class TimestampScanner:
+    """
+    Class responsible for finding all the datetime substrings of the free-form text, together with their formats.
+
+    The text is searched for anchors: substrings matching the relaxed expressions of the common formats families (e.g.
+    digit runs joined by date separators, or by colons), all of them combined into a single regular expression, which
+    starts only at digits. Text without any digits is rejected before that. Neighbouring anchors are merged, and
+    extended with the adjacent names of days, months and timezones, fractions of seconds, AM/PM and years. Regions
+    without a time, a four-digit year or a numeric date are rejected without encoding. Others are encoded by the
+    `Recognizer`, and the literal text at their edges, kept as is by the recognizer, is trimmed. Region is reported if no
+    digits are left in its format, no field is repeated in it, and it contains a year with a month, or hours with
+    minutes separated by a colon (or followed by AM/PM). Parts of the dotted numbers, like versions or IP addresses, are
+    skipped.
+
+    """
+
+    # signs allowed between the anchors of a single timestamp
+    _GAP = re.compile(r"(?:\s|[tT]|,\s?|:|\s?-\s?)")
+    # punctuation of the gaps, separating the timestamps joined into a single region
+    _SEPARATOR = re.compile(r"[,-]")
+    # word preceding the region, separated by whitespaces (with optional dot and comma), or by a date separator
+    _LEFT_WORD = re.compile(r"(?<![^\W\d_])([^\W\d_]+)(?:\.?,?\s+|[-./])$")
+    # day preceding the name of the month, e.g. "21 Nov 2023"
+    _LEFT_DAY = re.compile(r"(?<![^\W_])(\d{1,2})\.?\s+$")
+    _RIGHT_WORD = re.compile(r"\s([^\W\d_]+)\b")
+    _DIGIT = re.compile(r"\d")
+    _DIGITS = re.compile(r"[0-9]")
+    _DOTTED = re.compile(r"\d\.\d")
+    # anchors of the dates with the names of months, tried before the families: the year following a word (e.g. the
+    # name of the month attached by `_extend_left`), not starting a numeric date, and the ordinal day
+    _NAME_DATE_ANCHORS = (
+        r"(?<=[^\W\d_]\s)\d{4}(?![-./,:]\d)",
+        r"\d{1,2}(?:st|nd|rd|th)",
+    )
+    # milliseconds following the seconds, e.g. of the Python logging, encoded as the fraction of the second
+    _MILLISECONDS = re.compile(r"(?<=:\d\d[.,])\d{3}(?!\d)")
+    # region is encoded only if it contains a time, a four-digit year, or a numeric date
+    _EVIDENCE = re.compile(
+        r"\d:\d|(?<!\d)\d{4}(?!\d)|\d\s?[ap]m|\d[-./]\d{1,2}[-./]\d", re.IGNORECASE
+    )
+    # types of the words attached to the regions
+    LEFT_TYPES = frozenset([FieldTypes.DAY_NAME, FieldTypes.MONTH_NAME])
+    MONTH_TYPES = frozenset([FieldTypes.MONTH_NAME])
+    RIGHT_TYPES = frozenset([FieldTypes.TIMEZONE])
+
+    def __init__(self, recognizer: Optional[Recognizer] = None):
+        """
+        Initialization of the `TimestampScanner` class.
+
+        Parameters
+        ----------
+        recognizer: Optional[`Recognizer`], default None
+            Recognizer used to encode the found substrings. By default, recognizer with the shape cache enabled.
+
+        """
+        self._recognizer = recognizer or Recognizer(shape_cache_size=4096)
+        codes = self._recognizer._codes
+        self._codes = codes
+        families = dict.fromkeys(self._NAME_DATE_ANCHORS)
+        for entry in codes.common_formats:
+            parts = codes.relax_format_parts(entry.format)
+            # leading name, together with its separator, is attached back by `_extend_left`
+            if codes.get_type(parts[0][0]) in codes.NAME_TYPES:
+                parts = parts[2:]
+            # AM/PM is matched exactly, instead of any run of letters
+            family = "".join(
+                f"(?:{codes.get_regex(part)})"
+                if codes.get_type(part) == FieldTypes.AM_PM
+                else relaxed
+                for part, relaxed in parts
+            )
+            families[family] = None
+        # anchors start with a digit at the word boundary, or at the "T" of ISO 8601 between date and time
+        self._anchors = re.compile(
+            rf"(?=\d)(?:(?<=\dt)|(?<![^\W_]))(?:{'|'.join(families)})"
+            r"(?:(?=t\d)|(?![^\W_]))",
+            re.IGNORECASE,
+        )
+        self._suffixes: List[Pattern] = [
+            re.compile(rf"[.,](?:{codes.get_regex('%f')}|(?<=:\d\d[.,])\d{{3}})(?!\d)"),
+            re.compile(rf"\s?(?:{codes.get_regex('%p')})\b", re.IGNORECASE),
+            re.compile(rf"\s(?:{codes.get_regex('%Y')})(?![\d:]|[-./,]\d)"),
+        ]
+
+    def scan(self, s: str) -> List[TimestampMatch]:
+        """
+        Method responsible for finding all the datetime substrings of the text.
+
+        Parameters
+        ----------
+        s: `str`
+            Free-form text, e.g. a line of the log.
+
+        Returns
+        -------
+        `List`[`TimestampMatch`]
+            Found datetime substrings, in order of the text.
+
+        """
+        if not self._DIGIT.search(s):
+            return []
+
+        found = []
+        for start, end, gaps in self._regions(s):
+            found += self._verify(s, start, end, gaps)
+
+        return found
+
+    def scan_lines(self, lines: Iterable[str]) -> Iterator[Tuple[int, TimestampMatch]]:
+        """
+        Method responsible for finding the datetime substrings of all the lines.
+
+        Parameters
+        ----------
+        lines: `Iterable`[`str`]
+            Lines of the text, e.g. an opened log file.
+
+        Returns
+        -------
+        `Iterator`[`Tuple`[`int`, `TimestampMatch`]]
+            Tuples containing the line number and the found substring of the line.
+
+        """
+        for line_no, line in enumerate(lines, 1):
+            for match in self.scan(line.rstrip("\r\n")):
+                yield line_no, match
+
+    def _regions(self, s: str) -> Iterator[Tuple[int, int, List[Tuple[int, int]]]]:
+        """
+        Method responsible for finding the regions of the text, that may contain the timestamps. Anchors separated only
+        by the allowed gaps, also after extending the following anchor with the preceding words, are merged into a
+        single region. Gaps are kept, to split the region, if it turns out to join many timestamps.
+
+        Parameters
+        ----------
+        s: `str`
+            Free-form text.
+
+        Returns
+        -------
+        `Iterator`[`Tuple`[`int`, `int`, `List`[`Tuple`[`int`, `int`]]]]
+            Spans of the regions, extended with the adjacent words, fractions of seconds, AM/PM and years, together
+            with the spans of the gaps between their anchors.
+
+        """
+        region = None
+        gaps: List[Tuple[int, int]] = []
+        for anchor in self._anchors.finditer(s):
+            start, end = anchor.span()
+            if region is not None:
+                gap = None
+                if start > region[1]:
+                    gap = self._GAP.fullmatch(s, region[1], start)
+                    if gap is None:
+                        left = self._extend_left(s, start)
+                        gap = self._GAP.fullmatch(s, region[1], left)
+                if start <= region[1] or gap:
+                    if gap:
+                        gaps.append(gap.span())
+                    region = (region[0], max(region[1], self._extend_right(s, end)))
+                    continue
+                yield self._extend_left(s, region[0]), region[1], gaps
+                gaps = []
+            region = (start, self._extend_right(s, end))
+
+        if region is not None:
+            yield self._extend_left(s, region[0]), region[1], gaps
+
+    def _extend_left(self, s: str, start: int) -> int:
+        """
+        Method responsible for extending the region with the preceding names of days and months, and the day of the
+        month preceding the name of the month.
+
+        Parameters
+        ----------
+        s: `str`
+            Free-form text.
+
+        start: `int`
+            Start of the region.
+
+        Returns
+        -------
+        `int`
+            Start of the extended region.
+
+        """
+        while True:
+            word = self._LEFT_WORD.search(s, max(0, start - 16), start)
+            if word is None or not self._is_name(word.group(1), self.LEFT_TYPES):
+                return start
+            start = word.start(1)
+            day = self._LEFT_DAY.search(s, max(0, start - 8), start)
+            if day is not None and self._is_name(word.group(1), self.MONTH_TYPES):
+                start = day.start(1)
+
+    def _extend_right(self, s: str, end: int) -> int:
+        """
+        Method responsible for extending the region with the following fraction of the second, AM/PM, year and timezone
+        name. Each of them is attached once, in this order.
+
+        Parameters
+        ----------
+        s: `str`
+            Free-form text.
+
+        end: `int`
+            End of the region.
+
+        Returns
+        -------
+        `int`
+            End of the extended region.
+
+        """
+        for suffix in self._suffixes:
+            match = suffix.match(s, end)
+            if match:
+                end = match.end()
+        word = self._RIGHT_WORD.match(s, end)
+        if word is not None and self._is_name(word.group(1), self.RIGHT_TYPES):
+            end = word.end()
+        return end
+
+    def _is_name(self, word: str, types: frozenset) -> bool:
+        """
+        Method responsible for checking, if the whole word is a name of one of the given types.
+
+        Parameters
+        ----------
+        word: `str`
+            Single word.
+
+        types: `frozenset`
+            Accepted types of the names.
+
+        Returns
+        -------
+        `bool`
+            True, if the word is a name of one of the types.
+
+        """
+        word = word.lower()
+        return any(
+            candidate.length == len(word) and candidate.type in types
+            for candidate in self._codes.name_index.find(word).values()
+        )
+
+    def _verify(
+        self, s: str, start: int, end: int, gaps: List[Tuple[int, int]]
+    ) -> List[TimestampMatch]:
+        """
+        Method responsible for encoding the region, trimming the literal text at its edges, and checking if the rest is
+        a timestamp. Region with a repeated field joins many timestamps, so it is split at its gaps by `_split`, and each
+        part is verified on its own.
+
+        Parameters
+        ----------
+        s: `str`
+            Free-form text.
+
+        start: `int`
+            Start of the region.
+
+        end: `int`
+            End of the region.
+
+        gaps: `List`[`Tuple`[`int`, `int`]]
+            Spans of the gaps between the anchors of the region.
+
+        Returns
+        -------
+        `List`[`TimestampMatch`]
+            Found datetime substrings, empty if the region contains no timestamp.
+
+        """
+        text = s[start:end]
+        if not self._EVIDENCE.search(text):
+            return []
+        # milliseconds are padded to the microseconds, which the format of the text (%f) matches as well
+        encoded = self._recognizer.encode_format(
+            self._MILLISECONDS.sub(r"\g<0>000", text)
+        )
+        head, tail = self._literal_edges(text, encoded)
+        region = (start, end)
+        if head or tail:
+            text = text[head : len(text) - tail]
+            encoded = encoded[head : len(encoded) - tail]
+            start, end = start + head, end - tail
+        if (
+            not text
+            or self._DOTTED.match(s, max(0, start - 2), start + 1)
+            or self._DOTTED.match(s, end - 1, end + 2)
+        ):
+            return []
+
+        types = self._codes.get_format_types(encoded)
+        # digits left in the format, or a repeated field, mean more than one timestamp, joined into a single region
+        if self._DIGITS.search(encoded) or len(set(types)) < len(types):
+            return self._split(s, *region, gaps)
+        if (FieldTypes.YEAR in types and FieldTypes.MONTH_NUM in types) or (
+            FieldTypes.YEAR in types and FieldTypes.MONTH_NAME in types
+        ):
+            return [TimestampMatch(start, end, text, encoded)]
+        if (
+            FieldTypes.HOURS in types
+            and FieldTypes.MINUTES in types
+            and (":" in encoded or FieldTypes.AM_PM in types)
+        ):
+            return [TimestampMatch(start, end, text, encoded)]
+        return []
+
+    def _split(
+        self, s: str, start: int, end: int, gaps: List[Tuple[int, int]]
+    ) -> List[TimestampMatch]:
+        """
+        Method responsible for splitting the region, that joins many timestamps, and verifying its parts. Region is
+        split at all the gaps with punctuation (commas and dashes), which separate the timestamps. Otherwise the gaps
+        may join the date with the time, so the longest run of anchors from the left, that is a single timestamp, is
+        taken, and the rest is split again. Run is extended only until it fails, so each anchor is encoded a bounded
+        number of times.
+
+        Parameters
+        ----------
+        s: `str`
+            Free-form text.
+
+        start: `int`
+            Start of the region.
+
+        end: `int`
+            End of the region.
+
+        gaps: `List`[`Tuple`[`int`, `int`]]
+            Spans of the gaps between the anchors of the region.
+
+        Returns
+        -------
+        `List`[`TimestampMatch`]
+            Found datetime substrings of the parts.
+
+        """
+        if not gaps:
+            return []
+        found = []
+        cuts = [gap for gap in gaps if self._SEPARATOR.search(s, *gap)]
+        if cuts:
+            bounds = [start] + [bound for gap in cuts for bound in gap] + [end]
+            for part_start, part_end in zip(bounds[::2], bounds[1::2]):
+                inner = [gap for gap in gaps if part_start < gap[0] < part_end]
+                found += self._verify(s, part_start, part_end, inner)
+            return found
+
+        starts = [start] + [gap_end for _, gap_end in gaps]
+        ends = [gap_start for gap_start, _ in gaps] + [end]
+        first = 0
+        while first < len(starts):
+            last, matches = first, []
+            for stop in range(first, len(ends)):
+                extended = self._verify(s, starts[first], ends[stop], [])
+                if not extended:
+                    break
+                last, matches = stop, extended
+            found += matches
+            first = last + 1
+        return found
+
+    @staticmethod
+    def _literal_edges(text: str, encoded: str) -> Tuple[int, int]:
+        """
+        Method responsible for measuring the literal text at the edges of the region, kept as is by the recognizer.
+        Literal edges are the common prefix and suffix of the text and its format, without digits and strf-codes,
+        trimmed to the word boundaries.
+
+        Parameters
+        ----------
+        text: `str`
+            Text of the region.
+
+        encoded: `str`
+            Format of the region.
+
+        Returns
+        -------
+        `Tuple`[`int`, `int`]
+            Lengths of the literal prefix and suffix.
+
+        """
+        limit = min(len(text), len(encoded))
+        head = 0
+        while head < limit and text[head] == encoded[head] and not text[head].isdigit():
+            head += 1
+        # the prefix ends before the first sign of a word, that is partially literal
+        while (
+            0 < head < len(text) and text[head - 1].isalpha() and text[head].isalpha()
+        ):
+            head -= 1
+
+        tail = 0
+        while (
+            tail < limit - head
+            and text[-tail - 1] == encoded[-tail - 1]
+            and not text[-tail - 1].isdigit()
+        ):
+            tail += 1
+        # the suffix can't take the letter of a strf-code, e.g. the "p" of "%p"
+        while tail and encoded[: len(encoded) - tail].endswith(("%", "%-")):
+            tail -= 1
+        return head, tail
@@ -0,0 +1,134 @@
+"""
+This module contains the encoding session class, responsible for encoding the input edited step by step, e.g. typed
+by the user into a form field.
+
+"""
+from typing import NamedTuple, Optional, Tuple
+
+from strf_hint.cache import CacheInfo, LRUCache
+from strf_hint.recognizer import Recognizer
+from strf_hint.strf_codes import FieldTypes
+
+
+class SessionState(NamedTuple):
+    """
+    Encoding of a single version of the input, kept by the `EncodingSession`.
+
+    """
+
+    text: str  # input text
+    result: str  # input encoded with the strf-codes
+    matched_mask: bytes  # mask of the result, b"1" for the signs of the strf-codes
+    matched_types: Tuple[FieldTypes, ...]  # types of the recognized strf-codes
+
+
+class EncodingSession:
+    """
+    Class responsible for encoding the successive versions of the input, e.g. on every keystroke of the user. Each
+    update is encoded the same way as by `Recognizer.encode_format`, with its shape cache and instrumentation, so the
+    result is exactly the same.
+
+    Encoding of a short input takes tens of microseconds, once the tables of the codes are built, and the regular
+    expressions are compiled. Session prepares all of them up front, so no keystroke pays for them. Encodings of the
+    recent versions are kept, so deleting or undoing an edit doesn't encode the input again. Any other version is
+    encoded from scratch: the mask and the types of the state describe the result, they are not reused by the next
+    update.
+
+    Session keeps the state of the edited input, so it should not be shared between threads.
+
+    """
+
+    def __init__(
+        self,
+        recognizer: Optional[Recognizer] = None,
+        history_size: int = 64,
+        warm_up: bool = True,
+    ):
+        """
+        Initialization of the `EncodingSession` class.
+
+        Parameters
+        ----------
+        recognizer: Optional[`Recognizer`], default None
+            Recognizer used to encode the input. New instance is created, if not given.
+
+        history_size: `int`, default 64
+            Maximal number of the recent versions of the input, whose encodings are kept. 0 disables the history.
+
+        warm_up: `bool`, default True
+            Indicates if the tables of the codes are built, and the common formats are compiled, on initialization.
+            It is done once per codes container, so the sessions sharing the recognizer pay for it once.
+
+        """
+        self._recognizer = recognizer or Recognizer()
+        self._history = LRUCache(history_size) if history_size else None
+        self._state: Optional[SessionState] = None
+        if warm_up:
+            codes = self._recognizer._codes
+            for idx in range(len(codes.common_formats)):
+                codes.common_format_pattern(idx)
+            # encoded without the shape cache and the instrumentation, so the warm-up is not recorded
+            self._recognizer._encode_string("0", None)
+
+    @property
+    def state(self) -> Optional[SessionState]:
+        """
+        Encoding of the last version of the input, None before the first update.
+
+        """
+        return self._state
+
+    def update(self, text: str) -> str:
+        """
+        Method responsible for encoding the new version of the input.
+
+        Parameters
+        ----------
+        text: `str`
+            Current version of the input text.
+
+        Returns
+        -------
+        `str`
+            Input string encoded with the proper strf-codes.
+
+        """
+        if self._state is not None and self._state.text == text:
+            return self._state.result
+        state = self._history.get(text) if self._history is not None else None
+        if state is None:
+            state = self._encode(text)
+            if self._history is not None:
+                self._history.put(text, state)
+        self._state = state
+        return state.result
+
+    def history_info(self) -> Optional[CacheInfo]:
+        """
+        Method responsible for retrieving the statistics of the history of the session.
+
+        Returns
+        -------
+        Optional[`CacheInfo`]
+            Statistics of the history, None if it is disabled.
+
+        """
+        return self._history.info() if self._history is not None else None
+
+    def _encode(self, text: str) -> SessionState:
+        """
+        Method responsible for encoding the input with the recognizer, keeping the mask and the types of the encoding.
+
+        Parameters
+        ----------
+        text: `str`
+            Input text.
+
+        Returns
+        -------
+        `SessionState`
+            Encoding of the input.
+
+        """
+        encoded = self._recognizer._encode_format(text, self._recognizer._shape_cache)
+        return SessionState(text, *encoded)
@@ -0,0 +1,168 @@
+"""
+This module contains the instrumentation classes, used to measure the phases of the encoding.
+
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+
+class EncodingTrace:
+    """
+    Measurements of a single encoding. Times are given in seconds. Time of the code scans is included in the time of
+    the single codes recognition.
+
+    """
+
+    # counters of the trace, with their initial values
+    COUNTERS = {
+        "total": 0.0,  # time of the whole encoding
+        "match_patterns": 0.0,  # time of the common patterns recognition
+        "single_codes": 0.0,  # time of the single codes recognition
+        "code_scan": 0.0,  # time of the per-code regex scans of the tokens
+        "pattern_searches": 0,  # number of common patterns searched in the input
+        "regex_evaluations": 0,  # number of code regexes evaluated by the token scans
+        "token_scans": 0,  # number of tokens scanned
+        "token_scan_hits": 0,  # number of token scans served from the memo
+        "revisits": 0,  # number of unmatched spans revisited by single codes recognition
+        "shape_cache_hit": False,  # indicates if the result came from the shape cache
+    }
+    __slots__ = ("input", *COUNTERS)
+
+    def __init__(self, input: str, **counters):
+        """
+        Initialization of the `EncodingTrace` class.
+
+        Parameters
+        ----------
+        input: `str`
+            Encoded input string.
+
+        counters:
+            Initial values of the counters, the missing ones start from the values of `COUNTERS`.
+
+        """
+        self.input = input
+        for name, value in self.COUNTERS.items():
+            setattr(self, name, counters.pop(name, value))
+        if counters:
+            raise TypeError(f"Unknown counters: {', '.join(counters)}.")
+
+    def __repr__(self) -> str:
+        counters = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.COUNTERS
+        )
+        return f"EncodingTrace(input={self.input!r}, {counters})"
+
+    def timed(self, phase: str, func: Callable, *args) -> Any:
+        """
+        Method responsible for calling the function, and adding the time of the call to the given phase.
+
+        Parameters
+        ----------
+        phase: `str`
+            Name of the phase, as the attribute of the trace.
+
+        func: `Callable`
+            Function to be called.
+
+        args:
+            Arguments of the function.
+
+        Returns
+        -------
+        `Any`
+            Result of the function.
+
+        """
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            setattr(self, phase, getattr(self, phase) + time.perf_counter() - started)
+
+
+class RecognizerStats:
+    """
+    Thread-safe collector of the encoding traces, passed to the `Recognizer` to enable the instrumentation. Totals of
+    the counters and times are accumulated, and the slowest encodings are kept, to point out the pathological inputs.
+
+    Subclasses may override `record`, to handle each trace as it comes, e.g. to log the slow inputs.
+
+    """
+
+    def __init__(self, slowest: int = 10):
+        """
+        Initialization of the `RecognizerStats` class.
+
+        Parameters
+        ----------
+        slowest: `int`, default 10
+            Number of the slowest encodings kept.
+
+        """
+        self._slowest_size = slowest
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Method responsible for discarding all the recorded traces.
+
+        """
+        with self._lock:
+            self._encodings = 0
+            self._totals = dict(EncodingTrace.COUNTERS, shape_cache_hit=0)
+            # heap of (total time, order, trace), order breaks the ties of times
+            self._slowest: List[tuple] = []
+            self._order = itertools.count()
+
+    def record(self, trace: EncodingTrace) -> None:
+        """
+        Method responsible for recording the trace of the finished encoding.
+
+        Parameters
+        ----------
+        trace: `EncodingTrace`
+            Measurements of the encoding.
+
+        """
+        with self._lock:
+            self._encodings += 1
+            for name in self._totals:
+                self._totals[name] += getattr(trace, name)
+            if self._slowest_size > 0:
+                entry = (trace.total, next(self._order), trace)
+                if len(self._slowest) < self._slowest_size:
+                    heapq.heappush(self._slowest, entry)
+                else:
+                    heapq.heappushpop(self._slowest, entry)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Method responsible for retrieving the totals of all the recorded traces.
+
+        Returns
+        -------
+        `Dict`[`str`, `float`]
+            Number of the recorded encodings (under "encodings" key), and the totals of the trace counters and times.
+            "shape_cache_hit" is the number of encodings served from the shape cache.
+
+        """
+        with self._lock:
+            return {"encodings": self._encodings, **self._totals}
+
+    def slowest(self) -> List[EncodingTrace]:
+        """
+        Method responsible for retrieving the traces of the slowest encodings.
+
+        Returns
+        -------
+        `List`[`EncodingTrace`]
+            Traces of the slowest encodings, from the slowest one.
+
+        """
+        with self._lock:
+            return [trace for _, _, trace in sorted(self._slowest, reverse=True)]
@@ -0,0 +1,170 @@
+"""
+This module contains the stream encoder class, responsible for encoding the text and CSV files line by line, with
+constant memory usage.
+
+"""
+import csv
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO, Tuple, Union
+
+from strf_hint.recognizer import Recognizer
+
+Source = Union[str, TextIO]
+
+
+class StreamEncoder:
+    """
+    Class responsible for encoding the lines of text files, or values of a CSV column, as a stream of results.
+
+    """
+
+    def __init__(
+        self,
+        recognizer: Optional[Recognizer] = None,
+        column: Optional[str] = None,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        workers: int = 1,
+        chunk_size: int = 10000,
+    ):
+        """
+        Initialization of the `StreamEncoder` class.
+
+        Parameters
+        ----------
+        recognizer: Optional[`Recognizer`], default None
+            Recognizer used to encode the values. By default, recognizer with the shape cache enabled.
+
+        column: Optional[`str`], default None
+            Name of the CSV column to be encoded. If not given, the source is read as a text file, line by line.
+
+        delimiter: `str`, default ","
+            Delimiter of the CSV file.
+
+        encoding: `str`, default "utf-8"
+            Encoding of the files opened by path.
+
+        workers: `int`, default 1
+            Number of worker processes. 1 encodes the values in the current process.
+
+        chunk_size: `int`, default 10000
+            Number of values sent to a worker process at once.
+
+        """
+        self._recognizer = recognizer or Recognizer(shape_cache_size=4096)
+        self._column = column
+        self._delimiter = delimiter
+        self._encoding = encoding
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+    def encode(self, source: Source) -> Iterator[Tuple[int, str, str]]:
+        """
+        Method responsible for encoding the source as a stream. Only the chunks being encoded are kept in memory.
+
+        Parameters
+        ----------
+        source: `Union`[`str`, `TextIO`]
+            Path of the file, or the opened text file.
+
+        Returns
+        -------
+        `Iterator`[`Tuple`[`int`, `str`, `str`]]
+            Tuples containing the line number, the original value and its encoded format, in the input order.
+
+        """
+        with self._open(source) as file:
+            records = self._read(file)
+            if self._workers <= 1:
+                for line_no, value in records:
+                    yield line_no, value, self._recognizer.encode_format(value)
+                return
+
+            pending = deque()
+
+            def values() -> Iterator[str]:
+                for record in records:
+                    pending.append(record)
+                    yield record[1]
+
+            for chunk in self._recognizer._encode_parallel(
+                values(), self._workers, self._chunk_size
+            ):
+                for encoded in chunk:
+                    line_no, value = pending.popleft()
+                    yield line_no, value, encoded
+
+    def write(self, source: Source, output: TextIO) -> int:
+        """
+        Method responsible for encoding the source, and writing the results to the output incrementally, as
+        tab-separated line number, original value and encoded format.
+
+        Parameters
+        ----------
+        source: `Union`[`str`, `TextIO`]
+            Path of the file, or the opened text file.
+
+        output: `TextIO`
+            Opened text file, the results are written to.
+
+        Returns
+        -------
+        `int`
+            Number of written results.
+
+        """
+        writer = csv.writer(output, delimiter="\t", lineterminator="\n")
+        count = 0
+        for count, result in enumerate(self.encode(source), 1):
+            writer.writerow(result)
+
+        return count
+
+    @contextmanager
+    def _open(self, source: Source) -> Iterator[TextIO]:
+        """
+        Method responsible for opening the source, if it is given as a path.
+
+        Parameters
+        ----------
+        source: `Union`[`str`, `TextIO`]
+            Path of the file, or the opened text file.
+
+        Returns
+        -------
+        `Iterator`[`TextIO`]
+            Opened text file.
+
+        """
+        if hasattr(source, "read"):
+            yield source
+            return
+        with open(source, encoding=self._encoding, newline="") as file:
+            yield file
+
+    def _read(self, file: TextIO) -> Iterator[Tuple[int, str]]:
+        """
+        Method responsible for reading the values of the file, one at a time.
+
+        Parameters
+        ----------
+        file: `TextIO`
+            Opened text file.
+
+        Returns
+        -------
+        `Iterator`[`Tuple`[`int`, `str`]]
+            Tuples containing the line number and the value.
+
+        """
+        if self._column is None:
+            for line_no, line in enumerate(file, 1):
+                yield line_no, line.rstrip("\r\n")
+            return
+
+        reader = csv.DictReader(file, delimiter=self._delimiter)
+        if reader.fieldnames is None or self._column not in reader.fieldnames:
+            raise ValueError(f"Column {self._column!r} not found in the CSV header.")
+        for row in reader:
+            yield reader.line_num, row[self._column] or ""
@@ -3,9 +3,22 @@ This module contains datetime codes.
 
 """
 import functools
+import hashlib
 import re
 from enum import Enum
-from typing import List, Literal, Optional
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+from strf_hint.cache import CacheInfo, LRUCache, MemoizedMethod, memoized_method
 
 
 class FieldTypes(Enum):
@@ -36,6 +49,126 @@ class FieldTypes(Enum):
     LITERAL = 15
 
 
+class CommonFormat(NamedTuple):
+    """
+    Precompiled entry of the common strf formats table.
+
+    """
+
+    format: str  # common strf format, as defined in `StrfCodes`
+    regex: str  # regular expression of the format, compiled lazily by `StrfCodes.common_format_pattern`
+    types: List[FieldTypes]  # types of the strf codes contained in the format
+    literals: FrozenSet[str]  # signs, that must be present in the input for the format to match
+    family: Pattern  # relaxed regular expression, shared by all formats of the same shape
+
+
+class CodeCandidate(NamedTuple):
+    """
+    Single strf-code candidate, found by the token scanner.
+
+    """
+
+    code: str  # strf-code
+    length: int  # length of the regex match of the code
+    type: FieldTypes  # type of the strf-code
+
+
+class ScanCounters(NamedTuple):
+    """
+    Counters of the token scanner.
+
+    """
+
+    hits: int  # number of scans served from the memo
+    misses: int  # number of scans performed
+    regex_evaluations: int  # number of regular expressions of the codes evaluated by the scans
+
+
+class NameIndex:
+    """
+    Prefix tree built over the vocabularies of the name-like strf codes (day and month names, timezones). Edges of the
+    tree are the maximal runs of word and non-word signs, so the words are always matched at word boundaries, and all of
+    them are found in a single pass over the input string.
+
+    Parameters
+    ----------
+    vocabularies: `Iterable`[`Tuple`[`str`, `FieldTypes`, `Iterable`[`str`]]]
+        Strf codes, together with their types and vocabularies. Words are expected to be lowercase.
+
+    """
+
+    _RUNS = re.compile(r"\w+|\W+")
+
+    def __init__(
+        self, vocabularies: Iterable[Tuple[str, FieldTypes, Iterable[str]]]
+    ) -> None:
+        self._root: dict = {}
+        self._codes: List[str] = []
+        self._types: Dict[str, FieldTypes] = {}
+        for code, code_type, words in vocabularies:
+            self._codes.append(code)
+            self._types[code] = code_type
+            for word in words:
+                node = self._root
+                for run in self._RUNS.findall(word):
+                    node = node.setdefault(run, {})
+                terminal = node.setdefault(None, [])
+                if code not in terminal:
+                    terminal.append(code)
+
+    @property
+    def codes(self) -> List[str]:
+        """
+        Strf codes covered by the index, in order of their registration.
+
+        """
+        return list(self._codes)
+
+    def find(self, s: str) -> Dict[str, CodeCandidate]:
+        """
+        Method responsible for finding the vocabulary words in the input string. For each strf code, the leftmost
+        occurrence is reported, and the longest word is taken among the words starting at the same position.
+
+        Parameters
+        ----------
+        s: `str`
+            Input string, expected to be lowercase.
+
+        Returns
+        -------
+        `Dict`[`str`, `CodeCandidate`]
+            Dictionary mapping the found strf codes to the candidates, in order of their registration.
+
+        """
+        found: Dict[str, CodeCandidate] = {}
+        runs = self._RUNS.findall(s)
+        for idx, run in enumerate(runs):
+            node = self._root.get(run)
+            if node is None:
+                continue
+            length = len(run)
+            matches = {code: length for code in node.get(None, ())}
+            for nxt in runs[idx + 1 :]:
+                if len(node) == (None in node):
+                    break
+                node = node.get(nxt)
+                if node is None:
+                    break
+                length += len(nxt)
+                matches.update((code, length) for code in node.get(None, ()))
+            for code, length in matches.items():
+                if code not in found:
+                    found[code] = CodeCandidate(code, length, self._types[code])
+
+        return {code: found[code] for code in self._codes if code in found}
+
+
+# Tables of the common formats built at runtime, and indexes of the names, shared by the instances of the same codes
+# data (e.g. of the same locales), so each of them is built once per process.
+_BUILT_TABLES = LRUCache(16)
+_NAME_INDEXES = LRUCache(16)
+
+
 class StrfCodes:
     """
     This class is a container for strf datetime codes related data.
@@ -751,6 +884,72 @@ class StrfCodes:
         "%I %p",
 
     ]
+    NAME_TYPES = [FieldTypes.DAY_NAME, FieldTypes.MONTH_NAME, FieldTypes.AM_PM]
+    NUMERIC_TYPES = [
+        FieldTypes.HOURS,
+        FieldTypes.MINUTES,
+        FieldTypes.SECONDS,
+        FieldTypes.MICROSECONDS,
+        FieldTypes.MONTHDAY_NUM,
+        FieldTypes.WEEKDAY_NUM,
+        FieldTypes.YEARDAY_NUM,
+        FieldTypes.WEEK_NUM,
+        FieldTypes.MONTH_NUM,
+        FieldTypes.YEAR,
+    ]
+
+    INDEXED_CODES = ["%a", "%A", "%b", "%B", "%Z"]
+
+    # Regular expressions of all the values of the strf-codes, in their exact width, used to validate the strings of a
+    # known format by `compile_format`. Regular expressions of the `BASIC_CODES` are tuned for finding the codes in the
+    # text, so they can't be used for that. Codes missing here are validated with their regular expressions.
+    VALUE_REGEX = {
+        "%a": "mon|tue|wed|thu|fri|sat|sun",
+        "%A": "monday|tuesday|wednesday|thursday|friday|saturday|sunday",
+        "%b": "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec",
+        "%B": (
+            "january|february|march|april|may|june|july|august|september|october|november|"
+            "december"
+        ),
+        "%m": r"0[1-9]|1[0-2]",
+        "%-m": r"[1-9]|1[0-2]",
+        "%Y": r"\d{4}",
+        "%y": r"\d{2}",
+        "%d": r"0[1-9]|[1-2]\d|3[0-1]",
+        "%-d": r"[1-9]|[1-2]\d|3[0-1]",
+        "%I": r"0[1-9]|1[0-2]",
+        "%-I": r"[1-9]|1[0-2]",
+        "%H": r"[0-1]\d|2[0-3]",
+        "%-H": r"1?\d|2[0-3]",
+        "%M": r"[0-5]\d",
+        "%-M": r"[1-5]?\d",
+        "%S": r"[0-5]\d|6[0-1]",
+        "%-S": r"[1-5]?\d|6[0-1]",
+        "%f": r"\d{6}",
+        "%j": r"00[1-9]|0[1-9]\d|[1-2]\d{2}|3[0-5]\d|36[0-6]",
+        "%-j": r"[1-9]\d?|[1-2]\d{2}|3[0-5]\d|36[0-6]",
+        "%U": r"[0-4]\d|5[0-3]",
+        "%-U": r"[1-4]?\d|5[0-3]",
+        "%W": r"[0-4]\d|5[0-3]",
+        "%-W": r"[1-4]?\d|5[0-3]",
+        "%w": r"[0-6]",
+    }
+
+    CODE_CACHE_SIZE = 256
+    FORMAT_CACHE_SIZE = 1024
+    TOKEN_SCAN_CACHE_SIZE = 4096
+    DIGIT_RUN_CACHE_SIZE = 4096
+    # Memos of the instance, reported by `cache_info`: name -> (attribute of the memo, attribute of its bound)
+    MEMOS = {
+        "get_regex": ("get_regex", "CODE_CACHE_SIZE"),
+        "get_type": ("get_type", "CODE_CACHE_SIZE"),
+        "get_format_types": ("get_format_types", "FORMAT_CACHE_SIZE"),
+        "generate_format_regex": ("generate_format_regex", "FORMAT_CACHE_SIZE"),
+        "scan_token": ("_token_scanner", "TOKEN_SCAN_CACHE_SIZE"),
+        "get_shape": ("_digit_run_signature", "DIGIT_RUN_CACHE_SIZE"),
+        "compile_format": ("_format_compiler", "FORMAT_CACHE_SIZE"),
+    }
+
     PREFIX = ["cw", "wk", "day", "week", "time"]
 
     IGNORABLE = [
@@ -768,7 +967,77 @@ class StrfCodes:
         "millisecond",
     ]
 
-    @functools.lru_cache
+    def __init__(self, locales: Iterable[str] = ()):
+        """
+        Initialization of the `StrfCodes` class.
+
+        Parameters
+        ----------
+        locales: `Iterable`[`str`], default ()
+            Locales, whose names of days, months and AM/PM are recognized together with the English ones, e.g.
+            ("de", "fr"). Bundled locales are listed in `strf_hint.locales.LOCALE_NAMES`, names of the other ones are
+            generated with the `calendar` module. Tables of the codes are built and compiled lazily, once per process
+            for each set of locales.
+
+        """
+        self.locales = tuple(locales)
+        if self.locales:
+            # imported here, as the data of the locales is not needed by the English codes
+            from strf_hint.locales import localize_codes
+
+            self.BASIC_CODES = localize_codes(type(self).BASIC_CODES, self.locales)
+
+    def __getstate__(self) -> dict:
+        """
+        Method responsible for preparing the state of the instance for pickling. Derived tables are skipped, as
+        they are rebuilt lazily after unpickling.
+
+        Returns
+        -------
+        `dict`
+            State of the instance.
+
+        """
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not isinstance(
+                getattr(type(self), key, None),
+                (functools.cached_property, MemoizedMethod),
+            )
+        }
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """
+        Method responsible for retrieving the statistics of the memos of the instance. Memos are created on their
+        first use, memos not used yet are reported empty.
+
+        Returns
+        -------
+        `Dict`[`str`, `CacheInfo`]
+            Dictionary mapping the names of the memoized methods to the statistics of their memos.
+
+        """
+        info = {}
+        for name, (attribute, maxsize) in self.MEMOS.items():
+            memo = self.__dict__.get(attribute)
+            if memo is None:
+                info[name] = CacheInfo(0, 0, 0, getattr(self, maxsize), 0)
+            else:
+                info[name] = MemoizedMethod.info(memo)
+        return info
+
+    def cache_clear(self) -> None:
+        """
+        Method responsible for removing all the memoized results of the instance, and resetting the statistics.
+
+        """
+        for attribute, _ in self.MEMOS.values():
+            memo = self.__dict__.get(attribute)
+            if memo is not None:
+                memo.cache_clear()
+
+    @memoized_method("CODE_CACHE_SIZE")
     def get_regex(
         self,
         code: str,
@@ -801,7 +1070,7 @@ class StrfCodes:
         except KeyError:
             return None
 
-    @functools.lru_cache
+    @memoized_method("CODE_CACHE_SIZE")
     def get_type(self, code: str) -> FieldTypes:
         """
         Method responsible for retrieving a type of particular strf-code.
@@ -821,7 +1090,7 @@ class StrfCodes:
         except KeyError:
             return None
 
-    @functools.lru_cache
+    @memoized_method("FORMAT_CACHE_SIZE")
     def get_format_types(self, codes: str) -> List[str]:
         """
         Method responsible for retrieving a list of types of the strf-codes contained in `codes` string.
@@ -842,7 +1111,7 @@ class StrfCodes:
             for match in re.finditer("|".join(self.BASIC_CODES.keys()), codes)
         ]
 
-    @functools.lru_cache
+    @memoized_method("FORMAT_CACHE_SIZE")
     def generate_format_regex(self, code_group: str) -> str:
         """
         Method responsible for generating regular expressions for predefined common strf formats.
@@ -866,3 +1135,543 @@ class StrfCodes:
                 code_group = code_group.replace(code, regex)
 
         return rf"{code_group}"
+
+    @functools.cached_property
+    def common_formats(self) -> List[CommonFormat]:
+        """
+        Table of the common strf formats, built once per instance. Order of the entries reflects the priority of the
+        formats - date formats first, then time formats. If the codes are not customized, the table is loaded from
+        the tables shipped with the package (see `strf_hint.build_tables`). Regular expressions of the formats are
+        compiled lazily, by `common_format_pattern`.
+
+        Returns
+        -------
+        `List`[`CommonFormat`]
+            List of the common formats.
+
+        """
+        from strf_hint import _tables
+
+        digest = self.tables_digest()
+        if _tables.DIGEST == digest:
+            rows = _tables.COMMON_FORMATS
+        else:
+            rows = _BUILT_TABLES.get(digest)
+            if rows is None:
+                rows = self.build_tables()
+                _BUILT_TABLES.put(digest, rows)
+        families = {}
+        return [
+            CommonFormat(
+                group,
+                regex,
+                [FieldTypes[name] for name in types],
+                frozenset(literals),
+                families.setdefault(family, re.compile(family)),
+            )
+            for group, regex, types, literals, family in rows
+        ]
+
+    @functools.cached_property
+    def _common_patterns(self) -> List[Optional[Pattern]]:
+        """
+        Compiled regular expressions of the common formats, filled in on the first use of each format.
+
+        """
+        return [None] * len(self.common_formats)
+
+    def common_format_pattern(self, idx: int) -> Pattern:
+        """
+        Method responsible for retrieving the compiled regular expression of the common format. The expression is
+        compiled on the first use, as most of the inputs match only a few of the formats.
+
+        Parameters
+        ----------
+        idx: `int`
+            Index of the format in the `common_formats` table.
+
+        Returns
+        -------
+        `Pattern`
+            Compiled regular expression of the format.
+
+        """
+        pattern = self._common_patterns[idx]
+        if pattern is None:
+            pattern = re.compile(self.common_formats[idx].regex)
+            self._common_patterns[idx] = pattern
+        return pattern
+
+    def build_tables(self) -> List[Tuple[str, str, List[str], str, str]]:
+        """
+        Method responsible for deriving the table of the common formats from the codes, in the serializable form.
+
+        Returns
+        -------
+        `List`[`Tuple`[`str`, `str`, `List`[`str`], `str`, `str`]]
+            Rows of the table: format, its regular expression, names of the types of its codes, signs which must be
+            present in the input (sorted), and the relaxed regular expression of the format family.
+
+        """
+        codes_regex = "|".join(self.BASIC_CODES.keys())
+        return [
+            (
+                group,
+                self.generate_format_regex(group),
+                [code_type.name for code_type in self.get_format_types(group)],
+                "".join(
+                    sorted(set(re.sub(codes_regex, "", group).replace("\\", "")))
+                ),
+                self._relax_format_regex(group),
+            )
+            for group in self.DATE_COMMON_FORMATS + self.TIME_COMMON_FORMATS
+        ]
+
+    def tables_digest(self) -> str:
+        """
+        Method responsible for computing the digest of the codes data, the derived tables are built from.
+
+        Returns
+        -------
+        `str`
+            Hexadecimal SHA-256 digest.
+
+        """
+        data = repr(
+            (self.BASIC_CODES, self.DATE_COMMON_FORMATS, self.TIME_COMMON_FORMATS)
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    @functools.cached_property
+    def _common_format_families(self) -> List[Tuple[Pattern, List[int]]]:
+        """
+        Common formats grouped by their relaxed regular expressions, as a list of tuples containing the relaxed
+        expression and the indexes of its member formats in the `common_formats` table.
+
+        """
+        families = {}
+        for idx, entry in enumerate(self.common_formats):
+            families.setdefault(entry.family, []).append(idx)
+        return list(families.items())
+
+    def common_format_candidates(self, s: str, start: int = 0) -> List[int]:
+        """
+        Method responsible for selecting the common formats, that may match the input string. Format is a candidate,
+        if the input contains all of its separators, and its relaxed regular expression matches the input.
+
+        Parameters
+        ----------
+        s: `str`
+            Lowercase input text.
+
+        start: `int`, default 0
+            Index of the first format in the `common_formats` table to be considered.
+
+        Returns
+        -------
+        `List`[`int`]
+            Sorted indexes of the candidate formats in the `common_formats` table.
+
+        """
+        signs = set(s)
+        candidates = []
+        for family, members in self._common_format_families:
+            if members[-1] < start or not family.search(s):
+                continue
+            candidates += [
+                idx
+                for idx in members
+                if idx >= start and self.common_formats[idx].literals <= signs
+            ]
+        return sorted(candidates)
+
+    def relax_format_parts(self, code_group: str) -> List[Tuple[str, str]]:
+        """
+        Method responsible for relaxing the parts of the common strf format. Numeric codes are relaxed to any digit run,
+        name codes to any letter run, and date separators to any date separator.
+
+        Parameters
+        ----------
+        code_group: `str`
+            Strf format to be relaxed.
+
+        Returns
+        -------
+        `List`[`Tuple`[`str`, `str`]]
+            Parts of the format (strf-codes, and single signs of the literal text), together with their relaxed regular
+            expressions, in order of the format.
+
+        """
+        parts = []
+        for part in re.split(f"({'|'.join(self.BASIC_CODES.keys())})", code_group):
+            if part in self.BASIC_CODES:
+                code_type = self.get_type(part)
+                if code_type in self.NAME_TYPES:
+                    parts.append((part, self._name_run))
+                elif code_type in self.NUMERIC_TYPES:
+                    parts.append((part, r"\d+"))
+                else:
+                    parts.append((part, f"(?:{self.get_regex(part)})"))
+                continue
+            for sign in part.replace("\\", ""):
+                parts.append((sign, "[-./,]" if sign in "-./," else re.escape(sign)))
+        return parts
+
+    def _relax_format_regex(self, code_group: str) -> str:
+        """
+        Method responsible for generating relaxed regular expression for the common strf format, from its relaxed
+        parts (see `relax_format_parts`), so the relaxed expression matches a superset of the format. Formats differing
+        only in the separators or in the padding share the same relaxed expression, so a single scan can rule out all
+        of them.
+
+        Parameters
+        ----------
+        code_group: `str`
+            Strf format, which the relaxed regular expression shall be prepared to.
+
+        Returns
+        -------
+        `str`
+            Relaxed regular expression for the particular strf-format.
+
+        """
+        relaxed = [regex for _, regex in self.relax_format_parts(code_group)]
+
+        # the leading run may start only at the beginning of a run of its signs. Match starting inside the run implies
+        # the one starting at its beginning, but trying all of them backtracks in quadratic time on the long runs. The
+        # first sign is matched before the lookbehind, so the search still skips quickly to the candidate positions.
+        if relaxed[:1] in ([r"\d+"], [self._name_run]):
+            sign = relaxed[0][:-1]
+            relaxed[0] = f"{sign}(?<!{sign}{sign}){sign}*"
+
+        return "".join(relaxed)
+
+    @functools.cached_property
+    def _name_run(self) -> str:
+        """
+        Relaxed regular expression of the names: any run of ASCII letters, or of any letters if some of the names are
+        not ASCII, e.g. of the other locales.
+
+        """
+        words = "".join(
+            self.get_regex(code)
+            for code in self.BASIC_CODES
+            if self.get_type(code) in self.NAME_TYPES
+        )
+        return "[a-z]+" if words.isascii() else r"[^\W\d_]+"
+
+    @functools.cached_property
+    def basic_patterns(self) -> Dict[str, Pattern]:
+        """
+        Compiled regular expressions (including affixes) of the basic strf-codes, built once per instance.
+
+        Returns
+        -------
+        `Dict`[`str`, `Pattern`]
+            Dictionary mapping strf-codes to their compiled regular expressions.
+
+        """
+        return {
+            code: re.compile(self.get_regex(code, "True")) for code in self.BASIC_CODES
+        }
+
+    @functools.cached_property
+    def name_index(self) -> NameIndex:
+        """
+        Prefix tree over the vocabularies of the name-like strf codes (`INDEXED_CODES`), built once per instance.
+
+        Returns
+        -------
+        `NameIndex`
+            Index of the name-like strf codes.
+
+        """
+        vocabularies = tuple(
+            (code, self.get_type(code), tuple(self._vocabulary(code)))
+            for code in self.INDEXED_CODES
+        )
+        index = _NAME_INDEXES.get(vocabularies)
+        if index is None:
+            index = NameIndex(vocabularies)
+            _NAME_INDEXES.put(vocabularies, index)
+        return index
+
+    @functools.cached_property
+    def month_names(self) -> FrozenSet[str]:
+        """
+        Words of the month names (of all the name-like strf codes of the month type), built once per instance.
+
+        Returns
+        -------
+        `FrozenSet`[`str`]
+            Lowercase words of the month names.
+
+        """
+        return frozenset(
+            word
+            for code in self.INDEXED_CODES
+            if self.get_type(code) == FieldTypes.MONTH_NAME
+            for word in self._vocabulary(code)
+        )
+
+    def _vocabulary(self, code: str) -> List[str]:
+        """
+        Method responsible for retrieving the words of the name-like strf code, from its regular expression. Regexes of
+        these codes are plain alternations of words, where some of the words contain groups, so the words are taken as
+        the literal strings matched by the alternatives.
+
+        Parameters
+        ----------
+        code: `str`
+            Name-like strf code.
+
+        Returns
+        -------
+        `List`[`str`]
+            Unique words of the code, in order of the regular expression.
+
+        """
+        words = re.sub(r"[()]", "", self.BASIC_CODES[code]["regex"]).split("|")
+        return list(dict.fromkeys(words))
+
+    def scan_token(
+        self, elem: str, prev: str = "", nxt: str = ""
+    ) -> Tuple[CodeCandidate, ...]:
+        """
+        Method responsible for finding all the basic strf-codes, that match the single token of the input string. Each
+        code is searched in the window consisting of the token and its neighbours, and then in the token itself.
+
+        Parameters
+        ----------
+        elem: `str`
+            Token to be scanned.
+
+        prev: `str`, default ""
+            Token preceding the scanned one.
+
+        nxt: `str`, default ""
+            Token following the scanned one.
+
+        Returns
+        -------
+        `Tuple`[`CodeCandidate`, ...]
+            All matching codes, in order of `BASIC_CODES`.
+
+        """
+        elem = elem.lower()
+        return self._token_scanner(prev.lower() + elem + nxt.lower(), elem)
+
+    @functools.cached_property
+    def _token_scanner(self):
+        """
+        Memoized scanner of the token windows, bounded to `TOKEN_SCAN_CACHE_SIZE` entries. Tokens of the datetime
+        strings repeat a lot (separators, hours, minutes, month names), so most of the scans are served from the cache.
+
+        """
+        patterns = [
+            (
+                code,
+                pattern,
+                self.get_type(code),
+                self.get_type(code) in self.NUMERIC_TYPES,
+                self.get_type(code) in self.NAME_TYPES + [FieldTypes.TIMEZONE],
+            )
+            for code, pattern in self.basic_patterns.items()
+        ]
+        name_index = self.name_index
+        indexed = frozenset(name_index.codes)
+        digit = re.compile(r"\d")
+        letter = re.compile(r"[^\W\d_]")
+
+        @functools.lru_cache(maxsize=self.TOKEN_SCAN_CACHE_SIZE)
+        def scan(window: str, elem: str) -> Tuple[CodeCandidate, ...]:
+            has_digit = digit.search(window) is not None
+            has_letter = letter.search(window) is not None
+            names = {}
+            if has_letter:
+                names = name_index.find(window)
+                if len(names) < len(indexed) and elem != window:
+                    names = {**name_index.find(elem), **names}
+            candidates = []
+            evaluated = 0
+            for code, pattern, code_type, needs_digit, needs_letter in patterns:
+                if code in names:
+                    candidates.append(names[code])
+                    continue
+                if (
+                    (needs_digit and not has_digit)
+                    or (needs_letter and not has_letter)
+                    or code in indexed
+                ):
+                    continue
+                evaluated += 1
+                match = pattern.search(window)
+                if match is None:
+                    evaluated += 1
+                    match = pattern.search(elem)
+                if match:
+                    candidates.append(
+                        CodeCandidate(code, match.end() - match.start(), code_type)
+                    )
+            evaluations[0] += evaluated
+            return tuple(candidates)
+
+        # number of the regular expressions evaluated by the scans, read by `scan_counters`
+        evaluations = [0]
+        scan.evaluations = evaluations
+        return scan
+
+    def scan_counters(self) -> ScanCounters:
+        """
+        Method responsible for retrieving the counters of the token scanner, since the creation of the instance (hits
+        and misses are reset by `cache_clear`). The counters are shared by all the users of the instance.
+
+        Returns
+        -------
+        `ScanCounters`
+            Counters of the token scanner.
+
+        """
+        info = self._token_scanner.cache_info()
+        return ScanCounters(info.hits, info.misses, self._token_scanner.evaluations[0])
+
+    def get_shape(self, s: str) -> Optional[Tuple]:
+        """
+        Method responsible for computing the shape of the input string. Shape keeps all the non-digit signs, and
+        replaces each run of digits with its signature. The signature describes everything, that the recognizer can
+        observe in the run, as long as the common formats match whole runs of digits: its length, the numeric codes
+        matching the entire run, the positions from which the codes opening a common format match the rest of the
+        run, and the length of the first match of the codes closing a common format. Shape is available only for ASCII
+        inputs.
+
+        Parameters
+        ----------
+        s: `str`
+            Input text.
+
+        Returns
+        -------
+        `Optional`[`Tuple`]
+            Shape of the input string, or None if the shape can't be computed.
+
+        """
+        if not s.isascii() or self._digit_run_signature is None:
+            return None
+        parts = re.split("([0-9]+)", s)
+        parts[1::2] = [self._digit_run_signature(run) for run in parts[1::2]]
+        return tuple(parts)
+
+    @functools.cached_property
+    def _digit_run_signature(self):
+        """
+        Memoized signature of the digit run, bounded to `DIGIT_RUN_CACHE_SIZE` entries. None, if two numeric codes
+        are adjacent in any of the common formats, as such formats may split a run of digits at any position.
+
+        """
+        opening, closing = set(), set()
+        for group in self.DATE_COMMON_FORMATS + self.TIME_COMMON_FORMATS:
+            parts = [
+                part
+                for part in re.split(f"({'|'.join(self.BASIC_CODES.keys())})", group)
+                if part
+            ]
+            numeric = [self.get_type(part) in self.NUMERIC_TYPES for part in parts]
+            if any(left and right for left, right in zip(numeric, numeric[1:])):
+                return None
+            if numeric[0]:
+                opening.add(parts[0])
+            if numeric[-1]:
+                closing.add(parts[-1])
+        cores = [
+            (
+                re.compile(f"(?:{self.get_regex(code)})"),
+                code in opening,
+                code in closing,
+            )
+            for code in self.BASIC_CODES
+            if self.get_type(code) in self.NUMERIC_TYPES
+        ]
+
+        @functools.lru_cache(maxsize=self.DIGIT_RUN_CACHE_SIZE)
+        def signature(run: str) -> Tuple:
+            result = [len(run)]
+            for core, is_opening, is_closing in cores:
+                result.append(core.fullmatch(run) is not None)
+                if is_opening:
+                    result.append(
+                        tuple(
+                            pos
+                            for pos in range(1, len(run))
+                            if core.fullmatch(run, pos)
+                        )
+                    )
+                if is_closing:
+                    match = core.match(run)
+                    result.append(match.end() if match else -1)
+            return tuple(result)
+
+        return signature
+
+    def compile_format(self, encoded_format: str) -> Pattern:
+        """
+        Method responsible for compiling the encoded format into a case-insensitive regular expression, matching the
+        entire strings of this format. Each strf-code is replaced with the regular expression of its values, given by
+        `VALUE_REGEX` (extended with the names of the locales), the rest of the format is matched literally.
+
+        Parameters
+        ----------
+        encoded_format: `str`
+            Format encoded with the strf-codes, e.g. returned by the `Recognizer`.
+
+        Returns
+        -------
+        `Pattern`
+            Compiled regular expression of the format.
+
+        """
+        return self._format_compiler(encoded_format)
+
+    @functools.cached_property
+    def _format_compiler(self):
+        """
+        Memoized compiler of the encoded formats, bounded to `FORMAT_CACHE_SIZE` entries.
+
+        """
+        codes_regex = re.compile(f"({'|'.join(self.BASIC_CODES.keys())})")
+
+        @functools.lru_cache(maxsize=self.FORMAT_CACHE_SIZE)
+        def compile_format(encoded_format: str) -> Pattern:
+            parts = codes_regex.split(encoded_format)
+            parts[0::2] = [re.escape(part) for part in parts[0::2]]
+            parts[1::2] = [f"(?:{self._value_regex(code)})" for code in parts[1::2]]
+            return re.compile("".join(parts), re.IGNORECASE)
+
+        return compile_format
+
+    def _value_regex(self, code: str) -> str:
+        """
+        Method responsible for retrieving the regular expression of all the values of the strf-code, used by
+        `compile_format`.
+
+        Parameters
+        ----------
+        code: `str`
+            Strf-code.
+
+        Returns
+        -------
+        `str`
+            Regular expression of the values of the strf-code.
+
+        """
+        if code not in self.VALUE_REGEX:
+            return self.get_regex(code)
+        if not self.locales or code not in self.INDEXED_CODES:
+            return self.VALUE_REGEX[code]
+        # imported here, as the data of the locales is not needed by the English codes
+        from strf_hint.locales import get_locale_names
+
+        words = self.VALUE_REGEX[code].split("|")
+        for locale_name in self.locales:
+            words += get_locale_names(locale_name)[code]
+        return "|".join(dict.fromkeys(words))
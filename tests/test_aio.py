@@ -0,0 +1,101 @@
+"""
+Module containing unit tests for aio.py module.
+
+"""
+import asyncio
+
+import pytest
+
+from strf_hint.aio import AsyncEncoder
+from strf_hint.recognizer import Recognizer
+
+SAMPLES = [
+    "2023-11-21 07:20",
+    "7:20 PM",
+    "Tue, 21 Nov 2023",
+    "2023-11-21 07:20",
+    "WK30, 2023",
+]
+
+
+async def slow_source(values, delay=0.0):
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+
+async def collect(encoder, source):
+    return [pair async for pair in encoder.encode_formats_stream(source)]
+
+
+def test_encode_format():
+    async def run():
+        async with AsyncEncoder() as encoder:
+            return await encoder.encode_format("7:20 PM")
+
+    assert asyncio.run(run()) == "%-I:%M %p"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 256])
+@pytest.mark.parametrize("async_source", [True, False])
+def test_encode_formats_stream(batch_size, async_source):
+    async def run():
+        source = slow_source(SAMPLES) if async_source else iter(SAMPLES)
+        async with AsyncEncoder(batch_size=batch_size) as encoder:
+            return await collect(encoder, source)
+
+    expected = Recognizer().encode_formats(SAMPLES)
+    assert asyncio.run(run()) == list(zip(SAMPLES, expected))
+
+
+def test_encode_formats_stream_slow_source():
+    async def run():
+        async with AsyncEncoder(batch_timeout=0.001) as encoder:
+            stream = encoder.encode_formats_stream(slow_source(SAMPLES, 0.05))
+            first = await asyncio.wait_for(stream.__anext__(), 1)
+            await stream.aclose()
+            return first
+
+    # the first value is yielded before the whole source is read
+    assert asyncio.run(run()) == ("2023-11-21 07:20", "%Y-%m-%d %H:%M")
+
+
+def test_encode_formats_stream_backpressure():
+    read = []
+
+    def source():
+        for value in SAMPLES * 10:
+            read.append(value)
+            yield value
+
+    async def run():
+        async with AsyncEncoder(batch_size=2, max_pending=1) as encoder:
+            stream = encoder.encode_formats_stream(source())
+            await stream.__anext__()
+            await asyncio.sleep(0.05)
+            await stream.aclose()
+
+    asyncio.run(run())
+    # consumed batch, batch in flight, and the read values queue are bounded
+    assert len(read) < 20
+
+
+def test_encode_formats_stream_source_error():
+    async def source():
+        yield "7:20 PM"
+        raise RuntimeError("source failed")
+
+    async def run():
+        results = []
+        async with AsyncEncoder() as encoder:
+            with pytest.raises(RuntimeError):
+                async for pair in encoder.encode_formats_stream(source()):
+                    results.append(pair)
+        return results
+
+    assert asyncio.run(run()) == [("7:20 PM", "%-I:%M %p")]
+
+
+def test_batch_size():
+    with pytest.raises(ValueError):
+        AsyncEncoder(batch_size=0)
@@ -0,0 +1,45 @@
+"""
+Module containing unit tests for run.py module of the benchmarks package.
+
+"""
+import json
+
+import pytest
+
+from benchmarks.run import BENCHMARKS, compare, main, run_benchmarks
+
+
+@pytest.mark.parametrize(
+    "name", ["encode_format.short_time", "generate_format_regex.warm"]
+)
+def test_run_benchmarks(name):
+    results = run_benchmarks([name], repeat=2, min_time=0.0)
+    assert set(results) == {name}
+    assert 0 < results[name]["min_us"] <= results[name]["max_us"]
+
+
+def test_compare():
+    old = {"a": {"min_us": 1.0}, "b": {"min_us": 1.0}}
+    new = {"a": {"min_us": 1.05}, "b": {"min_us": 2.0}, "c": {"min_us": 1.0}}
+    assert compare(old, new, threshold=0.1) == ["b"]
+
+
+def test_main_output(tmp_path):
+    output = tmp_path / "results.json"
+    args = [
+        "--repeat",
+        "1",
+        "--min-time",
+        "0",
+        "--output",
+        str(output),
+        "encode_format.timezone",
+    ]
+    assert main(args) == 0
+    report = json.loads(output.read_text())
+    assert set(report["results"]) == {"encode_format.timezone"}
+    assert main(args + ["--compare", str(output), "--threshold", "1000"]) == 0
+
+
+def test_registered():
+    assert "encode_formats.batch" in BENCHMARKS
@@ -0,0 +1,84 @@
+"""
+Module containing unit tests for cache.py module.
+
+"""
+import gc
+import weakref
+
+import pytest
+
+from strf_hint.cache import CacheInfo, LRUCache, MemoizedMethod, memoized_method
+
+
+class Squares:
+    MAXSIZE = 2
+
+    def __init__(self):
+        self.calls = 0
+
+    @memoized_method("MAXSIZE")
+    def square(self, value):
+        self.calls += 1
+        return value * value
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.info() == CacheInfo(
+        hits=2, misses=1, evictions=1, maxsize=2, currsize=2
+    )
+
+
+def test_lru_cache_clear():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.get("a", "default") == "default"
+    assert cache.info() == CacheInfo(
+        hits=0, misses=1, evictions=0, maxsize=2, currsize=0
+    )
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_memoized_method():
+    first, second = Squares(), Squares()
+    assert [first.square(2), first.square(2), second.square(2)] == [4, 4, 4]
+    assert (first.calls, second.calls) == (1, 1)
+    assert Squares.square(first, 2) == 4
+    assert first.calls == 1
+    assert isinstance(Squares.__dict__["square"], MemoizedMethod)
+    assert Squares.square.__doc__ == Squares.__dict__["square"].func.__doc__
+
+
+def test_memoized_method_info():
+    squares = Squares()
+    squares.MAXSIZE = 1
+    for value in [1, 2, 2, 3]:
+        squares.square(value)
+    assert MemoizedMethod.info(squares.square) == CacheInfo(
+        hits=1, misses=3, evictions=2, maxsize=1, currsize=1
+    )
+    squares.square.cache_clear()
+    assert MemoizedMethod.info(squares.square) == CacheInfo(0, 0, 0, 1, 0)
+
+
+def test_memoized_method_releases_instance():
+    squares = Squares()
+    squares.square(2)
+    ref = weakref.ref(squares)
+    del squares
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,71 @@
+"""
+Module containing unit tests for cli.py module.
+
+"""
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from strf_hint.cli import main
+
+
+def test_main_strings(capsys):
+    assert main(["7:20 PM", "WK30, 2023"]) == 0
+    assert capsys.readouterr().out == "1\t7:20 PM\t%-I:%M %p\n2\tWK30, 2023\tWK%U, %Y\n"
+
+
+def test_main_stdin(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("7:20 PM\n2023-11-21 07:20\n"))
+    assert main(["-o", "json"]) == 0
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == [
+        {"line": 1, "value": "7:20 PM", "format": "%-I:%M %p"},
+        {"line": 2, "value": "2023-11-21 07:20", "format": "%Y-%m-%d %H:%M"},
+    ]
+
+
+def test_main_csv_column(capsys, tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("id,created\n1,7:20 PM\n2,8:21 PM\n3,2023-11-21\n")
+    assert main(["-f", str(path), "-c", "created", "-H"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"{path}\t2\t7:20 PM\t%-I:%M %p",
+        f"{path}\t3\t8:21 PM\t%-I:%M %p",
+        f"{path}\t4\t2023-11-21\t%Y-%m-%d",
+    ]
+
+
+@pytest.mark.parametrize(
+    "args, exp_output",
+    [
+        (["-s"], "2\t%-I:%M %p\n1\tWK%U, %Y\n"),
+        (
+            ["-s", "-o", "json"],
+            '{"format": "%-I:%M %p", "count": 2}\n{"format": "WK%U, %Y", "count": 1}\n',
+        ),
+    ],
+)
+def test_main_summary(args, exp_output, capsys):
+    assert main(args + ["7:20 PM", "WK30, 2023", "8:21 PM"]) == 0
+    assert capsys.readouterr().out == exp_output
+
+
+def test_main_workers(capsys):
+    assert main(["-w", "2", "--chunk-size", "1", "7:20 PM", "WK30, 2023"]) == 0
+    assert capsys.readouterr().out == "1\t7:20 PM\t%-I:%M %p\n2\tWK30, 2023\tWK%U, %Y\n"
+
+
+def test_main_missing_file(capsys, tmp_path):
+    assert main(["-f", str(tmp_path / "missing.txt")]) == 2
+    assert "strf-hint:" in capsys.readouterr().err
+
+
+def test_startup_imports():
+    modules = {"dataclasses", "strf_hint.inference", "strf_hint.parser"}
+    code = f"import sys, strf_hint.cli; print(sorted({modules!r} & set(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout == "[]\n"
@@ -0,0 +1,52 @@
+"""
+Module containing unit tests for columns.py module.
+
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from strf_hint.columns import ColumnEncoder  # noqa: E402
+
+VALUES = ["2023-11-21 07:20", "7:20 PM", "2023-11-21 07:20", "2023-11-22 08:21"]
+FORMATS = ["%Y-%m-%d %H:%M", "%-I:%M %p", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M"]
+
+
+@pytest.fixture(scope="module")
+def encoder():
+    yield ColumnEncoder()
+
+
+def test_encode_array(encoder):
+    encoded = encoder.encode(np.array(VALUES))
+    assert encoded.tolist() == FORMATS
+
+
+def test_encode_array_shape(encoder):
+    encoded = encoder.encode(np.array(VALUES).reshape(2, 2))
+    assert encoded.shape == (2, 2)
+    assert encoded.ravel().tolist() == FORMATS
+
+
+def test_encode_array_missing(encoder):
+    values = np.array(VALUES[:2] + [None, float("nan")], dtype=object)
+    assert encoder.encode(values).tolist() == FORMATS[:2] + [None, None]
+    values = np.array([VALUES[0], None, float("nan")], dtype=object)
+    assert encoder.infer(values).format == FORMATS[0]
+
+
+def test_encode_series(encoder):
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(VALUES + [None], index=list("abcde"), name="created")
+    encoded = encoder.encode(series)
+    assert encoded.name == "created"
+    assert list(encoded.index) == list("abcde")
+    assert encoded.tolist() == FORMATS + [None]
+
+
+def test_infer(encoder):
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(["2023-11-%02d 07:20" % day for day in range(1, 29)] + [None])
+    result = encoder.infer(series)
+    assert result.format == "%Y-%m-%d %H:%M"
+    assert result.coverage == 1.0
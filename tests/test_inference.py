@@ -0,0 +1,118 @@
+"""
+Module containing unit tests for inference.py module.
+
+"""
+import datetime
+
+import pytest
+
+from strf_hint.inference import FormatInferrer, InferenceResult
+
+
+@pytest.fixture
+def inferrer():
+    yield FormatInferrer()
+
+
+@pytest.mark.parametrize(
+    "values, exp_format",
+    [
+        (["2023-11-%02d 07:%02d" % (d, d) for d in range(1, 29)], "%Y-%m-%d %H:%M"),
+        (
+            ["%02d/%02d/2023" % (d, m) for m in range(1, 13) for d in range(1, 29)],
+            "%d/%m/%Y",
+        ),
+        (
+            ["%02d/%02d/2023" % (m, d) for m in range(1, 13) for d in range(1, 29)],
+            "%m/%d/%Y",
+        ),
+        (
+            ["%d/%d/2023" % (m, d) for m in range(1, 13) for d in range(1, 29)],
+            "%-m/%-d/%Y",
+        ),
+    ],
+)
+def test_infer(values, exp_format, inferrer):
+    result = inferrer.infer(values)
+    assert result.format == exp_format
+    assert result.coverage == 1.0
+    assert result.confidence == 1.0
+
+
+@pytest.mark.parametrize(
+    "values, exp_format",
+    [
+        (
+            ["2023-11-%d" % d for d in [5, 6] + [30, 31] * 3 + list(range(10, 30))],
+            "%Y-%m-%-d",
+        ),
+        (
+            ["%d/%d/2023" % (m, d) for m in range(1, 13) for d in range(1, 32)],
+            "%-m/%-d/%Y",
+        ),
+        (
+            [
+                (datetime.date(2023, 1, 1) + datetime.timedelta(days)).strftime(
+                    "%B %d, %Y"
+                )
+                for days in range(365)
+            ],
+            "%B %d, %Y",
+        ),
+    ],
+)
+def test_infer_coverage(values, exp_format, inferrer):
+    result = inferrer.infer(values)
+    assert result.format == exp_format
+    assert result.coverage == 1.0
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 100])
+def test_sample_order(size, inferrer):
+    assert sorted(inferrer._sample_order(size)) == list(range(size))
+
+
+def test_infer_early_stop():
+    values = ["2023-11-21"] * 10000
+    result = FormatInferrer(initial_samples=10).infer(values)
+    assert result == InferenceResult("%Y-%m-%d", 1.0, 1.0, 30)
+
+
+def test_infer_max_samples():
+    values = ["2023-11-21", "7:20 PM"] * 500
+    result = FormatInferrer(max_samples=100).infer(values)
+    assert result.samples == 100
+    assert result.coverage < 1.0
+
+
+@pytest.mark.parametrize("values", [[], ["", "  "]])
+def test_infer_no_samples(values, inferrer):
+    assert inferrer.infer(values) == InferenceResult(None, 0.0, 0.0, 0)
+
+
+@pytest.mark.parametrize(
+    "encoded_format, exp_variants",
+    [
+        ("%Y-%m", ["%Y-%m", "%Y-%-m"]),
+        (
+            "%-d.%m",
+            [
+                "%-d.%m",
+                "%-d.%-m",
+                "%d.%m",
+                "%d.%-m",
+                "%-m.%d",
+                "%-m.%-d",
+                "%m.%d",
+                "%m.%-d",
+            ],
+        ),
+        ("at %p", ["at %p"]),
+    ],
+)
+def test_variants(encoded_format, exp_variants, inferrer):
+    assert inferrer._variants(encoded_format) == exp_variants
+
+
+def test_structure(inferrer):
+    assert inferrer._structure("%-m/%d/%Y %-H") == inferrer._structure("%d/%m/%Y %H")
@@ -0,0 +1,38 @@
+"""
+Module containing unit tests for locales.py module.
+
+"""
+import pytest
+
+from strf_hint.locales import LOCALE_NAMES, get_locale_names, localize_codes
+from strf_hint.strf_codes import StrfCodes
+
+
+@pytest.mark.parametrize("name", ["de", "de_DE", "de-AT", "de_DE.UTF-8", "DE"])
+def test_get_locale_names_bundled(name):
+    assert get_locale_names(name) is LOCALE_NAMES["de"]
+
+
+def test_get_locale_names_calendar():
+    names = get_locale_names("C")
+    assert "monday" in names["%A"]
+    assert "sep" in names["%b"]
+    assert "" not in names["%B"]
+    assert names["%p"] == ()
+
+
+def test_get_locale_names_unknown():
+    with pytest.raises(ValueError):
+        get_locale_names("xx_XX.UTF-8")
+
+
+def test_localize_codes():
+    basic_codes = StrfCodes.BASIC_CODES
+    localized = localize_codes(basic_codes, ["de", "fr"])
+    words = localized["%B"]["regex"].split("|")
+    assert {"march", "märz", "mars"} <= set(words)
+    assert len(words) == len(set(words))
+    assert words.index("juni") < words.index("jun")
+    assert localized["%p"]["regex"] in ("am|pm", "pm|am")
+    assert localized["%Y"] is basic_codes["%Y"]
+    assert "märz" not in basic_codes["%B"]["regex"]
@@ -0,0 +1,93 @@
+"""
+Module containing unit tests for parser.py module.
+
+"""
+import datetime
+
+import pytest
+
+from strf_hint.parser import DatetimeParser
+from strf_hint.recognizer import Recognizer
+
+
+@pytest.mark.parametrize(
+    "encoded_format, text, exp_result",
+    [
+        (
+            "%Y-%m-%d %H:%M:%S",
+            "2023-11-21 07:20:50",
+            datetime.datetime(2023, 11, 21, 7, 20, 50),
+        ),
+        (
+            "%Y-%m-%d %H:%M:%S.%f",
+            "2023-11-21 07:20:50.12",
+            datetime.datetime(2023, 11, 21, 7, 20, 50, 120000),
+        ),
+        (
+            "%-d.%-m.%Y %-I:%M %p",
+            "5.3.2023 7:05 PM",
+            datetime.datetime(2023, 3, 5, 19, 5),
+        ),
+        ("%-I%p", "12am", datetime.datetime(1900, 1, 1, 0, 0)),
+        (
+            "%B %dth %Y %-I:%M %p",
+            "march 11th 2023 9:30 pm",
+            datetime.datetime(2023, 3, 11, 21, 30),
+        ),
+        (
+            "%a, %d %b %Y %H:%M:%S %Z",
+            "Mon, 10 Dec 2018 09:42:09 GMT",
+            datetime.datetime(2018, 12, 10, 9, 42, 9),
+        ),
+        ("%m/%d/%y", "11/21/68", datetime.datetime(2068, 11, 21)),
+        ("%m/%d/%y", "11/21/69", datetime.datetime(1969, 11, 21)),
+        ("%j/%Y", "060/2024", datetime.datetime(2024, 2, 29)),
+        ("%Y CW%U %a", "2023 CW20 Tue", datetime.datetime(2023, 5, 16)),
+        ("%Y %W %w", "2023 00 0", datetime.datetime(2023, 1, 1)),
+        ("100%% at %H:%M", "100% at 17:20", datetime.datetime(1900, 1, 1, 17, 20)),
+    ],
+)
+def test_parse(encoded_format, text, exp_result):
+    assert DatetimeParser(encoded_format).parse(text) == exp_result
+
+
+@pytest.mark.parametrize(
+    "encoded_format, text",
+    [
+        ("%Y-%m-%d", "2023-11-21 07:20"),
+        ("%Y-%m-%d", "2023-13-21"),
+        ("%-m/%-d/%Y", "2/30/2023"),
+        ("%I:%M", "13:20"),
+        ("%I:%M %p", "0:30 AM"),
+        ("%-I:%M %p", "00:30 PM"),
+        ("%b %Y", "Foo 2023"),
+    ],
+)
+def test_parse_invalid(encoded_format, text):
+    with pytest.raises(ValueError):
+        DatetimeParser(encoded_format).parse(text)
+
+
+@pytest.mark.parametrize(
+    "encoded_format, date",
+    [
+        ("%Y-%m-%dT%H:%M:%S", datetime.datetime(2023, 11, 21, 7, 20, 50)),
+        ("%d/%m/%y %I:%M %p", datetime.datetime(1999, 1, 31, 23, 59)),
+        ("%A %d %B %Y", datetime.datetime(2020, 6, 1)),
+        ("%Y %U %w", datetime.datetime(2021, 12, 31)),
+        ("%Y %W %a", datetime.datetime(2022, 1, 2)),
+    ],
+)
+def test_parse_as_strptime(encoded_format, date):
+    text = date.strftime(encoded_format)
+    assert DatetimeParser(encoded_format)(text) == datetime.datetime.strptime(
+        text, encoded_format
+    )
+
+
+def test_encode_then_parse():
+    text = "Sunday, March 5 2023 7:05 PM"
+    encoded_format = Recognizer().encode_format(text)
+    assert DatetimeParser(encoded_format).parse(text) == datetime.datetime(
+        2023, 3, 5, 19, 5
+    )
@@ -3,11 +3,13 @@ Module containing unit tests for recognizer.py module.
 
 """
 import string
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import pytest
 
-from strf_hint.recognizer import Recognizer
-from strf_hint.strf_codes import FieldTypes
+from strf_hint.recognizer import EncodingContext, Recognizer
+from strf_hint.strf_codes import FieldTypes, StrfCodes
 
 
 @pytest.fixture
@@ -21,13 +23,13 @@ def recognizer():
         (
             "7:20 PM",
             "%-I:%M %p",
-            "111111111",
+            b"111111111",
             [FieldTypes.HOURS, FieldTypes.MINUTES, FieldTypes.AM_PM],
         ),
         (
             "2023-11-21, 7:20 PM",
             "%Y-%m-%d, %-I:%M %p",
-            "1111111100111111111",
+            b"1111111100111111111",
             [
                 FieldTypes.HOURS,
                 FieldTypes.MINUTES,
@@ -40,7 +42,7 @@ def recognizer():
         (
             "day: Tue 2023-NOV-06 time: 17:20:50",
             "day: Tue %Y-%b-%d time: %H:%M:%S",
-            "00000000011111111000000011111111",
+            b"00000000011111111000000011111111",
             [
                 FieldTypes.HOURS,
                 FieldTypes.MINUTES,
@@ -53,15 +55,15 @@ def recognizer():
     ],
 )
 def test_match_patterns(input_str, exp_output, exp_mask, exp_types, recognizer):
-    recognizer._matched_mask = "0" * len(input_str)
-    assert recognizer._match_patterns(input_str) == exp_output
-    assert set(recognizer._matched_types) == set(exp_types)
-    assert recognizer._matched_mask == exp_mask
+    context = EncodingContext(matched_mask=bytearray(b"0" * len(input_str)))
+    assert recognizer._match_patterns(input_str, context) == exp_output
+    assert set(context.matched_types) == set(exp_types)
+    assert context.matched_mask == exp_mask
 
 
 def test_retrieve_unmatched(recognizer):
-    recognizer._matched_mask = "0011100000001111"
-    assert recognizer._retrieve_unmatched("unhhhmatchedhhhh") == [
+    context = EncodingContext(matched_mask=bytearray(b"0011100000001111"))
+    assert recognizer._retrieve_unmatched("unhhhmatchedhhhh", context) == [
         ("un", (0, 2)),
         ("matched", (5, 12)),
     ]
@@ -79,10 +81,19 @@ def test_retrieve_unmatched(recognizer):
         ("\n", "whitespace"),
         (":", "punctuation"),
         ("/", "punctuation"),
+        ("_", "punctuation"),
+        ("ż", "letters"),
+        ("\u0663", "digits"),
+        ("\u00a0", "whitespace"),
+        ("€", "punctuation"),
     ],
 )
-def test_check_string_group(char, group, recognizer):
-    assert recognizer._check_string_group(char) == group
+def test_sign_groups(char, group):
+    assert [
+        name
+        for name, pattern in Recognizer.SIGN_GROUPS.items()
+        if pattern.fullmatch(char)
+    ] == [group]
 
 
 @pytest.mark.parametrize(
@@ -110,6 +121,10 @@ def test_check_string_group(char, group, recognizer):
                 "test",
             ],
         ),
+        (
+            "zażółć 12:30\u00a0–\u00a0Montréal",
+            ["zażółć", " ", "12", ":", "30", "\u00a0", "–", "\u00a0", "Montréal"],
+        ),
         (
             "2023-11-28, 11:38",
             ["2023", "-", "11", "-", "28", ",", " ", "11", ":", "38"],
@@ -145,30 +160,41 @@ def test_split_format_components(text, exp_result, recognizer):
     [
         (
             "%Y-%m 07:20pm CW20",
-            "111110000000000000",
+            b"111110000000000000",
             [FieldTypes.YEAR, FieldTypes.MONTH_NUM],
             "%Y-%m %I:%M%p CW%U",
         ),
         (
             "Jan, Sun, %Y-%m-%d",
-            "000000000011111111",
+            b"000000000011111111",
             [FieldTypes.YEAR, FieldTypes.MONTH_NUM, FieldTypes.MONTHDAY_NUM],
             "%b, %a, %Y-%m-%d",
         ),
         (
             "251 day of the year: Jan, Sun, %Y-%m-%d",
-            "0000000000000000000000000000000011111111",
+            b"0000000000000000000000000000000011111111",
             [FieldTypes.YEAR, FieldTypes.MONTH_NUM, FieldTypes.MONTHDAY_NUM],
             "%j day of the year: %b, %a, %Y-%m-%d",
         ),
+        (
+            "job 12 took 7 ms on day 3 in week 40, monday 7 pm",
+            b"0" * 50,
+            [],
+            "job %m took %-d ms on day %-I in week %M, %A %-S %p",
+        ),
+        (
+            "%H:%M x 5 march, 2023 utc y 14 z",
+            b"11111" + b"0" * 27,
+            [FieldTypes.HOURS, FieldTypes.MINUTES],
+            "%H:%M x %-d %B, %Y %Z y %S z",
+        ),
     ],
 )
 def test_recognize_single_codes(
     input_str, matched_mask, matched_types, exp_result, recognizer
 ):
-    recognizer._matched_mask = matched_mask
-    recognizer._matched_types = matched_types
-    assert recognizer._recognize_single_codes(input_str) == exp_result
+    context = EncodingContext(bytearray(matched_mask), list(matched_types))
+    assert recognizer._recognize_single_codes(input_str, context) == exp_result
 
 
 @pytest.mark.parametrize(
@@ -179,8 +205,154 @@ def test_recognize_single_codes(
         ("19:19:19.100000", "%H:%M:%S.%f"),
         ("WK30, 2023", "WK%U, %Y"),
         ("(22:13), today is tuesday, 18 Mar 2021", "(%H:%M), today is %A, %d %b %Y"),
-        ("Day: Sunday, 2022-Nov-30, 9:30 PM", "Day: %A, %Y-%b-%d, %-I:%M %p")
+        ("Day: Sunday, 2022-Nov-30, 9:30 PM", "Day: %A, %Y-%b-%d, %-I:%M %p"),
+        ("Jan  5 07:20:11", "%b  %-d %H:%M:%S"),
+        ("5 Jan 2023 07:20", "%-d %b %Y %H:%M"),
     ],
 )
 def test_encode_format(input_str, exp_result, recognizer):
     assert recognizer.encode_format(input_str) == exp_result
+
+
+def test_encode_formats(recognizer):
+    samples = ["7:20 PM", "2022-04-12, sunday, 14:30", "7:20 PM", "WK30, 2023"]
+    assert recognizer.encode_formats(samples) == [
+        "%-I:%M %p",
+        "%Y-%m-%d, %A, %H:%M",
+        "%-I:%M %p",
+        "WK%U, %Y",
+    ]
+    assert recognizer.encode_formats(iter(samples)) == [
+        recognizer.encode_format(sample) for sample in samples
+    ]
+    assert recognizer.encode_formats([]) == []
+
+
+def test_encode_formats_batch_cache():
+    recognizer = Recognizer()
+    recognizer.BATCH_CACHE_SIZE = 2
+    samples = ["2023-11-21 07:20", "7:20 PM", "2023-11-22 07:21", "7:20 PM"] * 3
+    samples += ["2023-11-21 07:20 %d" % idx for idx in range(5)]
+    assert recognizer.encode_formats(samples) == [
+        recognizer.encode_format(sample) for sample in samples
+    ]
+    assert recognizer.shape_cache_info() is None
+
+
+def test_encode_format_shape_cache():
+    recognizer = Recognizer(shape_cache_size=16)
+    assert recognizer.encode_format("2023-11-21 07:20") == "%Y-%m-%d %H:%M"
+    assert recognizer.encode_format("2023-11-22 07:21") == "%Y-%m-%d %H:%M"
+    assert recognizer.encode_format("05/13/2023") == "%m/%d/%Y"
+    assert recognizer.encode_format("05/12/2023") == "%d/%m/%Y"
+    info = recognizer.shape_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 3)
+
+
+@pytest.mark.parametrize(
+    "input_str",
+    ["21.11.2023 17 55", "2023:15 x", "room 1 2 3 4 5 6 7 8 9 10 11 12 13"],
+)
+def test_encode_format_shape_cache_fallback(input_str):
+    recognizer = Recognizer(shape_cache_size=16)
+    expected = Recognizer().encode_format(input_str)
+    assert recognizer.encode_format(input_str) == expected
+    assert recognizer.encode_format(input_str) == expected
+    assert recognizer.shape_cache_info().currsize == 0
+
+
+def test_shape_cache_disabled(recognizer):
+    assert recognizer.shape_cache_info() is None
+
+
+def test_encode_format_threads(recognizer):
+    samples = [
+        "2022-04-12, sunday, 14:30",
+        "March 11th 2023 9:30 PM",
+        "WK30, 2023",
+    ] * 200
+    expected = [recognizer.encode_format(sample) for sample in samples]
+    recognizer = Recognizer(shape_cache_size=4)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(recognizer.encode_format, samples)) == expected
+
+
+def test_default_codes():
+    assert Recognizer()._codes is not Recognizer()._codes
+
+
+def test_encode_formats_workers(recognizer):
+    samples = [
+        "7:20 PM",
+        "2022-04-12, sunday, 14:30",
+        "WK30, 2023",
+        "19:19:19.100000",
+    ] * 25
+    assert recognizer.encode_formats(samples, workers=2, chunk_size=7) == (
+        recognizer.encode_formats(samples)
+    )
+    assert recognizer.encode_formats(iter([]), workers=2) == []
+
+
+def test_cache_info():
+    recognizer = Recognizer(shape_cache_size=16)
+    recognizer.encode_format("2023-11-21 07:20")
+    info = recognizer.cache_info()
+    assert info["shape"].misses == 1
+    assert "scan_token" in info
+    recognizer.cache_clear()
+    assert recognizer.cache_info()["shape"].currsize == 0
+
+
+def test_encode_format_candidates(recognizer):
+    assert list(recognizer.encode_format_candidates("05/06/07")) == [
+        ("%y/%m/%d", 1.0),
+        ("%d/%m/%y", 0.5),
+        ("%m/%d/%y", 1 / 3),
+    ]
+
+
+@pytest.mark.parametrize(
+    "input_str",
+    [
+        "5 6 7",
+        "2021-03-04 12:30:00",
+        "Monday, 5 March 2020",
+        "7:20 PM",
+        "WK30, 2023",
+        "12\\34",
+        "",
+    ],
+)
+def test_encode_format_candidates_first(input_str, recognizer):
+    candidates = list(islice(recognizer.encode_format_candidates(input_str), 20))
+    assert candidates[0] == (recognizer.encode_format(input_str), 1.0)
+    assert len({candidate.format for candidate in candidates}) == len(candidates)
+    scores = [candidate.score for candidate in candidates]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_encode_format_candidates_month_name(recognizer):
+    formats = [c.format for c in recognizer.encode_format_candidates("5 Jan 07:20")]
+    assert formats[0] == "%-d %b %H:%M"
+    assert not any("%-m" in encoded_format for encoded_format in formats)
+
+
+def test_encode_format_candidates_types(recognizer):
+    formats = [c.format for c in recognizer.encode_format_candidates("5 6 7")]
+    assert "%-d %-m %-I" in formats
+    assert "%-d %-d %-I" not in formats
+
+
+@pytest.mark.parametrize(
+    "input_str, exp_result",
+    [
+        ("Montag, 21. März 2023 14:30", "%A, %d. %B %Y %H:%M"),
+        ("lundi 21 février 2023", "%A %d %B %Y"),
+        ("poniedziałek, 21 listopada 2023", "%A, %d %B %Y"),
+        ("Day: Sunday, 2022-Nov-30, 9:30 PM", "Day: %A, %Y-%b-%d, %-I:%M %p"),
+    ],
+)
+def test_encode_format_locales(input_str, exp_result):
+    recognizer = Recognizer(codes=StrfCodes(locales=("de", "fr", "pl")))
+    assert recognizer.encode_format(input_str) == exp_result
@@ -0,0 +1,129 @@
+"""
+Module containing unit tests for scanner.py module.
+
+"""
+import pytest
+
+from strf_hint.scanner import TimestampMatch, TimestampScanner
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    yield TimestampScanner()
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (
+            "Nov 21 07:20:11 host sshd[1234]: Accepted password from 10.0.0.1 port 22",
+            [(0, 15, "Nov 21 07:20:11", "%b %d %H:%M:%S")],
+        ),
+        (
+            '127.0.0.1 - - [21/Nov/2023:07:20:11 +0000] "GET / HTTP/1.1" 200 612',
+            [(15, 35, "21/Nov/2023:07:20:11", "%d/%b/%Y:%H:%M:%S")],
+        ),
+        (
+            '{"ts":"2023-11-21T07:20:11.123456Z","level":"info"}',
+            [(7, 33, "2023-11-21T07:20:11.123456", "%Y-%m-%dT%H:%M:%S.%f")],
+        ),
+        (
+            "[Tue Nov 21 07:20:11.123456 2023] [core:error] [pid 1234]",
+            [(1, 32, "Tue Nov 21 07:20:11.123456 2023", "%a %b %d %H:%M:%S.%f %Y")],
+        ),
+        (
+            "Tue, 21 Nov 2023 07:20:11 GMT",
+            [(0, 29, "Tue, 21 Nov 2023 07:20:11 GMT", "%a, %d %b %Y %H:%M:%S %Z")],
+        ),
+        (
+            "started at 7:20 PM CET, done at 2023/11/22",
+            [
+                (11, 22, "7:20 PM CET", "%-I:%M %p %Z"),
+                (32, 42, "2023/11/22", "%Y/%m/%d"),
+            ],
+        ),
+        ("due nov-21-2023", [(4, 15, "nov-21-2023", "%b-%d-%Y")]),
+        (
+            "Jan  5 07:20:11 host sshd[1234]: Connection closed",
+            [(0, 15, "Jan  5 07:20:11", "%b  %-d %H:%M:%S")],
+        ),
+        (
+            "2023-11-21 07:20:11,123 INFO root: started",
+            [(0, 23, "2023-11-21 07:20:11,123", "%Y-%m-%d %H:%M:%S,%f")],
+        ),
+        (
+            "error at 12:30 on 2023-01-05T10:00:00",
+            [
+                (9, 14, "12:30", "%H:%M"),
+                (18, 37, "2023-01-05T10:00:00", "%Y-%m-%dT%H:%M:%S"),
+            ],
+        ),
+        (
+            "on 21 Nov 2023 07:20 and March 11th 2023",
+            [
+                (3, 20, "21 Nov 2023 07:20", "%d %b %Y %H:%M"),
+                (25, 40, "March 11th 2023", "%B %dth %Y"),
+            ],
+        ),
+        (
+            "between 12:30, 2023-01-05 10:00",
+            [
+                (8, 13, "12:30", "%H:%M"),
+                (15, 31, "2023-01-05 10:00", "%Y-%m-%d %H:%M"),
+            ],
+        ),
+        (
+            "from 2023-01-05 10:00 - 2023-01-06 11:00",
+            [
+                (5, 21, "2023-01-05 10:00", "%Y-%m-%d %H:%M"),
+                (24, 40, "2023-01-06 11:00", "%Y-%m-%d %H:%M"),
+            ],
+        ),
+        (
+            "ts=2023-01-05 10:00 2023-01-06 11:00",
+            [
+                (3, 19, "2023-01-05 10:00", "%Y-%m-%d %H:%M"),
+                (20, 36, "2023-01-06 11:00", "%Y-%m-%d %H:%M"),
+            ],
+        ),
+        (
+            "2023-01-05, 2023-01-06",
+            [(0, 10, "2023-01-05", "%Y-%m-%d"), (12, 22, "2023-01-06", "%Y-%m-%d")],
+        ),
+        (
+            "Mon, 5 Jan 2023 10:00 - Tue, 6 Jan 2023 11:00",
+            [
+                (0, 21, "Mon, 5 Jan 2023 10:00", "%a, %-d %b %Y %H:%M"),
+                (24, 45, "Tue, 6 Jan 2023 11:00", "%a, %-d %b %Y %H:%M"),
+            ],
+        ),
+        ("no digits here at all", []),
+        ('GET /index.html HTTP/1.1 200 612 "Mozilla/5.0" 0.005', []),
+        ("version 2.10.1 released, worker 12 finished job 3456 in 0.25s", []),
+    ],
+)
+def test_scan(scanner, line, expected):
+    found = scanner.scan(line)
+    assert found == [TimestampMatch(*match) for match in expected]
+    assert all(line[match.start : match.end] == match.text for match in found)
+
+
+def test_scan_lines(scanner):
+    lines = ["no timestamp\n", "at 2023-11-21 07:20\r\n", "Nov 21 07:20:11 host\n"]
+    assert [
+        (line_no, match.format) for line_no, match in scanner.scan_lines(lines)
+    ] == [(2, "%Y-%m-%d %H:%M"), (3, "%b %d %H:%M:%S")]
+
+
+@pytest.mark.parametrize(
+    "text, encoded, expected",
+    [
+        ("07:20:11 host", "%H:%M:%S host", (0, 5)),
+        ("HTTP/1.1", "HTTP/%-H.%-M", (5, 0)),
+        ("Nov 21", "%b %d", (0, 0)),
+        ("7:20 PM", "%-I:%M %p", (0, 0)),
+        ("20:11.123456Z", "%H:%M.%fZ", (0, 1)),
+    ],
+)
+def test_literal_edges(text, encoded, expected):
+    assert TimestampScanner._literal_edges(text, encoded) == expected
@@ -0,0 +1,65 @@
+"""
+Module containing unit tests for session.py module.
+
+"""
+import pytest
+
+from benchmarks.corpus import SAMPLES, keystrokes
+from strf_hint.recognizer import Recognizer
+from strf_hint.session import EncodingSession
+from strf_hint.stats import RecognizerStats
+from strf_hint.strf_codes import FieldTypes
+
+
+@pytest.fixture(scope="module")
+def recognizer():
+    return Recognizer()
+
+
+@pytest.mark.parametrize(
+    "sample", SAMPLES["full_date"] + SAMPLES["timezone"] + SAMPLES["short_time"]
+)
+@pytest.mark.parametrize("history_size", [64, 0])
+def test_update(sample, history_size, recognizer):
+    session = EncodingSession(recognizer, history_size=history_size)
+    for text in keystrokes(sample):
+        assert session.update(text) == recognizer.encode_format(text)
+
+
+def test_state(recognizer):
+    session = EncodingSession(recognizer)
+    assert session.state is None
+    session.update("7:20 PM")
+    assert session.state.text == "7:20 PM"
+    assert session.state.result == "%-I:%M %p"
+    assert session.state.matched_mask == b"1" * 9
+    assert FieldTypes.HOURS in session.state.matched_types
+
+
+def test_history(recognizer):
+    session = EncodingSession(recognizer, history_size=4)
+    for text in ["2023-1", "2023-11", "2023-1", "2023-1"]:
+        session.update(text)
+    assert session.history_info().hits == 1
+    assert session.history_info().currsize == 2
+    assert EncodingSession(recognizer, history_size=0).history_info() is None
+
+
+def test_warm_up():
+    recognizer = Recognizer()
+    EncodingSession(recognizer, warm_up=False)
+    assert None in recognizer._codes._common_patterns
+    EncodingSession(recognizer)
+    assert None not in recognizer._codes._common_patterns
+
+
+def test_recognizer_caches():
+    stats = RecognizerStats()
+    recognizer = Recognizer(shape_cache_size=64, stats=stats)
+    session = EncodingSession(recognizer)
+    plain = EncodingSession(Recognizer(), history_size=0)
+    for text in ["2023-11-2", "2023-11-21", "2023-11-22", "2023-11-23", "7:20 PM"]:
+        assert session.update(text) == plain.update(text)
+        assert session.state == plain.state
+    assert stats.summary()["encodings"] == 5
+    assert recognizer.shape_cache_info().hits == 2
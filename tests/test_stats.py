@@ -0,0 +1,77 @@
+"""
+Module containing unit tests for stats.py module.
+
+"""
+import pytest
+
+from strf_hint.recognizer import Recognizer
+from strf_hint.stats import EncodingTrace, RecognizerStats
+
+
+def test_timed():
+    trace = EncodingTrace("2023")
+    assert trace.timed("match_patterns", str.upper, "abc") == "ABC"
+    assert trace.match_patterns > 0
+    with pytest.raises(ValueError):
+        trace.timed("single_codes", int, "abc")
+    assert trace.single_codes > 0
+
+
+def test_record():
+    stats = RecognizerStats(slowest=2)
+    for idx, total in enumerate([0.3, 0.1, 0.5]):
+        stats.record(EncodingTrace(str(idx), total=total, token_scans=2))
+    summary = stats.summary()
+    assert summary["encodings"] == 3
+    assert summary["total"] == pytest.approx(0.9)
+    assert summary["token_scans"] == 6
+    assert [trace.input for trace in stats.slowest()] == ["2", "0"]
+    stats.reset()
+    assert stats.summary()["encodings"] == 0
+    assert stats.slowest() == []
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("2023-11-21 07:20", "%Y-%m-%d %H:%M"),
+        ("Tue, 21 Nov 2023 7:20 PM CET", "%a, %d %b %Y %-I:%M %p %Z"),
+        ("cw47 tuesday 2023", "cw%U %A %Y"),
+    ],
+)
+def test_instrumented_recognizer(s, expected):
+    stats = RecognizerStats()
+    assert Recognizer(stats=stats).encode_format(s) == expected
+    (trace,) = stats.slowest()
+    assert trace.input == s
+    assert trace.total >= trace.match_patterns + trace.single_codes
+    assert trace.single_codes >= trace.code_scan
+    assert trace.pattern_searches >= 1
+    assert trace.token_scan_hits <= trace.token_scans
+
+
+def test_instrumented_scans():
+    class Traces(RecognizerStats):
+        def __init__(self):
+            super().__init__()
+            self.traces = []
+
+        def record(self, trace):
+            super().record(trace)
+            self.traces.append(trace)
+
+    stats = Traces()
+    recognizer = Recognizer(stats=stats)
+    recognizer.encode_format("cw47 tuesday 2023")
+    recognizer.encode_format("cw47 tuesday 2023")
+    first, second = stats.traces
+    assert first.token_scans == second.token_scans == 3
+    assert first.regex_evaluations > 0
+    assert (second.token_scan_hits, second.regex_evaluations) == (3, 0)
+
+
+def test_instrumented_shape_cache():
+    stats = RecognizerStats()
+    recognizer = Recognizer(shape_cache_size=16, stats=stats)
+    recognizer.encode_formats(["2023-11-21 07:20", "2024-12-22 08:21"])
+    assert stats.summary()["shape_cache_hit"] == 1
@@ -0,0 +1,62 @@
+"""
+Module containing unit tests for stream.py module.
+
+"""
+import io
+
+import pytest
+
+from strf_hint.stream import StreamEncoder
+
+
+@pytest.fixture
+def encoder():
+    yield StreamEncoder()
+
+
+def test_encode_text(encoder):
+    source = io.StringIO("7:20 PM\n2022-04-12, sunday, 14:30\r\n\nWK30, 2023")
+    assert list(encoder.encode(source)) == [
+        (1, "7:20 PM", "%-I:%M %p"),
+        (2, "2022-04-12, sunday, 14:30", "%Y-%m-%d, %A, %H:%M"),
+        (3, "", ""),
+        (4, "WK30, 2023", "WK%U, %Y"),
+    ]
+
+
+def test_encode_csv():
+    source = io.StringIO('id;created\n1;7:20 PM\n2;"2022-04-12; 14:30"\n')
+    encoder = StreamEncoder(column="created", delimiter=";")
+    assert list(encoder.encode(source)) == [
+        (2, "7:20 PM", "%-I:%M %p"),
+        (3, "2022-04-12; 14:30", "%Y-%m-%d; %H:%M"),
+    ]
+
+
+def test_encode_csv_missing_column():
+    with pytest.raises(ValueError):
+        list(
+            StreamEncoder(column="created").encode(io.StringIO("id,date\n1,7:20 PM\n"))
+        )
+
+
+def test_encode_path(tmp_path, encoder):
+    path = tmp_path / "samples.txt"
+    path.write_text("7:20 PM\nWK30, 2023\n")
+    assert [result[2] for result in encoder.encode(str(path))] == [
+        "%-I:%M %p",
+        "WK%U, %Y",
+    ]
+
+
+def test_encode_workers():
+    source = io.StringIO("7:20 PM\nWK30, 2023\n" * 10)
+    results = list(StreamEncoder(workers=2, chunk_size=3).encode(source))
+    assert [result[0] for result in results] == list(range(1, 21))
+    assert [result[2] for result in results] == ["%-I:%M %p", "WK%U, %Y"] * 10
+
+
+def test_write(encoder):
+    output = io.StringIO()
+    assert encoder.write(io.StringIO("7:20 PM\nWK30, 2023\n"), output) == 2
+    assert output.getvalue() == "1\t7:20 PM\t%-I:%M %p\n2\tWK30, 2023\tWK%U, %Y\n"
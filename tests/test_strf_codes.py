@@ -3,9 +3,15 @@ Module containing unit tests for strf_codes.py module.
 
 """
 
+import inspect
+import pickle
+
 import pytest
 
-from strf_hint.strf_codes import FieldTypes, StrfCodes
+from strf_hint import _tables
+from strf_hint.build_tables import main, render_tables
+from strf_hint.cache import CacheInfo
+from strf_hint.strf_codes import FieldTypes, ScanCounters, StrfCodes
 
 
 @pytest.fixture()
@@ -120,3 +126,222 @@ def test_get_format_types(code, exp_result, codes):
 )
 def test_generate_format_regex(code, exp_result, mocked_codes):
     assert mocked_codes.generate_format_regex(code) == exp_result
+
+
+@pytest.mark.parametrize(
+    "code, exp_result",
+    [
+        ("%Y-%m-%d", r"\d(?<!\d\d)\d*[-./,]\d+[-./,]\d+"),
+        (r"%-d\.%b\.%y", r"\d(?<!\d\d)\d*[-./,][a-z]+[-./,]\d+"),
+        ("%b %d, %Y", r"[a-z](?<![a-z][a-z])[a-z]*\ \d+[-./,]\ \d+"),
+        ("%-I:%M %p", r"\d(?<!\d\d)\d*:\d+\ [a-z]+"),
+        ("[%d/%b/%Y", r"\[\d+[-./,][a-z]+[-./,]\d+"),
+    ],
+)
+def test_relax_format_regex(code, exp_result, codes):
+    assert codes._relax_format_regex(code) == exp_result
+
+
+def test_relax_format_parts(codes):
+    assert codes.relax_format_parts("%b %d, %-I:%M %p") == [
+        ("%b", "[a-z]+"),
+        (" ", r"\ "),
+        ("%d", r"\d+"),
+        (",", "[-./,]"),
+        (" ", r"\ "),
+        ("%-I", r"\d+"),
+        (":", ":"),
+        ("%M", r"\d+"),
+        (" ", r"\ "),
+        ("%p", "[a-z]+"),
+    ]
+
+
+def test_common_formats(codes):
+    table = codes.common_formats
+    assert [entry.format for entry in table] == (
+        codes.DATE_COMMON_FORMATS + codes.TIME_COMMON_FORMATS
+    )
+    for entry in table:
+        assert entry.regex == codes.generate_format_regex(entry.format)
+        assert entry.types == codes.get_format_types(entry.format)
+    assert table[0].literals == frozenset("-")
+    assert table[0].family is table[1].family
+
+
+def test_common_format_pattern(codes):
+    assert codes._common_patterns[0] is None
+    pattern = codes.common_format_pattern(0)
+    assert pattern.pattern == codes.common_formats[0].regex
+    assert codes.common_format_pattern(0) is pattern
+
+
+def test_shipped_tables(codes):
+    assert _tables.DIGEST == codes.tables_digest()
+    assert _tables.COMMON_FORMATS == codes.build_tables()
+    assert render_tables(codes) == inspect.getsource(_tables)
+
+
+def test_build_tables(tmp_path, codes):
+    path = tmp_path / "tables.py"
+    assert main(["--output", str(path)]) == 0
+    assert path.read_text(encoding="utf-8") == render_tables(codes)
+    with pytest.raises(SystemExit):
+        main(["--help"])
+
+
+def test_customized_tables(codes):
+    codes.TIME_COMMON_FORMATS = ["%H:%M"]
+    assert codes.tables_digest() != _tables.DIGEST
+    assert [entry.format for entry in codes.common_formats][-1] == "%H:%M"
+
+
+def test_basic_patterns(codes):
+    assert codes.basic_patterns.keys() == codes.BASIC_CODES.keys()
+    assert codes.basic_patterns["%d"].pattern == codes.get_regex("%d", "True")
+
+
+@pytest.mark.parametrize(
+    "elem, prev, nxt, exp_codes",
+    [
+        ("May", "", "", ["%b", "%B"]),
+        ("2023", "", "-", ["%Y"]),
+        ("PM", " ", "", ["%p"]),
+        (
+            "20",
+            ":",
+            "",
+            ["%d", "%-d", "%H", "%-H", "%M", "%-M", "%S", "%-S", "%-j", "%U", "%-U", "%-W", "%y"],
+        ),
+        ("xyz", "", "", []),
+    ],
+)
+def test_scan_token(elem, prev, nxt, exp_codes, codes):
+    candidates = codes.scan_token(elem, prev, nxt)
+    assert [candidate.code for candidate in candidates] == exp_codes
+    for candidate in candidates:
+        assert candidate.type == codes.get_type(candidate.code)
+
+
+@pytest.mark.parametrize(
+    "first, second, exp_result",
+    [
+        ("2023-11-21 07:20", "2023-11-22 07:21", True),
+        ("2023-11-21 07:20", "2023-13-21 07:20", False),
+        ("2023-11-21 07:20", "2023-11-21 7:20", False),
+        ("Nov 21, 2023", "nov 21, 2023", False),
+        ("7:20 PM", "8:21 PM", True),
+        ("7:20 PM", "7:25 PM", False),
+    ],
+)
+def test_get_shape(first, second, exp_result, codes):
+    assert (codes.get_shape(first) == codes.get_shape(second)) == exp_result
+
+
+def test_get_shape_non_ascii(codes):
+    assert codes.get_shape("zażółć 2023-01-02") is None
+
+
+@pytest.mark.parametrize(
+    "s, exp_result",
+    [
+        ("mon, 10 dec 2018 gmt", {"%a": 3, "%b": 3, "%Z": 3}),
+        ("monday", {"%A": 6}),
+        ("mondays month", {}),
+        ("5mar", {}),
+        ("x aet aest/aedt", {"%Z": 13}),
+        ("may", {"%b": 3, "%B": 3}),
+    ],
+)
+def test_name_index_find(s, exp_result, codes):
+    found = codes.name_index.find(s)
+    assert {code: candidate.length for code, candidate in found.items()} == exp_result
+
+
+def test_vocabulary(codes):
+    vocabulary = codes._vocabulary("%Z")
+    assert len(vocabulary) == len(set(vocabulary))
+    assert "aet aest/aedt" in vocabulary
+
+
+def test_month_names(codes):
+    assert {"jan", "may", "september"} <= codes.month_names
+    assert not {"mon", "sunday", "pm", "utc"} & codes.month_names
+    assert "märz" in StrfCodes(locales=("de",)).month_names
+
+
+@pytest.mark.parametrize(
+    "encoded_format, text, exp_result",
+    [
+        ("%Y-%m-%d", "2023-11-21", True),
+        ("%Y-%m-%d", "2023-13-21", False),
+        ("Day: %A (%H.%M)", "day: Sunday (10.20)", True),
+        ("Day: %A (%H.%M)", "Day: Sunday 10.20", False),
+        ("%-d.%B", "31.June", True),
+        ("%-d", "05", False),
+        ("%d", "5", False),
+        ("%W/%j", "23/350", True),
+    ],
+)
+def test_compile_format(encoded_format, text, exp_result, codes):
+    assert bool(codes.compile_format(encoded_format).fullmatch(text)) == exp_result
+
+
+def test_pickle(codes):
+    codes.common_formats
+    codes.scan_token("20")
+    codes.BASIC_CODES = {"%d": codes.BASIC_CODES["%d"]}
+    restored = pickle.loads(pickle.dumps(codes))
+    assert restored.BASIC_CODES.keys() == {"%d"}
+    assert "common_formats" not in restored.__dict__
+
+
+def test_cache_info(codes):
+    assert codes.cache_info()["get_type"] == CacheInfo(0, 0, 0, codes.CODE_CACHE_SIZE, 0)
+    codes.get_type("%d")
+    codes.get_type("%d")
+    codes.scan_token("20")
+    info = codes.cache_info()
+    assert info["get_type"].hits >= 1
+    assert info["scan_token"].currsize == 1
+    codes.cache_clear()
+    assert codes.cache_info()["scan_token"].currsize == 0
+    assert codes.cache_info()["get_type"].hits == 0
+
+
+def test_cache_bound(codes):
+    codes.FORMAT_CACHE_SIZE = 2
+    for encoded_format in ["%Y", "%m", "%d"]:
+        codes.compile_format(encoded_format)
+    assert codes.cache_info()["compile_format"] == CacheInfo(0, 3, 1, 2, 2)
+
+
+def test_scan_counters(codes):
+    assert codes.scan_counters() == ScanCounters(0, 0, 0)
+    codes.scan_token("20", "", ":")
+    scanned = codes.scan_counters()
+    assert scanned.misses == 1 and scanned.regex_evaluations > 0
+    codes.scan_token("20", "", ":")
+    assert codes.scan_counters() == scanned._replace(hits=1)
+
+
+def test_locales():
+    codes = StrfCodes(locales=("de", "pl"))
+    assert "märz" not in StrfCodes().get_regex("%B")
+    assert set(codes.name_index.find("märz")) == {"%B"}
+    assert set(codes.name_index.find("listopada")) == {"%B"}
+    assert "%B" in codes.name_index.find("march")
+    assert StrfCodes().name_index.find("märz") == {}
+    assert codes.tables_digest() != _tables.DIGEST
+    assert codes._name_run == r"[^\W\d_]+"
+    assert codes.compile_format("%d. %B %Y").fullmatch("21. März 2023")
+    assert codes.compile_format("%d. %B %Y").fullmatch("21. June 2023")
+
+
+def test_locales_shared():
+    first, second = StrfCodes(locales=["fr"]), StrfCodes(locales=["fr"])
+    assert first.name_index is second.name_index
+    assert first.common_formats[0].family is second.common_formats[0].family
+    restored = pickle.loads(pickle.dumps(first))
+    assert restored.locales == ("fr",)
+    assert restored.get_regex("%B") == first.get_regex("%B")